@@ -1,47 +1,64 @@
 import os
 import streamlit as st
 from sqlalchemy.exc import OperationalError
-from models.fallero import Base as FalleroBase
-from models.usuario import Base as UsuarioBase
+from dao.audit import set_user_provider
 from dao.database import DatabaseManager
+from dao.schema import bootstrap_schema, head_revision
 from managers.auth_manager import AuthManager
 from managers.ui_manager import UIManager
-from sqlalchemy import text
 from constants.messages import Messages
 from config.settings import settings
 from utils.logger import get_logger
+from utils.profiler import RequestProfiler, profile_phase
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Changes are audited under the email of the user logged in to the rerun
+set_user_provider(lambda: st.session_state.get("username"))
+
 def db_init(db_manager: DatabaseManager) -> None:
     """
     Initialize the database based on configuration settings.
     
+    The schema bootstrap runs once per process: with INIT_DB the schema is
+    migrated to the latest revision, and in every case the schema revision is
+    checked. The app stops if the database is unreachable or outdated.
+    
     Args:
         db_manager: Database manager instance for handling database operations.
-        
-    Raises:
-        OperationalError: When database doesn't exist and INIT_DB is False.
     """
     logger.info("Initializing database connection")
     
-    if settings.database.init_db:
-        logger.info("Creating database tables")
-        # Create all tables
-        FalleroBase.metadata.create_all(db_manager.engine)
-        UsuarioBase.metadata.create_all(db_manager.engine)
-        logger.info("Database tables created successfully")
-    else:
-        # Check if database exists
-        try:
-            with db_manager.get_db_session() as session:
-                session.execute(text('SELECT 1'))
-            logger.info("Database connection verified")
-        except OperationalError as e:
-            logger.error(f"Database connection failed: {e}")
-            st.error(Messages.DB_NOT_EXISTS)
-            st.stop()
+    try:
+        current = bootstrap_schema(db_manager.engine, settings.database.init_db)
+        logger.info("Database connection verified")
+    except OperationalError as e:
+        logger.error(f"Database connection failed: {e}")
+        st.error(Messages.DB_NOT_EXISTS)
+        st.stop()
+    
+    expected = head_revision()
+    if current != expected:
+        logger.error(f"Database schema at revision {current}, expected {expected}")
+        st.error(Messages.DB_SCHEMA_OUTDATED.format(current=current, expected=expected))
+        st.stop()
+
+
+@st.cache_resource(show_spinner=False)
+def get_database_manager() -> DatabaseManager:
+    """
+    Get the process-wide database manager, initializing the database once.
+    
+    Streamlit reruns this script on every interaction; caching the manager as a
+    resource shares one engine and connection pool between all user sessions.
+    
+    Returns:
+        Shared, initialized database manager instance.
+    """
+    db_manager = DatabaseManager()
+    db_init(db_manager)
+    return db_manager
 
 class SecretariaElCanoApp:
     """
@@ -55,16 +72,18 @@ class SecretariaElCanoApp:
         """Initialize the application with configuration and managers."""
         logger.info("Starting Secretaria El Cano application")
         
-        app_config = settings.get_app_config()
-        st.set_page_config(
-            page_title=app_config.app_name, 
-            page_icon=app_config.app_icon, 
-            layout=app_config.layout
-        )
+        with profile_phase("settings"):
+            app_config = settings.get_app_config()
+            st.set_page_config(
+                page_title=app_config.app_name, 
+                page_icon=app_config.app_icon, 
+                layout=app_config.layout
+            )
         
-        self.db_manager = DatabaseManager()
-        db_init(self.db_manager)
-        self.auth_manager = AuthManager(self.db_manager)
+        with profile_phase("database"):
+            self.db_manager = get_database_manager()
+        with profile_phase("auth_setup"):
+            self.auth_manager = AuthManager(self.db_manager)
         self.ui_manager = UIManager()
         
         logger.info("Application initialized successfully")
@@ -76,14 +95,15 @@ class SecretariaElCanoApp:
         Handles user authentication and displays appropriate content based on
         authentication status.
         """
-        usuarios = self.db_manager.get_all_users()
-        usuarios_activos = [u for u in usuarios if getattr(u, "activo", True)]
+        with profile_phase("active_users_check"):
+            has_active_users = self.db_manager.has_active_users()
         
-        if not usuarios_activos:
+        if not has_active_users:
             st.error(Messages.AUTH_NO_ACTIVE_USERS)
             return
 
-        self.auth_manager.login()
+        with profile_phase("login"):
+            self.auth_manager.login()
         if st.session_state["authentication_status"] is None:
             st.info(Messages.AUTH_LOGIN_REQUIRED)
         elif st.session_state["authentication_status"] is False:
@@ -106,15 +126,43 @@ class SecretariaElCanoApp:
         if menu_choice == Messages.MENU_VIEW_FALLEROS:
             self.ui_manager.display_falleros_view(self.db_manager)
 
+        elif menu_choice == Messages.MENU_DASHBOARD:
+            self.ui_manager.display_dashboard_view(self.db_manager)
+
+        elif menu_choice == Messages.MENU_CUOTAS:
+            self.ui_manager.display_cuotas_view(self.db_manager)
+
         elif menu_choice == Messages.MENU_VIEW_USERS:
             self.ui_manager.display_usuarios_view(self.db_manager)
         
         elif menu_choice == Messages.MENU_ADD_FALLERO:
             self.ui_manager.display_add_fallero_view(self.db_manager)
         
+        elif menu_choice == Messages.MENU_IMPORT_FALLEROS:
+            self.ui_manager.display_import_falleros_view(self.db_manager)
+        
+        elif menu_choice == Messages.MENU_REVIEW_DUPLICATES:
+            self.ui_manager.display_duplicates_view(self.db_manager)
+        
+        elif menu_choice == Messages.MENU_AUDIT:
+            self.ui_manager.display_audit_view(self.db_manager)
+        
         else:
             st.write(Messages.MENU_SELECT_OPTION)
 
+def run_app() -> None:
+    """
+    Build and run the application for the current Streamlit rerun.
+    
+    When profiling is enabled, the rerun is timed phase by phase and the
+    result is shown in a debug panel in the sidebar and written to the log.
+    """
+    with RequestProfiler.for_rerun() as profiler:
+        app = SecretariaElCanoApp()
+        app.run()
+    
+    if profiler is not None:
+        UIManager.display_profiler_panel(profiler)
+
 if __name__ == "__main__":
-    app = SecretariaElCanoApp()
-    app.run()
\ No newline at end of file
+    run_app()
\ No newline at end of file
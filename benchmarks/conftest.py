@@ -0,0 +1,73 @@
+"""
+Benchmark configuration for the Secretaria El Cano application.
+
+Benchmarks run against in-memory SQLite by default. Set BENCH_DATABASE_URL
+to run them against another database, for example the MySQL container
+started by run_mysql_container.sh:
+
+    BENCH_DATABASE_URL=mysql+mysqlconnector://root:<password>@127.0.0.1:3306/secretaria-el-cano-bench
+
+Data sizes are 1k and 10k falleros; set BENCH_LARGE=true to add 100k.
+"""
+
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import DatabaseConfig  # noqa: E402
+from dao.database import DatabaseManager, dispose_engines  # noqa: E402
+from models import Base  # noqa: E402
+from benchmarks.data import populate  # noqa: E402
+
+SIZES = [1_000, 10_000] + ([100_000] if os.getenv("BENCH_LARGE", "").lower() == "true" else [])
+USERS_PER_FALLERO = 0.05
+
+
+def _bench_db_config() -> DatabaseConfig:
+    """Build the configuration of the benchmark database."""
+    return DatabaseConfig(
+        url=os.getenv("BENCH_DATABASE_URL", "sqlite:///:memory:"),
+        init_db=True,
+        host="",
+        port=0,
+        database="",
+        username="",
+        password="",
+    )
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size // 1000}k")
+def db_manager(request):
+    """Provide a database manager over a database populated with `size` falleros."""
+    manager = DatabaseManager(_bench_db_config())
+    Base.metadata.drop_all(manager.engine)
+    Base.metadata.create_all(manager.engine)
+    populate(manager, falleros=request.param, usuarios=int(request.param * USERS_PER_FALLERO))
+    manager.size = request.param
+    yield manager
+    dispose_engines()
+
+
+@pytest.fixture
+def measure(benchmark):
+    """
+    Benchmark a function and record its peak traced memory.
+    
+    The function is first run once under tracemalloc, and the peak is
+    stored in the benchmark's extra_info as peak_memory_kb.
+    """
+    def run(func, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_kb"] = round(peak / 1024, 1)
+        return benchmark(func, *args, **kwargs)
+    return run
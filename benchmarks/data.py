@@ -0,0 +1,99 @@
+"""
+Synthetic data generators for the Secretaria El Cano benchmarks.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Dict, Iterator, List
+
+from sqlalchemy import insert
+
+from dao.database import DatabaseManager
+from dao.search import FalleroSearchIndex
+from models.fallero import Fallero
+from models.usuario import Usuario
+
+DNI_LETTERS = "TRWAGMYFPDXBNJZSQVHLCKE"
+
+NOMBRES = [
+    "José", "María", "Vicent", "Amparo", "Juan", "Carmen", "Pau", "Rosa", "Salvador",
+    "Lucía", "Francesc", "Desamparados", "Miguel", "Inmaculada", "Joan", "Pilar",
+]
+APELLIDOS = [
+    "García", "Martínez", "López", "Sánchez", "Pérez", "Gómez", "Martí", "Ferrer",
+    "Soler", "Navarro", "Llorente", "Muñoz", "Ribera", "Castelló", "Giner", "Peris",
+]
+
+
+def generate_falleros(count: int, seed: int = 1970) -> Iterator[Dict]:
+    """
+    Generate reproducible fallero rows with valid, unique DNIs.
+    
+    Args:
+        count: Number of rows to generate.
+        seed: Random seed, so every run uses the same data.
+        
+    Yields:
+        Column dictionaries for the Fallero table.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    for i in range(count):
+        number = 10000000 + i
+        yield {
+            "nombre": rng.choice(NOMBRES),
+            "apellidos": f"{rng.choice(APELLIDOS)} {rng.choice(APELLIDOS)}",
+            "dni": f"{number:08d}{DNI_LETTERS[number % 23]}",
+            "fecha_nacimiento": today - timedelta(days=rng.randint(365, 90 * 365)),
+            "fecha_alta": today - timedelta(days=rng.randint(0, 60 * 365)),
+            "activo": rng.random() < 0.8,
+        }
+
+
+def generate_usuarios(count: int, seed: int = 1970) -> Iterator[Dict]:
+    """
+    Generate reproducible user rows.
+    
+    Args:
+        count: Number of rows to generate.
+        seed: Random seed, so every run uses the same data.
+        
+    Yields:
+        Column dictionaries for the Usuario table.
+    """
+    rng = random.Random(seed)
+    # bcrypt("benchmark", rounds=4), computed once: hashing every row would dominate setup
+    hashed_password = "$2b$04$FpJ7m./FvXIHUS1Y/avdM.FyGg13XafdJH2/nSRNLDzvymZ6w.C.S"
+    for i in range(count):
+        yield {
+            "nombre": f"{rng.choice(NOMBRES)} {i}",
+            "email": f"usuario{i}@falla.com",
+            "hashed_password": hashed_password,
+            "activo": rng.random() < 0.9,
+        }
+
+
+def populate(db_manager: DatabaseManager, falleros: int, usuarios: int,
+             batch_size: int = 5000) -> None:
+    """
+    Fill the database with synthetic falleros and users.
+    
+    Args:
+        db_manager: Database manager of the benchmark database.
+        falleros: Number of falleros to insert.
+        usuarios: Number of users to insert.
+        batch_size: Rows per multi-row INSERT.
+    """
+    with db_manager.get_db_session() as session:
+        for table, rows in ((Fallero, generate_falleros(falleros)),
+                            (Usuario, generate_usuarios(usuarios))):
+            batch: List[Dict] = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    session.execute(insert(table), batch)
+                    batch = []
+            if batch:
+                session.execute(insert(table), batch)
+        FalleroSearchIndex.rebuild(session)
+        session.commit()
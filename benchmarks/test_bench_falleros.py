@@ -0,0 +1,70 @@
+"""
+Benchmarks for the fallero data paths.
+"""
+
+import itertools
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import select
+
+from dao.read_models import FALLERO_LIST_COLUMNS, FalleroReadModel
+
+
+def test_get_filtered_falleros_all(db_manager, measure):
+    """Load the whole census through the ORM, as the listing used to do."""
+    result = measure(db_manager.get_filtered_falleros)
+    assert len(result) == db_manager.size
+
+
+def test_get_filtered_falleros_by_surname(db_manager, measure):
+    """Filter the census by a surname prefix."""
+    measure(db_manager.get_filtered_falleros, apellidos="garc", estado="Activos")
+
+
+def test_falleros_first_page(db_manager, measure):
+    """Fetch the first page of the listing with its total count."""
+    page = measure(FalleroReadModel(db_manager).page, page_size=50, with_total=True)
+    assert len(page.items) == 50
+
+
+def test_falleros_deep_page(db_manager, measure):
+    """Fetch a page deep into the listing; keyset pagination keeps it flat."""
+    read_model = FalleroReadModel(db_manager)
+    cursor = None
+    for _ in range(10):
+        cursor = read_model.page(cursor=cursor, page_size=db_manager.size // 20).next_cursor
+    page = measure(read_model.page, cursor=cursor, page_size=50)
+    assert len(page.items) == 50
+
+
+def test_orm_vars_to_dataframe(db_manager, measure):
+    """Build the listing DataFrame from ORM entities with vars()."""
+    falleros = db_manager.get_filtered_falleros()
+
+    def build():
+        frame = pd.DataFrame([vars(f) for f in falleros])
+        return frame.drop(columns=['_sa_instance_state'], errors='ignore')
+
+    measure(build)
+
+
+def test_read_model_to_dataframe(db_manager, measure):
+    """Build the listing DataFrame from projected result tuples."""
+    with db_manager.get_db_session() as session:
+        rows = list(session.execute(select(*FALLERO_LIST_COLUMNS)))
+    measure(FalleroReadModel.to_frame, rows)
+
+
+def test_insert_fallero(db_manager, measure):
+    """Insert one fallero through the form path (commit and refresh)."""
+    numbers = itertools.count(90000000)
+    letters = "TRWAGMYFPDXBNJZSQVHLCKE"
+
+    def insert():
+        number = next(numbers)
+        db_manager.insert_fallero(
+            "Bench", "Mark", f"{number:08d}{letters[number % 23]}", date(1990, 1, 1)
+        )
+
+    measure(insert)
@@ -0,0 +1,28 @@
+"""
+Benchmarks for the user data paths.
+"""
+
+from dao.read_models import UsuarioReadModel
+from dao.usuario_dao import UsuarioDAO
+
+
+def test_get_all_users(db_manager, measure):
+    """Load every user as ORM entities."""
+    measure(db_manager.get_all_users)
+
+
+def test_has_active_users(db_manager, measure):
+    """Check for an active user with a single EXISTS query."""
+    assert measure(db_manager.has_active_users)
+
+
+def test_buscar_usuarios_in_sql(db_manager, measure):
+    """Filter, sort and page the users in SQL, as the users view does."""
+    dao = UsuarioDAO(db_manager)
+    measure(dao.buscar_usuarios, "jos", "falla", "Activos", with_total=True)
+
+
+def test_usuarios_page_frame(db_manager, measure):
+    """Load one page of the users list and build its DataFrame."""
+    dao = UsuarioDAO(db_manager)
+    measure(lambda: UsuarioReadModel.to_frame(dao.buscar_usuarios().items))
@@ -0,0 +1,37 @@
+"""
+Benchmarks for the fallero validation paths.
+"""
+
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import SIZES
+from benchmarks.data import generate_falleros
+from validators import Validators
+from validators.batch import BatchValidator
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size // 1000}k")
+def census(request):
+    """Provide a census frame of `size` generated falleros."""
+    return pd.DataFrame.from_records(list(generate_falleros(request.param)))
+
+
+def _validate_row_by_row(census):
+    for nombre, apellidos, dni, fecha_nacimiento in census[
+        ["nombre", "apellidos", "dni", "fecha_nacimiento"]
+    ].itertuples(index=False):
+        Validators.validate_name(nombre, "nombre")
+        Validators.validate_name(apellidos, "apellidos")
+        Validators.validate_dni(dni)
+        Validators.validate_birth_date(fecha_nacimiento)
+
+
+def test_validate_census_row_by_row(census, measure):
+    """Validate the census one record at a time with Validators."""
+    measure(_validate_row_by_row, census)
+
+
+def test_validate_census_batch(census, measure):
+    """Validate the census with the vectorized BatchValidator."""
+    measure(BatchValidator().validate, census)
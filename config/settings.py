@@ -4,8 +4,8 @@ This module handles all configuration from environment variables and provides de
 """
 
 import os
-from typing import Optional
-from dataclasses import dataclass
+from typing import List, Optional
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -19,6 +19,15 @@ class DatabaseConfig:
     database: str
     username: str
     password: str
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    query_cache_size: int = 256
+    query_cache_ttl: int = 60
+    replica_urls: List[str] = field(default_factory=list)
+    replica_lag_tolerance: float = 2.0
 
     @classmethod
     def from_env(cls) -> 'DatabaseConfig':
@@ -41,7 +50,20 @@ class DatabaseConfig:
             port=port,
             database=database,
             username=username,
-            password=password
+            password=password,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "True").lower() == "true",
+            query_cache_size=int(os.getenv("QUERY_CACHE_SIZE", "256")),
+            query_cache_ttl=int(os.getenv("QUERY_CACHE_TTL", "60")),
+            replica_urls=[
+                replica.strip()
+                for replica in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+                if replica.strip()
+            ],
+            replica_lag_tolerance=float(os.getenv("DB_REPLICA_LAG_TOLERANCE", "2"))
         )
 
 
@@ -52,6 +74,13 @@ class AuthConfig:
     cookie_name: str
     secret_key: str
     cookie_expiry_days: int
+    credentials_cache_ttl: int = 300
+    bcrypt_rounds: int = 12
+    hash_workers: int = 2
+    hash_max_pending: int = 32
+    hash_queue_timeout: float = 10.0
+    login_burst: int = 5
+    login_rate_per_minute: float = 5.0
 
     @classmethod
     def from_env(cls) -> 'AuthConfig':
@@ -59,7 +88,14 @@ class AuthConfig:
         return cls(
             cookie_name=os.getenv("AUTH_COOKIE_NAME", "falla_cookie"),
             secret_key=os.getenv("AUTH_SECRET_KEY", "auth_secret_key"),
-            cookie_expiry_days=int(os.getenv("AUTH_COOKIE_EXPIRY_DAYS", "1"))
+            cookie_expiry_days=int(os.getenv("AUTH_COOKIE_EXPIRY_DAYS", "1")),
+            credentials_cache_ttl=int(os.getenv("AUTH_CREDENTIALS_CACHE_TTL", "300")),
+            bcrypt_rounds=int(os.getenv("AUTH_BCRYPT_ROUNDS", "12")),
+            hash_workers=int(os.getenv("AUTH_HASH_WORKERS", "2")),
+            hash_max_pending=int(os.getenv("AUTH_HASH_MAX_PENDING", "32")),
+            hash_queue_timeout=float(os.getenv("AUTH_HASH_QUEUE_TIMEOUT", "10")),
+            login_burst=int(os.getenv("AUTH_LOGIN_BURST", "5")),
+            login_rate_per_minute=float(os.getenv("AUTH_LOGIN_RATE_PER_MINUTE", "5"))
         )
 
 
@@ -72,6 +108,11 @@ class AppConfig:
     layout: str
     logo_path: str
     debug: bool
+    profile: bool = False
+    profile_dump_dir: Optional[str] = None
+    census_refresh_seconds: int = 3600
+    client_filter_max_rows: int = 20000
+    scope_debounce_seconds: float = 2.0
 
     @classmethod
     def from_env(cls) -> 'AppConfig':
@@ -81,7 +122,63 @@ class AppConfig:
             app_icon=os.getenv("APP_ICON", "🔥"),
             layout=os.getenv("APP_LAYOUT", "wide"),
             logo_path=os.getenv("LOGO_PATH", "assets/logo.png"),
-            debug=os.getenv("DEBUG", "False").lower() == "true"
+            debug=os.getenv("DEBUG", "False").lower() == "true",
+            profile=os.getenv("PROFILE", "False").lower() == "true",
+            profile_dump_dir=os.getenv("PROFILE_DUMP_DIR") or None,
+            census_refresh_seconds=int(os.getenv("CENSUS_REFRESH_SECONDS", "3600")),
+            client_filter_max_rows=int(os.getenv("CLIENT_FILTER_MAX_ROWS", "20000")),
+            scope_debounce_seconds=float(os.getenv("SCOPE_DEBOUNCE_SECONDS", "2"))
+        )
+
+    @property
+    def profiling_enabled(self) -> bool:
+        """Return whether per-rerun profiling is switched on."""
+        return self.debug or self.profile
+
+
+@dataclass
+class LogConfig:
+    """Logging configuration settings."""
+    
+    log_dir: str
+    rotation: str
+    max_bytes: int
+    backup_count: int
+    when: str
+    json_format: bool
+
+    @classmethod
+    def from_env(cls) -> 'LogConfig':
+        """Create logging configuration from environment variables."""
+        return cls(
+            log_dir=os.getenv("LOG_DIR", "logs"),
+            rotation=os.getenv("LOG_ROTATION", "size").lower(),
+            max_bytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+            backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+            when=os.getenv("LOG_ROTATION_WHEN", "midnight"),
+            json_format=os.getenv("LOG_JSON", "False").lower() == "true"
+        )
+
+
+@dataclass
+class AuditConfig:
+    """Audit trail configuration settings."""
+    
+    enabled: bool = True
+    queue_size: int = 10000
+    batch_size: int = 200
+    flush_interval: float = 1.0
+    put_timeout: float = 0.5
+
+    @classmethod
+    def from_env(cls) -> 'AuditConfig':
+        """Create audit configuration from environment variables."""
+        return cls(
+            enabled=os.getenv("AUDIT_ENABLED", "True").lower() == "true",
+            queue_size=int(os.getenv("AUDIT_QUEUE_SIZE", "10000")),
+            batch_size=int(os.getenv("AUDIT_BATCH_SIZE", "200")),
+            flush_interval=float(os.getenv("AUDIT_FLUSH_INTERVAL", "1")),
+            put_timeout=float(os.getenv("AUDIT_PUT_TIMEOUT", "0.5"))
         )
 
 
@@ -92,6 +189,8 @@ class Settings:
         self.database = DatabaseConfig.from_env()
         self.auth = AuthConfig.from_env()
         self.app = AppConfig.from_env()
+        self.log = LogConfig.from_env()
+        self.audit = AuditConfig.from_env()
 
     def get_database_config(self) -> DatabaseConfig:
         """Get database configuration."""
@@ -105,6 +204,14 @@ class Settings:
         """Get application configuration."""
         return self.app
 
+    def get_log_config(self) -> LogConfig:
+        """Get logging configuration."""
+        return self.log
+
+    def get_audit_config(self) -> AuditConfig:
+        """Get audit trail configuration."""
+        return self.audit
+
 
 # Global settings instance
 settings = Settings()
\ No newline at end of file
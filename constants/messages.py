@@ -13,17 +13,29 @@ class Messages:
     AUTH_LOGGED_IN_AS = "Conectado como"
     AUTH_LOGOUT = "Cerrar Sesión"
     AUTH_WELCOME = "Bienvenido"
+    AUTH_TOO_MANY_ATTEMPTS = "Demasiados intentos de inicio de sesión. Inténtalo de nuevo en {seconds} segundos."
+    AUTH_BUSY = "El servidor está ocupado verificando otras sesiones. Inténtalo de nuevo en unos segundos."
     
     # Database messages
     DB_NOT_EXISTS = "La base de datos no existe. Define INIT_DB=True para crearla."
+    DB_SCHEMA_OUTDATED = (
+        "El esquema de la base de datos está en la versión {current} y se esperaba la {expected}. "
+        "Ejecuta 'make migrate' o define INIT_DB=True para actualizarlo."
+    )
     DB_ERROR_INSERT_FALLERO = "Error al insertar el fallero: {error}"
     DB_ERROR_INSERT_USER = "Error al insertar el usuario: {error}"
+    DB_ERROR_IMPORT = "Error al importar el fichero: {error}"
     
     # Navigation and menu
     MENU_NAVIGATION = "Menú de Navegación"
     MENU_VIEW_FALLEROS = "Ver Falleros"
     MENU_ADD_FALLERO = "Añadir Fallero"
     MENU_VIEW_USERS = "Ver Usuarios"
+    MENU_IMPORT_FALLEROS = "Importar Falleros"
+    MENU_REVIEW_DUPLICATES = "Revisar Duplicados"
+    MENU_DASHBOARD = "Estadísticas del Censo"
+    MENU_CUOTAS = "Cuotas"
+    MENU_AUDIT = "Auditoría"
     MENU_SELECT_OPTION = "Selecciona una opción del menú."
     
     # Falleros section
@@ -37,17 +49,128 @@ class Messages:
     FALLEROS_STATUS_INACTIVE = "Inactivos"
     FALLEROS_NOT_FOUND = "No se encontraron falleros con los filtros seleccionados."
     FALLEROS_TOTAL_SHOWN = "Total de falleros mostrados: {count}"
+    FALLEROS_PAGE_INFO = "Página {page} · {total} falleros en total"
+    
+    # Export section
+    EXPORT_TITLE = "📥 Exportar censo"
+    EXPORT_FORMAT = "Formato:"
+    EXPORT_PREPARE = "Preparar exportación"
+    EXPORT_DOWNLOAD = "Descargar ({count} falleros)"
+    EXPORT_ERROR = "Error al exportar el censo: {error}"
+    
+    # Profiling panel
+    PROFILER_TITLE = "⏱️ Perfilado de la página"
+    PROFILER_TOTAL = "Tiempo total: {ms:.1f} ms"
+    PROFILER_SQL = "Consultas SQL: {count} ({ms:.1f} ms)"
+    PROFILER_DUMP = "Volcado cProfile: {path}"
+    
+    # Pagination
+    PAGINATION_PREVIOUS = "◀ Anterior"
+    PAGINATION_NEXT = "Siguiente ▶"
+    PAGINATION_PAGE_SIZE = "Filas por página"
     
     # Add fallero section
     ADD_FALLERO_TITLE = "Añadir Fallero/a"
     ADD_FALLERO_NAME = "Nombre*"
     ADD_FALLERO_SURNAME = "Apellidos*"
-    ADD_FALLERO_DNI = "DNI*"
-    ADD_FALLERO_DNI_HELP = "Formato: 8 números y una letra (ej: 12345678A)"
+    ADD_FALLERO_DNI = "DNI/NIE*"
+    ADD_FALLERO_DNI_HELP = "DNI: 8 números y una letra (ej: 12345678A). NIE: X, Y o Z, 7 números y una letra (ej: X1234567L)"
     ADD_FALLERO_BIRTH_DATE = "Fecha de nacimiento*"
     ADD_FALLERO_SUBMIT = "Añadir Fallero"
     ADD_FALLERO_SUCCESS = "Fallero añadido correctamente."
     
+    # Import falleros section
+    IMPORT_TITLE = "Importar Falleros desde fichero"
+    IMPORT_FILE = "Fichero CSV o Excel"
+    IMPORT_FILE_HELP = "Columnas: nombre, apellidos, dni, fecha_nacimiento y, opcionalmente, fecha_alta y activo."
+    IMPORT_DRY_RUN = "Solo validar (no insertar)"
+    IMPORT_SUBMIT = "Importar"
+    IMPORT_SUMMARY = "Filas leídas: {total} · Importadas: {imported} · Rechazadas: {rejected}"
+    IMPORT_DRY_RUN_DONE = "Validación completada. No se ha insertado ningún fallero."
+    IMPORT_SUCCESS = "Importación completada."
+    IMPORT_ERRORS_TITLE = "Filas rechazadas"
+    IMPORT_ERRORS_DOWNLOAD = "Descargar informe de errores"
+    IMPORT_UNSUPPORTED_FORMAT = "Formato de fichero no soportado: {format}. Usa CSV o XLSX."
+    IMPORT_MISSING_COLUMNS = "Faltan columnas obligatorias en el fichero: {columns}"
+    IMPORT_DUPLICATE_IN_FILE = "El DNI está repetido en el fichero."
+    IMPORT_DUPLICATE_IN_DB = "Ya existe un fallero con este DNI."
+    IMPORT_INVALID_DATE = "La fecha del campo {field} no es válida."
+    
+    # Census dashboard section
+    DASHBOARD_TITLE = "Estadísticas del Censo"
+    DASHBOARD_REFRESH = "🔄 Recalcular"
+    DASHBOARD_REFRESH_HELP = "Recalcula ahora los totales a partir del censo completo."
+    DASHBOARD_TOTAL = "Total de falleros"
+    DASHBOARD_BY_AGE = "Por edad"
+    DASHBOARD_BY_ANTIGUEDAD = "Por antigüedad (años desde el alta)"
+    DASHBOARD_BY_ALTA_YEAR = "Por año de alta"
+    DASHBOARD_EMPTY = "No hay falleros en el censo."
+    DASHBOARD_REFRESHED_AT = "Datos calculados el {refreshed_at:%d/%m/%Y a las %H:%M}."
+    DASHBOARD_REFRESHED_SUMMARY = "Resumen del censo actualizado. Activos: {activos} · Inactivos: {inactivos}"
+    
+    # Cuotas section
+    CUOTAS_TITLE = "Cuotas"
+    CUOTAS_EJERCICIO = "Ejercicio (año de inicio)"
+    CUOTAS_CHARGED = "Cargado"
+    CUOTAS_PAID = "Cobrado"
+    CUOTAS_PENDING = "Pendiente"
+    CUOTAS_TARIFAS_TITLE = "💶 Tarifas y cargos del ejercicio"
+    CUOTAS_TARIFAS_HELP = "Cada tramo empieza en su edad y termina donde empieza el siguiente. Un importe de 0 no genera cargo."
+    CUOTAS_EDAD_DESDE = "Edad desde"
+    CUOTAS_IMPORTE = "Importe (€)"
+    CUOTAS_TARIFAS_SAVE = "Guardar tarifas"
+    CUOTAS_TARIFAS_SAVED = "Tarifas guardadas."
+    CUOTAS_GENERATE = "Generar cargos del ejercicio"
+    CUOTAS_GENERATE_HELP = "Carga la cuota a los falleros activos que aún no la tienen en este ejercicio."
+    CUOTAS_GENERATED = "Cargos generados: {count}"
+    CUOTAS_NO_TARIFAS = "Define las tarifas del ejercicio antes de generar los cargos."
+    CUOTAS_PAYMENT_TITLE = "🧾 Registrar pago"
+    CUOTAS_PAYMENT_DNI = "DNI/NIE del fallero*"
+    CUOTAS_PAYMENT_AMOUNT = "Importe pagado (€)*"
+    CUOTAS_PAYMENT_SUBMIT = "Registrar pago"
+    CUOTAS_PAYMENT_SUCCESS = "Pago registrado. Saldo pendiente de {nombre}: {saldo}"
+    CUOTAS_PAYMENT_NOT_FOUND = "No existe ningún fallero con ese DNI/NIE."
+    CUOTAS_PAYMENT_INVALID_AMOUNT = "El importe debe ser mayor que cero."
+    CUOTAS_MOROSOS_TITLE = "Morosos"
+    CUOTAS_MOROSOS_ALL_YEARS = "Incluir ejercicios anteriores"
+    CUOTAS_MOROSOS_EMPTY = "No hay falleros con cuotas pendientes."
+    CUOTAS_MOROSOS_PAGE_INFO = "Página {page} · {total} falleros con cuotas pendientes"
+    CUOTAS_ERROR = "Error al guardar los datos de cuotas: {error}"
+    
+    # Audit trail section
+    AUDIT_TITLE = "Registro de Auditoría"
+    AUDIT_FILTER_ENTIDAD = "Tabla"
+    AUDIT_FILTER_ENTIDAD_ID = "Id del registro"
+    AUDIT_FILTER_USUARIO = "Usuario (email)"
+    AUDIT_ALL = "Todas"
+    AUDIT_EMPTY = "No hay cambios registrados con esos filtros."
+    AUDIT_PAGE_INFO = "Página {page} · {total} cambios"
+    AUDIT_ACTIONS = {
+        "insert": "Alta",
+        "update": "Modificación",
+        "delete": "Borrado",
+        "bulk_insert": "Alta masiva",
+        "bulk_update": "Modificación masiva",
+        "bulk_delete": "Borrado masivo",
+    }
+    
+    # Duplicate review section
+    DEDUP_TITLE = "Revisión de Posibles Duplicados"
+    DEDUP_RUN = "🔍 Buscar duplicados"
+    DEDUP_RUN_HELP = "Compara el censo en segundo plano y añade las parejas nuevas a la cola."
+    DEDUP_RUN_STARTED = "Búsqueda de duplicados iniciada. Recarga la vista en unos minutos."
+    DEDUP_RUN_IN_PROGRESS = "Hay una búsqueda de duplicados en curso."
+    DEDUP_PENDING_COUNT = "Parejas pendientes de revisar: {count}"
+    DEDUP_EMPTY = "No hay posibles duplicados pendientes de revisar."
+    DEDUP_SCORE = "**Similitud: {score:.0%}** (nombre {name:.0%} · DNI/NIE {dni:.0%} · fecha de nacimiento {date:.0%})"
+    DEDUP_FIELD = "Campo"
+    DEDUP_SAME_PERSON = "Es la misma persona"
+    DEDUP_DIFFERENT = "Son personas distintas"
+    DEDUP_SUMMARY = (
+        "Falleros: {falleros} · Comparaciones: {comparisons} · "
+        "Posibles duplicados: {matches} · Nuevos en la cola: {queued}"
+    )
+    
     # Users section
     USERS_TITLE = "Listado de Usuarios"
     USERS_FILTER_TITLE = "🔎 Filtrar Usuarios"
@@ -56,6 +179,9 @@ class Messages:
     USERS_FILTER_STATUS = "Filtrar por Estado:"
     USERS_NOT_FOUND = "No se encontraron usuarios con los filtros seleccionados."
     USERS_TOTAL_SHOWN = "Total de usuarios mostrados: {count}"
+    USERS_PAGE_INFO = "Página {page} · {total} usuarios en total"
+    USERS_SORT = "Ordenar por:"
+    USERS_SORT_OPTIONS = {"nombre": "Nombre de usuario", "email": "Email"}
     USERS_ADD_BUTTON_HELP = "Añadir usuario"
     
     # Add user section
@@ -71,7 +197,15 @@ class Messages:
     # Validation messages
     VALIDATION_NAME_REQUIRED = "El nombre es obligatorio."
     VALIDATION_SURNAME_REQUIRED = "Los apellidos son obligatorios."
-    VALIDATION_DNI_INVALID = "El DNI debe tener 8 números y una letra (ej: 12345678A)."
+    VALIDATION_DNI_INVALID = (
+        "El DNI debe tener 8 números y una letra (ej: 12345678A) "
+        "y el NIE una X, Y o Z, 7 números y una letra (ej: X1234567L)."
+    )
+    VALIDATION_DNI_CONTROL_LETTER = "El DNI/NIE no tiene la letra de control correcta."
+    VALIDATION_BIRTH_DATE_REQUIRED = "La fecha de nacimiento es obligatoria."
+    VALIDATION_BIRTH_DATE_FUTURE = "La fecha de nacimiento no puede ser futura."
+    VALIDATION_BIRTH_DATE_INVALID = "La fecha de nacimiento no es válida."
+    VALIDATION_BIRTH_DATE_UNREALISTIC = "La fecha de nacimiento no es realista."
     VALIDATION_USERNAME_REQUIRED = "El nombre de usuario es obligatorio."
     VALIDATION_EMAIL_INVALID = "El email debe tener un formato válido."
     VALIDATION_PASSWORD_MIN_LENGTH = "La contraseña debe tener al menos 6 caracteres."
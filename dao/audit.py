@@ -0,0 +1,410 @@
+"""
+Audit trail capture for the Secretaria El Cano application.
+
+Every committed change made through a SQLAlchemy session is recorded in the
+AuditLog table, tagged with the logged-in user:
+
+- after_flush collects the inserted, updated and deleted entities of each
+  flush, with the old and new values of the changed columns;
+- do_orm_execute records the set-based INSERT/UPDATE/DELETE statements,
+  which change rows without loading them as entities: the values of each
+  inserted row, or the WHERE condition and SET values of the statement;
+- after_commit hands the records of the transaction to the AuditWriter,
+  and after_rollback discards them.
+
+The AuditWriter puts the records on a bounded in-process queue and a
+background thread writes them in batches, one INSERT per batch, so commits
+never wait for the audit writes. If the queue stays full the records are
+dropped and counted instead of growing memory without limit. The queue is
+drained by dao.database.dispose_engines(), which also runs at process exit.
+"""
+
+import json
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import (
+    BinaryExpression, BindParameter, BooleanClauseList, ColumnElement
+)
+
+from config.settings import AuditConfig, settings
+from models.audit import (
+    ACCION_BULK_DELETE, ACCION_BULK_INSERT, ACCION_BULK_UPDATE, ACCION_DELETE, ACCION_INSERT,
+    ACCION_UPDATE, AuditLog
+)
+from models.census_summary import CensusSummary
+from models.fallero_search import FalleroSearchToken
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Derived tables, rebuilt from the audited ones, and the audit trail itself
+AUDIT_EXCLUDED_TABLES = frozenset({
+    AuditLog.__tablename__, CensusSummary.__tablename__, FalleroSearchToken.__tablename__,
+})
+# Columns whose values are never written to the audit trail
+REDACTED_COLUMNS = frozenset({"hashed_password"})
+REDACTED_VALUE = "***"
+
+# Session.info key holding the audit records of the current transaction
+_PENDING_RECORDS = "audit_records"
+
+AuditRecord = Dict[str, Any]
+
+_user_provider: Optional[Callable[[], Optional[str]]] = None
+
+_audit_writer: Optional["AuditWriter"] = None
+_audit_writer_lock = threading.Lock()
+
+
+def set_user_provider(provider: Optional[Callable[[], Optional[str]]]) -> None:
+    """
+    Set the function returning the logged-in user recorded with each change.
+
+    Args:
+        provider: Callable returning the user's email, or None to record no user.
+    """
+    global _user_provider
+    _user_provider = provider
+
+
+def current_user() -> Optional[str]:
+    """Return the logged-in user, or None outside of a user session."""
+    if _user_provider is None:
+        return None
+    try:
+        return _user_provider()
+    except Exception:
+        # Commits from background threads have no Streamlit session state
+        return None
+
+
+class AuditWriter:
+    """
+    Background writer of audit records.
+
+    Records are queued by submit() and written in batches of up to
+    batch_size by a daemon thread, waiting at most flush_interval for a
+    batch to fill.
+    """
+
+    def __init__(self, config: AuditConfig):
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            config: Audit trail configuration settings.
+        """
+        self.config = config
+        self.dropped = 0
+        self._queue: "queue.Queue[Tuple[Engine, AuditRecord]]" = queue.Queue(maxsize=config.queue_size)
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, engine: Engine, records: List[AuditRecord]) -> None:
+        """
+        Queue the records of a committed transaction.
+
+        Waits up to put_timeout for room in the queue; once it is full the
+        remaining records are dropped without waiting further.
+
+        Args:
+            engine: Engine of the database the changes were committed to.
+            records: Audit records to write.
+        """
+        if self._stopping.is_set():
+            self._drop(len(records))
+            return
+        with self._idle:
+            self._pending += len(records)
+        for position, record in enumerate(records):
+            try:
+                self._queue.put((engine, record), timeout=self.config.put_timeout)
+            except queue.Full:
+                self._drop(len(records) - position)
+                self._done(len(records) - position)
+                return
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued record has been written or dropped.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            Whether the queue was drained before the timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Write the queued records and stop the writer thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain.
+        """
+        self._stopping.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"Audit writer stopped with {self._pending} records pending")
+
+    def _run(self) -> None:
+        """Write batches from the queue until shutdown with an empty queue."""
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.config.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.config.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(batch)
+            self._done(len(batch))
+
+    def _write(self, batch: List[Tuple[Engine, AuditRecord]]) -> None:
+        """Insert a batch of records, one statement per database."""
+        by_engine: Dict[Engine, List[AuditRecord]] = {}
+        for engine, record in batch:
+            by_engine.setdefault(engine, []).append(record)
+        for engine, records in by_engine.items():
+            try:
+                with engine.begin() as connection:
+                    connection.execute(insert(AuditLog), records)
+            except SQLAlchemyError as e:
+                logger.error(f"Error writing {len(records)} audit records: {e}")
+                self._drop(len(records))
+
+    def _drop(self, count: int) -> None:
+        """Count records that could not be written."""
+        self.dropped += count
+        logger.warning(f"Dropped {count} audit records ({self.dropped} in total)")
+
+    def _done(self, count: int) -> None:
+        """Mark queued records as handled and wake up flush() callers."""
+        with self._idle:
+            self._pending -= count
+            self._idle.notify_all()
+
+
+def get_audit_writer() -> Optional[AuditWriter]:
+    """
+    Get the process-wide audit writer, starting it on first use.
+
+    Returns:
+        Shared AuditWriter instance, or None if the audit trail is disabled.
+    """
+    global _audit_writer
+    config = settings.get_audit_config()
+    if not config.enabled:
+        return None
+    with _audit_writer_lock:
+        if _audit_writer is None:
+            _audit_writer = AuditWriter(config)
+        return _audit_writer
+
+
+def shutdown_audit_writer() -> None:
+    """Drain and stop the shared audit writer; the next change starts a new one."""
+    global _audit_writer
+    with _audit_writer_lock:
+        writer, _audit_writer = _audit_writer, None
+    if writer is not None:
+        writer.shutdown()
+
+
+def _redact(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Hide the values of the redacted columns."""
+    return {
+        key: REDACTED_VALUE if key in REDACTED_COLUMNS else value
+        for key, value in values.items()
+    }
+
+
+def _to_json(values: Dict[str, Any]) -> str:
+    """Serialize audited values, redacting secrets."""
+    return json.dumps(_redact(values), default=str, ensure_ascii=False)
+
+
+def _entity_record(instance: Any, accion: str) -> Optional[AuditRecord]:
+    """Build the audit record of a flushed entity, or None if it is not audited."""
+    table = getattr(instance, "__table__", None)
+    if table is None or table.name in AUDIT_EXCLUDED_TABLES:
+        return None
+    state = inspect(instance)
+    columns = [attr.key for attr in state.mapper.column_attrs]
+
+    if accion == ACCION_UPDATE:
+        cambios = {}
+        for key in columns:
+            history = state.attrs[key].history
+            if history.added or history.deleted:
+                old = history.deleted[0] if history.deleted else None
+                new = history.added[0] if history.added else None
+                if old != new:
+                    cambios[key] = [old, new]
+        if not cambios:
+            return None
+    else:
+        # Only the loaded values, so deleted rows are never refreshed from the database
+        cambios = {key: state.dict[key] for key in columns if key in state.dict}
+
+    identity = state.mapper.primary_key_from_instance(instance)
+    return {
+        "accion": accion,
+        "entidad": table.name,
+        "entidad_id": ",".join(str(value) for value in identity),
+        "cambios": _to_json(cambios),
+    }
+
+
+def _pending_records(session: Session) -> List[AuditRecord]:
+    """Return the audit records of the session's current transaction."""
+    return session.info.setdefault(_PENDING_RECORDS, [])
+
+
+@event.listens_for(Session, "after_flush")
+def _capture_flushed_entities(session: Session, flush_context) -> None:
+    """Record the entities inserted, updated and deleted by an ORM flush."""
+    if get_audit_writer() is None:
+        return
+    changes = (
+        [(instance, ACCION_INSERT) for instance in session.new]
+        + [(instance, ACCION_UPDATE) for instance in session.dirty]
+        + [(instance, ACCION_DELETE) for instance in session.deleted]
+    )
+    for instance, accion in changes:
+        record = _entity_record(instance, accion)
+        if record is not None:
+            _pending_records(session).append(record)
+
+
+def _row_id(table: Any, values: Dict[str, Any]) -> Optional[str]:
+    """Return the primary key of an inserted row, if its values include it."""
+    primary_key = list(table.primary_key.columns)
+    if len(primary_key) != 1 or values.get(primary_key[0].key) is None:
+        return None
+    return str(values[primary_key[0].key])
+
+
+def _targeted_id(table: Any, where: Any, values: Dict[str, Any]) -> Optional[str]:
+    """Return the primary key a WHERE clause pins with "id = :value", if it does."""
+    primary_key = list(table.primary_key.columns)
+    if where is None or len(primary_key) != 1:
+        return None
+    clauses = [where]
+    if isinstance(where, BooleanClauseList) and where.operator is operators.and_:
+        clauses = list(where.clauses)
+    for clause in clauses:
+        if (isinstance(clause, BinaryExpression) and clause.operator is operators.eq
+                and isinstance(clause.left, ColumnElement)
+                and clause.left.shares_lineage(primary_key[0])
+                and isinstance(clause.right, BindParameter)):
+            value = values.get(clause.right.key, clause.right.value)
+            return None if value is None else str(value)
+    return None
+
+
+def _statement_values(statement: Any) -> Dict[str, Any]:
+    """Return the column values given to a statement with .values()."""
+    values = getattr(statement, "_values", None) or {}
+    return {
+        getattr(column, "key", column): getattr(value, "value", value)
+        for column, value in values.items()
+    }
+
+
+def _statement_records(orm_execute_state, accion: str, table: Any) -> List[AuditRecord]:
+    """
+    Build the audit records of a set-based statement.
+
+    Multi-row INSERTs get one record per row with its values. UPDATE and
+    DELETE record their WHERE condition with its parameters, plus the SET
+    values of an UPDATE, one record per parameter set of an executemany.
+    INSERT ... SELECT records the parameters of its SELECT.
+    """
+    statement = orm_execute_state.statement
+    params = orm_execute_state.parameters
+    rows = params if isinstance(params, list) else [dict(params or {})]
+
+    def record(entidad_id: Optional[str], cambios: Dict[str, Any]) -> AuditRecord:
+        return {"accion": accion, "entidad": table.name, "entidad_id": entidad_id,
+                "cambios": json.dumps(cambios, default=str, ensure_ascii=False)}
+
+    values = _statement_values(statement)
+    if accion == ACCION_BULK_INSERT:
+        if getattr(statement, "select", None) is not None:
+            return [record(None, {"select": _redact(statement.select.compile().params)})]
+        return [
+            record(_row_id(table, row_values), _redact(row_values))
+            for row_values in ({**values, **row} for row in rows)
+        ]
+
+    where = statement.whereclause
+    where_params = where.compile().params if where is not None else {}
+    records = []
+    for row in rows:
+        where_values = {**where_params, **{k: v for k, v in row.items() if k in where_params}}
+        cambios: Dict[str, Any] = {
+            "where": str(where) if where is not None else None,
+            "params": _redact(where_values),
+        }
+        if accion == ACCION_BULK_UPDATE:
+            cambios["set"] = _redact(
+                {**values, **{k: v for k, v in row.items() if k not in where_params}}
+            )
+        records.append(record(_targeted_id(table, where, where_values), cambios))
+    return records
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _capture_executed_statements(orm_execute_state) -> None:
+    """Record the set-based INSERT/UPDATE/DELETE statements run on a session."""
+    if orm_execute_state.is_insert:
+        accion = ACCION_BULK_INSERT
+    elif orm_execute_state.is_update:
+        accion = ACCION_BULK_UPDATE
+    elif orm_execute_state.is_delete:
+        accion = ACCION_BULK_DELETE
+    else:
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name is None or name in AUDIT_EXCLUDED_TABLES or get_audit_writer() is None:
+        return
+    _pending_records(orm_execute_state.session).extend(
+        _statement_records(orm_execute_state, accion, table)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_committed_records(session: Session) -> None:
+    """Hand the records of a committed transaction to the audit writer."""
+    records = session.info.pop(_PENDING_RECORDS, None)
+    writer = get_audit_writer()
+    if not records or writer is None:
+        return
+    occurred_at = datetime.now()
+    usuario = current_user()
+    for record in records:
+        record.update(occurred_at=occurred_at, usuario=usuario)
+    writer.submit(session.get_bind(), records)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_records(session: Session) -> None:
+    """Forget the records of a rolled back transaction."""
+    session.info.pop(_PENDING_RECORDS, None)
@@ -0,0 +1,90 @@
+"""
+Audit trail Data Access Object for the Secretaria El Cano application.
+
+This module reads the AuditLog table newest first, paging backwards by id
+so every page is an index range scan whatever its depth.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import func, select
+
+from dao.database import DatabaseManager
+from dao.pagination import DEFAULT_PAGE_SIZE, Cursor, Page, build_page, clamp_page_size
+from models.audit import AuditLog
+
+# Columns of the audit view
+AUDIT_LIST_COLUMNS = (
+    AuditLog.id, AuditLog.occurred_at, AuditLog.usuario, AuditLog.accion, AuditLog.entidad,
+    AuditLog.entidad_id, AuditLog.cambios,
+)
+
+
+class AuditDAO:
+    """
+    Data Access Object for the audit trail.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize the DAO.
+
+        Args:
+            db_manager: Database manager instance for database operations.
+        """
+        self.db_manager = db_manager
+
+    def page(self, entidad: Optional[str] = None, entidad_id: Optional[str] = None,
+             usuario: Optional[str] = None, cursor: Optional[Cursor] = None,
+             page_size: int = DEFAULT_PAGE_SIZE, with_total: bool = False) -> Page:
+        """
+        Retrieve one page of the audit trail, newest first.
+
+        The filters match the leading columns of the ix_audit_log_entidad
+        and ix_audit_log_usuario indexes, which end in id so the newest-first
+        order needs no sort.
+
+        Args:
+            entidad: Only changes of this table.
+            entidad_id: Only changes of this row; needs entidad.
+            usuario: Only changes made by this user.
+            cursor: Id of the last entry of the previous page, as a 1-tuple.
+            page_size: Maximum number of entries in the page.
+            with_total: Whether to also count all entries matching the filters.
+
+        Returns:
+            Page of rows with the values of AUDIT_LIST_COLUMNS.
+        """
+        page_size = clamp_page_size(page_size)
+        statement = select(*AUDIT_LIST_COLUMNS)
+        if entidad:
+            statement = statement.where(AuditLog.entidad == entidad)
+            if entidad_id:
+                statement = statement.where(AuditLog.entidad_id == entidad_id)
+        if usuario:
+            statement = statement.where(AuditLog.usuario == usuario)
+
+        with self.db_manager.get_db_session() as session:
+            total = None
+            if with_total:
+                total = session.scalar(
+                    select(func.count()).select_from(statement.order_by(None).subquery())
+                )
+            if cursor is not None:
+                statement = statement.where(AuditLog.id < cursor[0])
+            rows = list(session.execute(
+                statement.order_by(AuditLog.id.desc()).limit(page_size + 1)
+            ))
+        return build_page(rows, (AuditLog.id,), page_size, total)
+
+    def entidades(self) -> List[str]:
+        """
+        Get the names of the tables with audited changes.
+
+        Returns:
+            Table names in alphabetical order.
+        """
+        with self.db_manager.get_db_session() as session:
+            return list(session.scalars(
+                select(AuditLog.entidad).distinct().order_by(AuditLog.entidad)
+            ))
@@ -0,0 +1,130 @@
+"""
+Census statistics Data Access Object for the Secretaria El Cano application.
+
+This module computes the headcounts of the census with GROUP BY queries in
+the database and stores them in the CensusSummary table, which the
+dashboard reads instead of the Fallero table.
+"""
+
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, delete, extract, func, insert, literal, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from dao.database import DatabaseManager
+from models.census_summary import (
+    DIMENSION_ANIO_ALTA, DIMENSION_ANTIGUEDAD, DIMENSION_EDAD, DIMENSION_ESTADO, CensusSummary
+)
+from models.fallero import Fallero
+
+# Falleros younger than this belong to the infantil commission
+INFANTIL_MAX_AGE = 14
+# Lower bounds (in years since fecha_alta) and labels of the antigüedad buckets
+ANTIGUEDAD_BANDS = ((25, "25+"), (10, "10-24"), (5, "5-9"), (1, "1-4"), (0, "<1"))
+
+SummaryRow = Tuple[str, str, bool, int]
+
+
+def years_ago(today: date, years: int) -> date:
+    """Return the date a number of years before today (28 February for 29 February)."""
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        return today.replace(year=today.year - years, day=28)
+
+
+class CensusDAO:
+    """
+    Data Access Object for the census aggregates and their summary table.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize the DAO.
+        
+        Args:
+            db_manager: Database manager instance for database operations.
+        """
+        self.db_manager = db_manager
+    
+    def aggregate(self, today: Optional[date] = None) -> List[SummaryRow]:
+        """
+        Count the falleros of every bucket with one GROUP BY per dimension.
+        
+        Age and antigüedad buckets are CASE expressions comparing the dates
+        with cutoffs computed here, so the queries are the same on every backend.
+        
+        Args:
+            today: Reference date for ages and antigüedad, defaults to the current date.
+            
+        Returns:
+            (dimension, bucket, activo, total) rows.
+        """
+        today = today or date.today()
+        edad = case(
+            (Fallero.fecha_nacimiento > years_ago(today, INFANTIL_MAX_AGE), "infantil"),
+            else_="adulto",
+        )
+        antiguedad = case(
+            *[(Fallero.fecha_alta <= years_ago(today, years), label)
+              for years, label in ANTIGUEDAD_BANDS[:-1]],
+            else_=ANTIGUEDAD_BANDS[-1][1],
+        )
+        anio_alta = extract("year", Fallero.fecha_alta)
+        
+        rows: List[SummaryRow] = []
+        with self.db_manager.get_db_session() as session:
+            for dimension, bucket in (
+                (DIMENSION_ESTADO, None),
+                (DIMENSION_EDAD, edad),
+                (DIMENSION_ANTIGUEDAD, antiguedad),
+                (DIMENSION_ANIO_ALTA, anio_alta),
+            ):
+                rows.extend(
+                    (dimension, str(value), bool(activo), total)
+                    for value, activo, total in session.execute(self._group_by(bucket))
+                )
+        return rows
+    
+    @staticmethod
+    def _group_by(bucket: Optional[ColumnElement]):
+        """Build the GROUP BY query counting falleros per bucket (or in total) and status."""
+        activo = func.coalesce(Fallero.activo, True)
+        if bucket is None:
+            return select(literal("total"), activo, func.count()).group_by(activo)
+        return select(bucket, activo, func.count()).group_by(bucket, activo)
+    
+    def replace_summary(self, rows: List[SummaryRow], refreshed_at: datetime) -> None:
+        """
+        Replace the content of the summary table in one transaction.
+        
+        Args:
+            rows: (dimension, bucket, activo, total) rows.
+            refreshed_at: When the rows were computed.
+        """
+        with self.db_manager.get_db_session() as session:
+            session.execute(delete(CensusSummary))
+            if rows:
+                session.execute(insert(CensusSummary), [
+                    {"dimension": dimension, "bucket": bucket, "activo": activo,
+                     "total": total, "refreshed_at": refreshed_at}
+                    for dimension, bucket, activo, total in rows
+                ])
+            session.commit()
+    
+    def read_summary(self) -> Tuple[List[SummaryRow], Optional[datetime]]:
+        """
+        Read the summary table.
+        
+        Returns:
+            Tuple of (summary rows, when they were computed or None if the table is empty).
+        """
+        statement = select(
+            CensusSummary.dimension, CensusSummary.bucket, CensusSummary.activo,
+            CensusSummary.total, CensusSummary.refreshed_at,
+        ).order_by(CensusSummary.dimension, CensusSummary.bucket, CensusSummary.activo)
+        with self.db_manager.get_db_session() as session:
+            result = session.execute(statement).all()
+        refreshed_at = min((row.refreshed_at for row in result), default=None)
+        return [tuple(row[:4]) for row in result], refreshed_at
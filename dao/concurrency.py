@@ -0,0 +1,71 @@
+"""
+Concurrent page queries for the Secretaria El Cano application.
+
+A view that needs several independent queries can run them at the same
+time, so it waits for its slowest query instead of the sum of all of them:
+
+    cuota_dao = CuotaDAO(db_manager)
+    results = run_concurrently({
+        "resumen": lambda: cuota_dao.resumen(ejercicio),
+        "morosos": lambda: cuota_dao.morosos(ejercicio, with_total=True),
+    })
+
+The queries are ordinary DAO calls, so they go through the query cache and
+the replica routing like any other read. Each one runs on a worker thread
+with its own session and pooled connection; the database drivers release
+the GIL while they wait for the server.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, Mapping, Optional, TypeVar
+
+from config.settings import settings
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide query pool, sized like the connection pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.get_database_config().pool_size,
+                thread_name_prefix="page-query",
+            )
+        return _executor
+
+
+def run_concurrently(queries: Mapping[str, Callable[[], T]],
+                     timeout: Optional[float] = None) -> Dict[str, T]:
+    """
+    Run the independent queries of a page concurrently.
+
+    Every query runs in a copy of the caller's context, so the statements
+    are still counted by the request profiler of the rerun.
+
+    Args:
+        queries: Functions by name, typically DAO calls without arguments.
+        timeout: Maximum seconds to wait for all of them.
+
+    Returns:
+        Results by name.
+
+    Raises:
+        TimeoutError: If the queries did not finish within the timeout.
+        Exception: The first failure, raised once every query has finished.
+    """
+    executor = _get_executor()
+    futures = {
+        name: executor.submit(contextvars.copy_context().run, query)
+        for name, query in queries.items()
+    }
+    _, pending = wait(futures.values(), timeout)
+    if pending:
+        raise TimeoutError(f"Page queries did not finish in {timeout} seconds")
+    return {name: future.result() for name, future in futures.items()}
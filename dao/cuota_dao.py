@@ -0,0 +1,293 @@
+"""
+Cuota Data Access Object for the Secretaria El Cano application.
+
+This module manages the fee schedule and the cuota ledger. The charges of
+a whole ejercicio are generated with a single INSERT ... SELECT over the
+active falleros, and balances are SUM aggregates served by the covering
+indexes of CuotaMovimiento.
+"""
+
+from datetime import date
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from sqlalchemy import case, delete, exists, func, insert, literal, select
+from sqlalchemy.exc import IntegrityError
+
+from dao.census_dao import years_ago
+from dao.database import FALLERO_SORT_COLUMNS, DatabaseManager
+from dao.pagination import DEFAULT_PAGE_SIZE, Cursor, Page, fetch_page
+from dao.query_cache import get_query_cache
+from models.cuota import TIPO_CARGO, TIPO_PAGO, CuotaMovimiento, CuotaTarifa
+from models.fallero import Fallero
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CONCEPTO_CUOTA = "Cuota {ejercicio}-{siguiente}"
+CONCEPTO_PAGO = "Pago cuota {ejercicio}-{siguiente}"
+# Tables read by the balance queries, for query cache invalidation
+CUOTA_TABLES = (CuotaMovimiento.__tablename__, Fallero.__tablename__)
+
+
+def concepto(plantilla: str, ejercicio: int) -> str:
+    """Format a ledger concept for an ejercicio ("Cuota 2026-2027")."""
+    return plantilla.format(ejercicio=ejercicio, siguiente=ejercicio + 1)
+
+
+class CuotaDAO:
+    """
+    Data Access Object for the fee schedule and the cuota ledger.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize the DAO.
+
+        Args:
+            db_manager: Database manager instance for database operations.
+        """
+        self.db_manager = db_manager
+
+    def get_tarifas(self, ejercicio: int) -> Dict[int, int]:
+        """
+        Get the fee schedule of an ejercicio.
+
+        Args:
+            ejercicio: Year the ejercicio starts in.
+
+        Returns:
+            Fee in céntimos by minimum age, in ascending age order.
+        """
+        with self.db_manager.get_db_session() as session:
+            rows = session.execute(
+                select(CuotaTarifa.edad_desde, CuotaTarifa.importe)
+                .where(CuotaTarifa.ejercicio == ejercicio)
+                .order_by(CuotaTarifa.edad_desde)
+            )
+            return {edad_desde: importe for edad_desde, importe in rows}
+
+    def set_tarifas(self, ejercicio: int, tarifas: Mapping[int, int]) -> None:
+        """
+        Replace the fee schedule of an ejercicio.
+
+        Args:
+            ejercicio: Year the ejercicio starts in.
+            tarifas: Fee in céntimos by minimum age of each band.
+
+        Raises:
+            ValueError: If an age or a fee is negative.
+        """
+        if any(edad < 0 or importe < 0 for edad, importe in tarifas.items()):
+            raise ValueError("Ages and fees of the schedule cannot be negative.")
+
+        with self.db_manager.get_db_session() as session:
+            session.execute(delete(CuotaTarifa).where(CuotaTarifa.ejercicio == ejercicio))
+            if tarifas:
+                session.execute(insert(CuotaTarifa), [
+                    {"ejercicio": ejercicio, "edad_desde": edad, "importe": importe}
+                    for edad, importe in tarifas.items()
+                ])
+            session.commit()
+
+    def generar_cargos(self, ejercicio: int, fecha: Optional[date] = None,
+                       registrado_por: Optional[str] = None) -> int:
+        """
+        Charge the cuota of an ejercicio to every active fallero.
+
+        Runs one INSERT ... SELECT: the fee of each fallero is a CASE over
+        the birth date cutoffs of the age bands, computed here so the
+        statement is the same on every backend. Falleros already charged
+        for the ejercicio are skipped, so the run can be repeated after new
+        altas. Bands with a zero fee produce no charge.
+
+        Two runs at the same time can both pass the NOT EXISTS check; the
+        unique constraint on the charges then rejects the second statement,
+        which is retried once to charge only what the first one left out.
+
+        Args:
+            ejercicio: Year the ejercicio starts in.
+            fecha: Date of the charges and reference date for ages, defaults to today.
+            registrado_por: Email of the user running the charge.
+
+        Returns:
+            Number of charges written.
+
+        Raises:
+            ValueError: If the ejercicio has no fee schedule.
+        """
+        tarifas = self.get_tarifas(ejercicio)
+        if not tarifas:
+            raise ValueError(f"The ejercicio {ejercicio} has no fee schedule.")
+        fecha = fecha or date.today()
+
+        try:
+            return self._insert_cargos(ejercicio, tarifas, fecha, registrado_por)
+        except IntegrityError:
+            logger.warning(f"Concurrent charge run for ejercicio {ejercicio}, retrying")
+            return self._insert_cargos(ejercicio, tarifas, fecha, registrado_por)
+
+    def _insert_cargos(self, ejercicio: int, tarifas: Dict[int, int], fecha: date,
+                       registrado_por: Optional[str]) -> int:
+        """Run the INSERT ... SELECT of generar_cargos() in its own transaction."""
+        # Oldest band first: the first cutoff a birth date is on or before wins
+        importe = case(
+            *[
+                (Fallero.fecha_nacimiento <= years_ago(fecha, edad), literal(importe))
+                for edad, importe in sorted(tarifas.items(), reverse=True)
+            ],
+            else_=literal(0),
+        )
+        ya_cargado = exists().where(
+            CuotaMovimiento.fallero_id == Fallero.id,
+            CuotaMovimiento.ejercicio_cargo == ejercicio,
+        )
+        cargos = select(
+            Fallero.id,
+            literal(ejercicio),
+            literal(TIPO_CARGO),
+            literal(concepto(CONCEPTO_CUOTA, ejercicio)),
+            importe,
+            literal(ejercicio),
+            literal(fecha),
+            literal(registrado_por),
+        ).where(Fallero.activo == True, ~ya_cargado, importe > 0)
+
+        with self.db_manager.get_db_session() as session:
+            result = session.execute(
+                insert(CuotaMovimiento).from_select(
+                    ["fallero_id", "ejercicio", "tipo", "concepto", "importe", "ejercicio_cargo",
+                     "fecha", "registrado_por"],
+                    cargos,
+                )
+            )
+            session.commit()
+        return result.rowcount
+
+    def registrar_pago(self, fallero_id: int, ejercicio: int, importe: int,
+                       fecha: Optional[date] = None, registrado_por: Optional[str] = None) -> None:
+        """
+        Record a payment of a fallero.
+
+        Args:
+            fallero_id: Identifier of the fallero.
+            ejercicio: Ejercicio the payment is for.
+            importe: Amount paid in céntimos.
+            fecha: Date of the payment, defaults to today.
+            registrado_por: Email of the user recording the payment.
+
+        Raises:
+            ValueError: If the amount is not positive.
+        """
+        if importe <= 0:
+            raise ValueError("The amount of a payment must be positive.")
+
+        with self.db_manager.get_db_session() as session:
+            session.add(CuotaMovimiento(
+                fallero_id=fallero_id,
+                ejercicio=ejercicio,
+                tipo=TIPO_PAGO,
+                concepto=concepto(CONCEPTO_PAGO, ejercicio),
+                importe=-importe,
+                fecha=fecha or date.today(),
+                registrado_por=registrado_por,
+            ))
+            session.commit()
+
+    def saldo(self, fallero_id: int, ejercicio: Optional[int] = None) -> int:
+        """
+        Get the outstanding balance of a fallero.
+
+        Args:
+            fallero_id: Identifier of the fallero.
+            ejercicio: Only count this ejercicio, or None for all of them.
+
+        Returns:
+            Amount owed in céntimos; negative if the fallero paid in advance.
+        """
+        statement = select(func.coalesce(func.sum(CuotaMovimiento.importe), 0)).where(
+            CuotaMovimiento.fallero_id == fallero_id
+        )
+        if ejercicio is not None:
+            statement = statement.where(CuotaMovimiento.ejercicio == ejercicio)
+        with self.db_manager.get_db_session() as session:
+            return int(session.scalar(statement))
+
+    def resumen(self, ejercicio: int) -> Tuple[int, int]:
+        """
+        Get the totals charged and paid in an ejercicio.
+
+        Args:
+            ejercicio: Year the ejercicio starts in.
+
+        Returns:
+            Tuple of (charged, paid) in céntimos, both positive.
+        """
+        def load() -> Tuple[int, int]:
+            with self.db_manager.get_db_session() as session:
+                totals = dict(session.execute(
+                    select(CuotaMovimiento.tipo, func.sum(CuotaMovimiento.importe))
+                    .where(CuotaMovimiento.ejercicio == ejercicio)
+                    .group_by(CuotaMovimiento.tipo)
+                ).all())
+            return int(totals.get(TIPO_CARGO) or 0), -int(totals.get(TIPO_PAGO) or 0)
+
+        return get_query_cache().get_or_load(
+            "cuotas_resumen", dict(ejercicio=ejercicio), CUOTA_TABLES, load
+        )
+
+    def morosos(self, ejercicio: Optional[int] = None, cursor: Optional[Cursor] = None,
+                page_size: int = DEFAULT_PAGE_SIZE, with_total: bool = False) -> Page:
+        """
+        Retrieve one keyset page of the falleros with an outstanding balance.
+
+        Balances are grouped per fallero on the covering ledger index and
+        joined to Fallero, which is paginated in name order like the
+        falleros listing.
+
+        Args:
+            ejercicio: Only count this ejercicio, or None for the whole history.
+            cursor: Sort key of the last row of the previous page, or None for the first page.
+            page_size: Maximum number of rows in the page.
+            with_total: Whether to also count all falleros in debt.
+
+        Returns:
+            Page of rows with id, nombre, apellidos, dni, activo and pendiente (céntimos).
+        """
+        def load() -> Page:
+            pendiente = func.sum(CuotaMovimiento.importe)
+            deudas = select(CuotaMovimiento.fallero_id, pendiente.label("pendiente"))
+            if ejercicio is not None:
+                deudas = deudas.where(CuotaMovimiento.ejercicio == ejercicio)
+            deudas = deudas.group_by(CuotaMovimiento.fallero_id).having(pendiente > 0).subquery()
+
+            statement = select(
+                Fallero.id, Fallero.nombre, Fallero.apellidos, Fallero.dni, Fallero.activo,
+                deudas.c.pendiente,
+            ).join(deudas, deudas.c.fallero_id == Fallero.id)
+            with self.db_manager.get_db_session() as session:
+                return fetch_page(
+                    session, statement, FALLERO_SORT_COLUMNS, cursor=cursor,
+                    page_size=page_size, with_total=with_total
+                )
+
+        params = dict(ejercicio=ejercicio, cursor=cursor, page_size=page_size,
+                      with_total=with_total)
+        return get_query_cache().get_or_load("cuotas_morosos", params, CUOTA_TABLES, load)
+
+    def movimientos(self, fallero_id: int) -> List[tuple]:
+        """
+        Get the ledger entries of a fallero, newest first.
+
+        Args:
+            fallero_id: Identifier of the fallero.
+
+        Returns:
+            Rows with ejercicio, fecha, tipo, concepto and importe (céntimos).
+        """
+        with self.db_manager.get_db_session() as session:
+            return list(session.execute(
+                select(CuotaMovimiento.ejercicio, CuotaMovimiento.fecha, CuotaMovimiento.tipo,
+                       CuotaMovimiento.concepto, CuotaMovimiento.importe)
+                .where(CuotaMovimiento.fallero_id == fallero_id)
+                .order_by(CuotaMovimiento.fecha.desc(), CuotaMovimiento.id.desc())
+            ))
@@ -5,15 +5,120 @@ This module provides database connectivity and basic CRUD operations
 for the application entities.
 """
 
+import atexit
+import threading
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import create_engine
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import create_engine, exists, select
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
 
 from models.fallero import Fallero
 from models.usuario import Usuario
-from config.settings import settings
+from config.settings import DatabaseConfig, settings
+from dao.audit import shutdown_audit_writer
+from dao.query_cache import get_query_cache
+from dao.routing import RoutingSession
+from dao.search import FalleroSearchIndex
+from dao.pagination import DEFAULT_PAGE_SIZE, Cursor, Page, fetch_page
+from utils.logger import get_logger
+from utils.profiler import instrument_engine
+
+logger = get_logger(__name__)
+
+# Process-wide registry of engines and session factories, keyed by database URL.
+# Streamlit reruns the script on every interaction, so building the engine here
+# keeps a single connection pool per process shared by all sessions.
+_engines: Dict[str, Tuple[Engine, sessionmaker]] = {}
+# Engines of the read replicas, keyed by replica URL
+_replica_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+# Stable sort key of the fallero listings, backing their keyset pagination
+FALLERO_SORT_COLUMNS = (Fallero.apellidos, Fallero.nombre, Fallero.id)
+
+
+def _engine_options(db_config: DatabaseConfig) -> Dict[str, Any]:
+    """
+    Build the create_engine keyword arguments for a database configuration.
+    
+    Args:
+        db_config: Database configuration settings.
+        
+    Returns:
+        Keyword arguments for sqlalchemy.create_engine.
+    """
+    options: Dict[str, Any] = {
+        "pool_pre_ping": db_config.pool_pre_ping,
+        "pool_recycle": db_config.pool_recycle,
+    }
+    # SQLite uses its own pool classes, which do not accept QueuePool sizing
+    if make_url(db_config.url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_timeout=db_config.pool_timeout,
+        )
+    return options
+
+
+def _create_engine(url: str, db_config: DatabaseConfig) -> Engine:
+    """Create an engine with the pool options of a configuration."""
+    engine = create_engine(url, **_engine_options(db_config))
+    if settings.get_app_config().profiling_enabled:
+        instrument_engine(engine)
+    return engine
+
+
+def get_engine(db_config: Optional[DatabaseConfig] = None) -> Tuple[Engine, sessionmaker]:
+    """
+    Get the shared engine and session factory for a database configuration.
+    
+    The engine is created on first use and reused for the lifetime of the process.
+    With replica URLs configured, the sessions route their reads to the
+    replicas (see dao.routing); the returned engine is always the primary.
+    
+    Args:
+        db_config: Database configuration. Defaults to the global settings.
+        
+    Returns:
+        Tuple of (primary engine, session factory).
+    """
+    db_config = db_config or settings.get_database_config()
+    with _engines_lock:
+        if db_config.url not in _engines:
+            logger.info("Creating database engine")
+            engine = _create_engine(db_config.url, db_config)
+            replicas = []
+            for url in db_config.replica_urls:
+                if url not in _replica_engines:
+                    logger.info("Creating read replica engine")
+                    _replica_engines[url] = _create_engine(url, db_config)
+                replicas.append(_replica_engines[url])
+            session_factory = sessionmaker(
+                class_=RoutingSession, autocommit=False, autoflush=False, bind=engine,
+                replicas=replicas, lag_tolerance=db_config.replica_lag_tolerance,
+            )
+            _engines[db_config.url] = (engine, session_factory)
+        return _engines[db_config.url]
+
+
+def dispose_engines() -> None:
+    """Dispose every shared engine, closing all pooled connections and cached results."""
+    # Queued audit records are written while the engines are still open
+    shutdown_audit_writer()
+    with _engines_lock:
+        for engine, _ in _engines.values():
+            engine.dispose()
+        for engine in _replica_engines.values():
+            engine.dispose()
+        _engines.clear()
+        _replica_engines.clear()
+    get_query_cache().clear()
+
+
+atexit.register(dispose_engines)
 
 
 class DatabaseManager:
@@ -24,11 +129,14 @@ class DatabaseManager:
     methods for common database operations on application entities.
     """
     
-    def __init__(self):
-        """Initialize database manager with connection from settings."""
-        db_config = settings.get_database_config()
-        self.engine = create_engine(db_config.url)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+    def __init__(self, db_config: Optional[DatabaseConfig] = None):
+        """
+        Initialize database manager with the shared engine for the configuration.
+        
+        Args:
+            db_config: Database configuration. Defaults to the global settings.
+        """
+        self.engine, self.SessionLocal = get_engine(db_config)
 
     @contextmanager
     def get_db_session(self):
@@ -56,6 +164,22 @@ class DatabaseManager:
         with self.get_db_session() as db:
             return db.query(Usuario).all()
 
+    def has_active_users(self) -> bool:
+        """
+        Check whether at least one active user exists.
+        
+        Runs a single EXISTS query instead of loading the Usuario table, and
+        caches the answer until the Usuario table is written.
+        
+        Returns:
+            True if there is an active user, False otherwise.
+        """
+        def load() -> bool:
+            with self.get_db_session() as db:
+                return bool(db.scalar(select(exists().where(Usuario.activo == True))))
+        
+        return get_query_cache().get_or_load("has_active_users", {}, (Usuario.__tablename__,), load)
+
     def get_filtered_falleros(self, nombre: Optional[str] = None, 
                             apellidos: Optional[str] = None, 
                             estado: Optional[str] = None) -> List[Fallero]:
@@ -63,27 +187,75 @@ class DatabaseManager:
         Retrieve falleros with optional filtering.
         
         Args:
-            nombre: Optional filter by first name (partial match).
-            apellidos: Optional filter by last names (partial match).
+            nombre: Optional filter by first name (accent-insensitive word prefixes).
+            apellidos: Optional filter by last names (accent-insensitive word prefixes).
             estado: Optional filter by status ("Activos", "Inactivos", or None for all).
             
         Returns:
             List of Fallero instances matching the filters.
         """
         with self.get_db_session() as db:
-            query = db.query(Fallero)
-            
-            if nombre:
-                query = query.filter(Fallero.nombre.like(f"%{nombre}%"))
-            if apellidos:
-                query = query.filter(Fallero.apellidos.like(f"%{apellidos}%"))
-            if estado == "Activos":
-                query = query.filter(Fallero.activo == True)
-            elif estado == "Inactivos":
-                query = query.filter(Fallero.activo == False)
-                
+            query = self.apply_fallero_filters(db.query(Fallero), nombre, apellidos, estado)
             return query.all()
 
+    def get_falleros_page(self, nombre: Optional[str] = None,
+                          apellidos: Optional[str] = None,
+                          estado: Optional[str] = None,
+                          cursor: Optional[Cursor] = None,
+                          page_size: int = DEFAULT_PAGE_SIZE,
+                          with_total: bool = False) -> Page[Fallero]:
+        """
+        Retrieve one page of falleros sorted by (apellidos, nombre, id).
+        
+        Uses keyset pagination: the next page starts right after the cursor
+        returned with the previous one, so deep pages cost the same as the first.
+        
+        Args:
+            nombre: Optional filter by first name (accent-insensitive word prefixes).
+            apellidos: Optional filter by last names (accent-insensitive word prefixes).
+            estado: Optional filter by status ("Activos", "Inactivos", or None for all).
+            cursor: Sort key of the last row of the previous page, or None for the first page.
+            page_size: Maximum number of rows in the page.
+            with_total: Whether to also count all rows matching the filters.
+            
+        Returns:
+            Page of Fallero instances with the cursor for the next page.
+        """
+        with self.get_db_session() as db:
+            statement = self.apply_fallero_filters(select(Fallero), nombre, apellidos, estado)
+            return fetch_page(
+                db, statement, FALLERO_SORT_COLUMNS, cursor=cursor,
+                page_size=page_size, with_total=with_total, scalars=True
+            )
+
+    @staticmethod
+    def apply_fallero_filters(query, nombre: Optional[str], apellidos: Optional[str],
+                               estado: Optional[str]):
+        """
+        Apply the listing filters to a Fallero query.
+        
+        Works both on ORM queries and on Core select() statements, so every
+        read path (listings, exports) filters falleros the same way.
+        
+        Args:
+            query: Query or select() statement over the Fallero entity.
+            nombre: Optional filter by first name (accent-insensitive word prefixes).
+            apellidos: Optional filter by last names (accent-insensitive word prefixes).
+            estado: Optional filter by status ("Activos", "Inactivos", or None for all).
+            
+        Returns:
+            The filtered query.
+        """
+        for campo, texto in (("nombre", nombre), ("apellidos", apellidos)):
+            condition = FalleroSearchIndex.condition(texto, campo)
+            if condition is not None:
+                query = query.filter(condition)
+        if estado == "Activos":
+            query = query.filter(Fallero.activo == True)
+        elif estado == "Inactivos":
+            query = query.filter(Fallero.activo == False)
+        return query
+
     def insert_fallero(self, nombre: str, apellidos: str, dni: str, 
                       fecha_nacimiento) -> Fallero:
         """
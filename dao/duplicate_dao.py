@@ -0,0 +1,107 @@
+"""
+Duplicate review Data Access Object for the Secretaria El Cano application.
+
+This module reads and resolves the review queue of possible duplicate
+falleros written by managers.dedup_manager.
+"""
+
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import aliased
+
+from dao.database import DatabaseManager
+from models.fallero import Fallero
+from models.fallero_duplicate import ESTADO_PENDIENTE, FalleroDuplicateCandidate
+
+FalleroA = aliased(Fallero, name="fallero_a")
+FalleroB = aliased(Fallero, name="fallero_b")
+
+# Columns shown for each pair in the review view
+REVIEW_COLUMNS = (
+    FalleroDuplicateCandidate.id,
+    FalleroDuplicateCandidate.score,
+    FalleroDuplicateCandidate.name_score,
+    FalleroDuplicateCandidate.dni_score,
+    FalleroDuplicateCandidate.date_score,
+    FalleroA.id.label("id_a"),
+    FalleroA.nombre.label("nombre_a"),
+    FalleroA.apellidos.label("apellidos_a"),
+    FalleroA.dni.label("dni_a"),
+    FalleroA.fecha_nacimiento.label("fecha_nacimiento_a"),
+    FalleroB.id.label("id_b"),
+    FalleroB.nombre.label("nombre_b"),
+    FalleroB.apellidos.label("apellidos_b"),
+    FalleroB.dni.label("dni_b"),
+    FalleroB.fecha_nacimiento.label("fecha_nacimiento_b"),
+)
+
+
+class DuplicateReviewDAO:
+    """
+    Data Access Object for the duplicate review queue.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize the DAO.
+        
+        Args:
+            db_manager: Database manager instance for database operations.
+        """
+        self.db_manager = db_manager
+    
+    def pending(self, limit: int = 20) -> List[tuple]:
+        """
+        Get the most similar pairs pending review.
+        
+        Resolved pairs leave the queue, so the first rows are always the
+        next ones to review and no cursor is needed.
+        
+        Args:
+            limit: Maximum number of pairs to return.
+            
+        Returns:
+            Result rows with the values of REVIEW_COLUMNS.
+        """
+        statement = (
+            select(*REVIEW_COLUMNS)
+            .join(FalleroA, FalleroA.id == FalleroDuplicateCandidate.fallero_id_a)
+            .join(FalleroB, FalleroB.id == FalleroDuplicateCandidate.fallero_id_b)
+            .where(FalleroDuplicateCandidate.estado == ESTADO_PENDIENTE)
+            .order_by(FalleroDuplicateCandidate.score.desc(), FalleroDuplicateCandidate.id)
+            .limit(limit)
+        )
+        with self.db_manager.get_db_session() as session:
+            return list(session.execute(statement))
+    
+    def pending_count(self) -> int:
+        """Return the number of pairs pending review."""
+        with self.db_manager.get_db_session() as session:
+            return session.scalar(
+                select(func.count()).select_from(FalleroDuplicateCandidate)
+                .where(FalleroDuplicateCandidate.estado == ESTADO_PENDIENTE)
+            )
+    
+    def resolve(self, candidate_id: int, estado: str, resolved_by: str) -> bool:
+        """
+        Record the review decision of a pending pair.
+        
+        Args:
+            candidate_id: Identifier of the pair.
+            estado: Decision (ESTADO_DUPLICADO or ESTADO_DISTINTOS).
+            resolved_by: Email of the reviewing user.
+            
+        Returns:
+            True if the pair was pending and is now resolved.
+        """
+        with self.db_manager.get_db_session() as session:
+            result = session.execute(
+                update(FalleroDuplicateCandidate)
+                .where(FalleroDuplicateCandidate.id == candidate_id,
+                       FalleroDuplicateCandidate.estado == ESTADO_PENDIENTE)
+                .values(estado=estado, resolved_at=datetime.now(), resolved_by=resolved_by)
+            )
+            session.commit()
+        return result.rowcount > 0
@@ -1,4 +1,5 @@
 from models.fallero import Fallero
+from validators.identity import normalize_identity
 
 class FalleroDAO:
     def __init__(self, db_manager):
@@ -20,4 +21,4 @@ class FalleroDAO:
 
     def get_fallero_por_dni(self, dni):
         with self.db_manager.get_db_session() as session:
-            return session.query(Fallero).filter_by(dni=dni).first()
+            return session.query(Fallero).filter_by(dni=normalize_identity(dni)).first()
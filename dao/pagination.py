@@ -0,0 +1,153 @@
+"""
+Pagination helpers for the Secretaria El Cano application.
+
+This module provides keyset (seek) pagination primitives so that listing
+queries cost the same on deep pages as on the first one.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+Cursor = Tuple[Any, ...]
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    A page of results from a keyset-paginated query.
+    
+    Attributes:
+        items: Rows in the page, in sort order.
+        next_cursor: Sort key of the last row, or None if this is the last page.
+        total: Total number of matching rows, when it was requested.
+    """
+    
+    items: List[T]
+    next_cursor: Optional[Cursor] = None
+    total: Optional[int] = None
+
+    @property
+    def has_next(self) -> bool:
+        """Return whether there is a page after this one."""
+        return self.next_cursor is not None
+
+
+def keyset_after(columns: Sequence[ColumnElement], cursor: Cursor) -> ColumnElement:
+    """
+    Build a condition selecting rows strictly after a cursor in ascending order.
+    
+    The condition is expanded to nested OR/AND terms instead of a row-value
+    comparison so every backend can use the composite index on the columns.
+    
+    Args:
+        columns: Sort columns, most significant first.
+        cursor: Values of the sort columns for the last row already seen.
+        
+    Returns:
+        SQL condition for use in a WHERE clause.
+    """
+    if len(columns) != len(cursor):
+        raise ValueError("The cursor must have one value per sort column.")
+    
+    column, value = columns[-1], cursor[-1]
+    condition = column > value
+    for column, value in zip(reversed(columns[:-1]), reversed(cursor[:-1])):
+        condition = or_(column > value, and_(column == value, condition))
+    return condition
+
+
+def clamp_page_size(page_size: int) -> int:
+    """
+    Restrict a requested page size to the supported range.
+    
+    Args:
+        page_size: Requested number of rows per page.
+        
+    Returns:
+        Page size between 1 and MAX_PAGE_SIZE.
+    """
+    return max(1, min(int(page_size), MAX_PAGE_SIZE))
+
+
+def fetch_page(session: Session, statement: Select, sort_columns: Sequence[ColumnElement],
+               cursor: Optional[Cursor] = None, page_size: int = DEFAULT_PAGE_SIZE,
+               with_total: bool = False, scalars: bool = False) -> Page:
+    """
+    Run a filtered select() statement as one keyset page.
+    
+    Args:
+        session: Open database session.
+        statement: Filtered select() statement, without ORDER BY or LIMIT.
+        sort_columns: Unique sort key columns, most significant first.
+        cursor: Sort key of the last row of the previous page, or None for the first page.
+        page_size: Maximum number of rows in the page.
+        with_total: Whether to also count all rows matching the statement.
+        scalars: Return the first column of each row (ORM entities) instead of rows.
+        
+    Returns:
+        Page with the rows and the cursor for the next page.
+    """
+    page_size = clamp_page_size(page_size)
+    
+    total = None
+    if with_total:
+        total = session.scalar(count_statement(statement))
+    
+    statement = page_statement(statement, sort_columns, cursor, page_size)
+    result = session.scalars(statement) if scalars else session.execute(statement)
+    return build_page(list(result), sort_columns, page_size, total)
+
+
+def count_statement(statement: Select) -> Select:
+    """Build the statement counting the rows matched by a filtered select()."""
+    return select(func.count()).select_from(statement.subquery())
+
+
+def page_statement(statement: Select, sort_columns: Sequence[ColumnElement],
+                   cursor: Optional[Cursor], page_size: int) -> Select:
+    """
+    Restrict a filtered select() to the rows of one page, plus one to detect the next page.
+    
+    Args:
+        statement: Filtered select() statement, without ORDER BY or LIMIT.
+        sort_columns: Unique sort key columns, most significant first.
+        cursor: Sort key of the last row of the previous page, or None for the first page.
+        page_size: Number of rows in the page, already clamped.
+        
+    Returns:
+        Ordered and limited statement.
+    """
+    if cursor is not None:
+        statement = statement.where(keyset_after(sort_columns, cursor))
+    return statement.order_by(*sort_columns).limit(page_size + 1)
+
+
+def build_page(rows: List[Any], sort_columns: Sequence[ColumnElement], page_size: int,
+               total: Optional[int] = None) -> Page:
+    """
+    Build a Page from the rows returned by a page_statement() query.
+    
+    Args:
+        rows: Result rows, up to page_size + 1.
+        sort_columns: Unique sort key columns, most significant first.
+        page_size: Number of rows in the page, already clamped.
+        total: Total number of matching rows, if it was counted.
+        
+    Returns:
+        Page with the rows and the cursor for the next page.
+    """
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = tuple(getattr(rows[-1], column.key) for column in sort_columns)
+    return Page(items=rows, next_cursor=next_cursor, total=total)
@@ -0,0 +1,207 @@
+"""
+Query result cache for the Secretaria El Cano application.
+
+This module keeps recent read results in memory, keyed by normalized query
+parameters and by the version of every table the query reads. Each commit
+that writes a table bumps its version, so a new alta is visible on the
+very next rerun while unchanged views are served from memory.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from utils.text import normalize_text
+
+_CHANGED_TABLES = "query_cache_changed_tables"
+
+
+class TableVersions:
+    """Process-wide write version counter and last write time per table name."""
+
+    _lock = threading.Lock()
+    _versions: Dict[str, int] = {}
+    _written_at: Dict[str, float] = {}
+
+    @classmethod
+    def get(cls, tables: Iterable[str]) -> Tuple[int, ...]:
+        """
+        Get the current versions of some tables.
+
+        Args:
+            tables: Table names.
+
+        Returns:
+            Versions in the order of the given table names.
+        """
+        with cls._lock:
+            return tuple(cls._versions.get(table, 0) for table in tables)
+
+    @classmethod
+    def bump(cls, *tables: str) -> None:
+        """
+        Mark tables as written, invalidating every cached result that reads them.
+
+        Args:
+            *tables: Names of the written tables.
+        """
+        now = time.monotonic()
+        with cls._lock:
+            for table in tables:
+                cls._versions[table] = cls._versions.get(table, 0) + 1
+                cls._written_at[table] = now
+
+    @classmethod
+    def written_within(cls, tables: Iterable[str], seconds: float) -> bool:
+        """
+        Check whether any of some tables was written in the last seconds.
+
+        Args:
+            tables: Table names.
+            seconds: Length of the window.
+
+        Returns:
+            True if a commit wrote one of the tables less than seconds ago.
+        """
+        now = time.monotonic()
+        with cls._lock:
+            return any(
+                now - cls._written_at[table] < seconds
+                for table in tables if table in cls._written_at
+            )
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of query results with a time to live.
+
+    Cached values are shared between sessions and must be treated as
+    read-only by callers.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results.
+            ttl: Seconds a cached result stays valid.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, namespace: str, params: Dict[str, Any], tables: Tuple[str, ...],
+                    loader: Callable[[], Any]) -> Any:
+        """
+        Return a cached result, or load and cache it.
+
+        Args:
+            namespace: Name of the query.
+            params: Query parameters; text values are normalized for the key.
+            tables: Names of the tables the query reads.
+            loader: Function running the query on a cache miss.
+
+        Returns:
+            The query result.
+        """
+        if self.max_entries <= 0:
+            return loader()
+
+        key = (namespace, self._normalize(params), tables, TableVersions.get(tables))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _normalize(params: Dict[str, Any]) -> Tuple:
+        """Build a hashable key where equivalent filter values compare equal."""
+        normalized = []
+        for name in sorted(params):
+            value = params[name]
+            if isinstance(value, str):
+                value = normalize_text(value) or None
+            normalized.append((name, value))
+        return tuple(normalized)
+
+
+_query_cache: Optional[QueryCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryCache:
+    """
+    Get the process-wide query cache configured from DatabaseConfig.
+
+    Returns:
+        Shared QueryCache instance.
+    """
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            db_config = settings.get_database_config()
+            _query_cache = QueryCache(db_config.query_cache_size, db_config.query_cache_ttl)
+        return _query_cache
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    """Return the set of tables written in the session's current transaction."""
+    return session.info.setdefault(_CHANGED_TABLES, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session: Session, flush_context) -> None:
+    """Record the tables of the objects written by an ORM flush."""
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(instance, "__table__", None)
+        if table is not None:
+            _changed_tables(session).add(table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_executed_tables(orm_execute_state) -> None:
+    """Record the tables written by INSERT/UPDATE/DELETE statements run on a session."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and hasattr(table, "name"):
+            _changed_tables(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session: Session) -> None:
+    """Bump the versions of the tables written once their changes are committed."""
+    tables = session.info.pop(_CHANGED_TABLES, None)
+    if tables:
+        TableVersions.bump(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session: Session) -> None:
+    """Forget the tables of a rolled back transaction."""
+    session.info.pop(_CHANGED_TABLES, None)
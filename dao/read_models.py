@@ -0,0 +1,254 @@
+"""
+Read models for the list views of the Secretaria El Cano application.
+
+This module serves the list screens with column-projected Core queries:
+only the displayed columns are selected and the DataFrame is built straight
+from the result tuples, without hydrating ORM entities. The write path keeps
+using the ORM models.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import select
+
+from dao.database import FALLERO_SORT_COLUMNS, DatabaseManager
+from dao.pagination import DEFAULT_PAGE_SIZE, Cursor, Page, fetch_page
+from dao.query_cache import get_query_cache
+from models.fallero import Fallero
+from models.fallero_search import FalleroSearchToken
+from models.usuario import Usuario
+from utils.text import tokenize
+
+FALLERO_LIST_COLUMNS = (
+    Fallero.id,
+    Fallero.nombre,
+    Fallero.apellidos,
+    Fallero.dni,
+    Fallero.fecha_nacimiento,
+    Fallero.fecha_alta,
+    Fallero.activo,
+)
+# Tables read by the falleros listing, for query cache invalidation
+FALLERO_TABLES = (Fallero.__tablename__, FalleroSearchToken.__tablename__)
+FALLERO_LIST_SCHEMA = {
+    "id": "int64",
+    "nombre": "string",
+    "apellidos": "string",
+    "dni": "string",
+    "fecha_nacimiento": "object",
+    "fecha_alta": "object",
+    "activo": "boolean",
+}
+# Token columns added to scope frames for client-side filtering, by field
+FALLERO_SEARCH_COLUMNS = {"nombre": "_nombre_tokens", "apellidos": "_apellidos_tokens"}
+
+# hashed_password is deliberately not part of the users list
+USUARIO_LIST_COLUMNS = (
+    Usuario.id,
+    Usuario.nombre,
+    Usuario.email,
+    Usuario.activo,
+)
+USUARIO_TABLES = (Usuario.__tablename__,)
+USUARIO_LIST_SCHEMA = {
+    "id": "int64",
+    "nombre": "string",
+    "email": "string",
+    "activo": "boolean",
+}
+
+
+def rows_to_frame(rows: Sequence[tuple], schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Build a DataFrame from result tuples with an explicit schema.
+    
+    Args:
+        rows: Result rows, with values in the order of the schema columns.
+        schema: Mapping of column name to pandas dtype.
+        
+    Returns:
+        DataFrame with one column per schema entry, also when there are no rows.
+    """
+    frame = pd.DataFrame.from_records(rows, columns=list(schema), coerce_float=False)
+    return frame.astype(schema)
+
+
+def search_tokens(values: pd.Series) -> pd.Series:
+    """
+    Pre-normalize a name column for client-side filtering.
+    
+    Each value becomes its search tokens, each preceded by a space
+    (" lopez garcia"), so "some token starts with X" is a plain substring
+    test for " X".
+    
+    Args:
+        values: Names as stored.
+        
+    Returns:
+        Token strings, with the same index as the values.
+    """
+    return pd.Series(
+        ["".join(f" {token}" for token in tokenize(value)) for value in values.fillna("")],
+        index=values.index, dtype="object",
+    )
+
+
+def filter_falleros_frame(frame: pd.DataFrame, nombre: Optional[str] = None,
+                          apellidos: Optional[str] = None) -> pd.DataFrame:
+    """
+    Narrow a scope frame by the text filters, without querying the database.
+    
+    Matches the same rows as FalleroSearchIndex: every word typed must be the
+    prefix of some token of the field. Each word is one vectorized
+    str.contains over the pre-normalized token columns.
+    
+    Args:
+        frame: Frame returned by FalleroReadModel.scope().
+        nombre: Optional filter by first name.
+        apellidos: Optional filter by last names.
+        
+    Returns:
+        The matching rows, in the order of the frame.
+    """
+    mask = pd.Series(True, index=frame.index)
+    for campo, texto in (("nombre", nombre), ("apellidos", apellidos)):
+        column = frame[FALLERO_SEARCH_COLUMNS[campo]]
+        for token in dict.fromkeys(tokenize(texto)):
+            mask &= column.str.contains(f" {token}", regex=False)
+    return frame if mask.all() else frame[mask]
+
+
+class FalleroReadModel:
+    """
+    Column-projected queries for the falleros list view.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize the read model.
+        
+        Args:
+            db_manager: Database manager instance for database operations.
+        """
+        self.db_manager = db_manager
+
+    def page(self, nombre: Optional[str] = None, apellidos: Optional[str] = None,
+             estado: Optional[str] = None, cursor: Optional[Cursor] = None,
+             page_size: int = DEFAULT_PAGE_SIZE, with_total: bool = False) -> Page:
+        """
+        Retrieve one keyset page of the listing columns.
+        
+        Pages are served from the query cache until the Fallero table is written.
+        
+        Args:
+            nombre: Optional filter by first name.
+            apellidos: Optional filter by last names.
+            estado: Optional filter by status ("Activos", "Inactivos", or None for all).
+            cursor: Sort key of the last row of the previous page, or None for the first page.
+            page_size: Maximum number of rows in the page.
+            with_total: Whether to also count all rows matching the filters.
+            
+        Returns:
+            Page of result rows with the values of FALLERO_LIST_COLUMNS.
+        """
+        def load() -> Page:
+            statement = DatabaseManager.apply_fallero_filters(
+                select(*FALLERO_LIST_COLUMNS), nombre, apellidos, estado
+            )
+            with self.db_manager.get_db_session() as session:
+                return fetch_page(
+                    session, statement, FALLERO_SORT_COLUMNS, cursor=cursor,
+                    page_size=page_size, with_total=with_total
+                )
+        
+        params = dict(nombre=nombre, apellidos=apellidos, estado=estado, cursor=cursor,
+                      page_size=page_size, with_total=with_total)
+        return get_query_cache().get_or_load("falleros_page", params, FALLERO_TABLES, load)
+
+    def scope(self, estado: Optional[str], max_rows: int) -> Optional[pd.DataFrame]:
+        """
+        Load every fallero of a status scope for client-side filtering.
+        
+        The frame is sorted like the listing and carries the
+        FALLERO_SEARCH_COLUMNS token columns, so the text filters can be
+        applied with filter_falleros_frame() without going back to the
+        database. Frames are shared through the query cache and must not be
+        modified in place.
+        
+        Args:
+            estado: Status scope ("Activos", "Inactivos", or None for all).
+            max_rows: Largest scope worth loading whole.
+            
+        Returns:
+            The scope frame, or None if the scope has more than max_rows falleros.
+        """
+        def load() -> Optional[pd.DataFrame]:
+            statement = (
+                DatabaseManager.apply_fallero_filters(
+                    select(*FALLERO_LIST_COLUMNS), None, None, estado
+                )
+                .order_by(*FALLERO_SORT_COLUMNS)
+                .limit(max_rows + 1)
+            )
+            with self.db_manager.get_db_session() as session:
+                rows = [tuple(row) for row in session.execute(statement)]
+            if len(rows) > max_rows:
+                return None
+            frame = rows_to_frame(rows, FALLERO_LIST_SCHEMA)
+            for campo, column in FALLERO_SEARCH_COLUMNS.items():
+                frame[column] = search_tokens(frame[campo])
+            return frame
+        
+        params = dict(estado=estado, max_rows=max_rows)
+        return get_query_cache().get_or_load("falleros_scope", params, FALLERO_TABLES, load)
+
+    @staticmethod
+    def to_frame(rows: Sequence[tuple]) -> pd.DataFrame:
+        """
+        Build the falleros table from listing rows.
+        
+        Args:
+            rows: Rows returned by page().
+            
+        Returns:
+            DataFrame with the FALLERO_LIST_SCHEMA columns.
+        """
+        return rows_to_frame(rows, FALLERO_LIST_SCHEMA)
+
+    @staticmethod
+    def scope_page(frame: pd.DataFrame, offset: int, page_size: int) -> pd.DataFrame:
+        """
+        Slice one page of a filtered scope frame for display.
+        
+        Args:
+            frame: Frame returned by filter_falleros_frame().
+            offset: Position of the first row of the page.
+            page_size: Maximum number of rows in the page.
+            
+        Returns:
+            DataFrame with the FALLERO_LIST_SCHEMA columns.
+        """
+        return frame.iloc[offset:offset + page_size][list(FALLERO_LIST_SCHEMA)]
+
+
+class UsuarioReadModel:
+    """
+    Frame building for the users list view.
+    
+    The users listing itself is queried page by page with
+    UsuarioDAO.buscar_usuarios(), which filters and sorts in SQL.
+    """
+
+    @staticmethod
+    def to_frame(rows: Sequence[tuple]) -> pd.DataFrame:
+        """
+        Build the users table from listing rows.
+        
+        Args:
+            rows: Rows of a UsuarioDAO.buscar_usuarios() page.
+            
+        Returns:
+            DataFrame with the USUARIO_LIST_SCHEMA columns.
+        """
+        return rows_to_frame(rows, USUARIO_LIST_SCHEMA)
@@ -0,0 +1,96 @@
+"""
+Read/write splitting for the Secretaria El Cano application.
+
+RoutingSession sends plain SELECT statements to a read replica and
+everything else to the primary database:
+
+- INSERT/UPDATE/DELETE statements, flushes and SELECT ... FOR UPDATE;
+- every statement of a transaction after it has written, so a session
+  reads its own uncommitted changes, and every statement of a session
+  after it has committed a write, so refreshing the saved objects (and
+  anything else the session reads) never sees a replica lagging behind;
+- reads of tables committed in this process less than lag_tolerance
+  seconds ago, so a view shown right after a save reads the saved data
+  even while the replicas are catching up.
+
+Statements without a clause (Session.connection(), Session.get_bind()) also
+go to the primary, so callers asking for "the" engine get the primary.
+"""
+
+import random
+from typing import Any, Optional, Sequence, Set
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.util import find_tables
+
+from dao.query_cache import TableVersions
+
+# Session.info key set once the current transaction has written
+_WROTE = "routing_wrote"
+# Session.info key set once the session has committed a write
+_COMMITTED = "routing_committed"
+
+
+def statement_tables(clause: Any) -> Set[str]:
+    """Return the names of the tables a statement reads, including its subqueries."""
+    return {table.name for table in find_tables(clause)}
+
+
+class RoutingSession(Session):
+    """
+    Session routing reads to replica engines and writes to its bound primary engine.
+    """
+
+    def __init__(self, *args: Any, replicas: Sequence[Engine] = (),
+                 lag_tolerance: float = 0.0, **kwargs: Any):
+        """
+        Initialize the session.
+
+        Args:
+            replicas: Engines of the read replicas, one of which serves the
+                reads of this session; without them every statement goes to
+                the primary.
+            lag_tolerance: Seconds after a commit during which the written
+                tables are read from the primary.
+            *args, **kwargs: Session arguments; bind is the primary engine.
+        """
+        super().__init__(*args, **kwargs)
+        # One replica per session, so all its reads see the same snapshot
+        self.replica = random.choice(replicas) if replicas else None
+        self.lag_tolerance = lag_tolerance
+
+    def get_bind(self, mapper: Optional[Any] = None, clause: Optional[Any] = None,
+                 **kwargs: Any) -> Engine:
+        """Return the engine a statement runs on."""
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self.replica is None or self._uses_primary(clause):
+            return primary
+        return self.replica
+
+    def _uses_primary(self, clause: Optional[Any]) -> bool:
+        """Decide whether a statement must run on the primary."""
+        if self.info.get(_WROTE) or self.info.get(_COMMITTED):
+            return True
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[_WROTE] = True
+            return True
+        if not isinstance(clause, Select) or clause._for_update_arg is not None:
+            return True
+        return TableVersions.written_within(statement_tables(clause), self.lag_tolerance)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _pin_committed_writes(session: RoutingSession) -> None:
+    """Keep a session that committed a write on the primary from then on."""
+    if session.info.pop(_WROTE, None):
+        session.info[_COMMITTED] = True
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _reset_routing(session: RoutingSession) -> None:
+    """Let the next transaction of the session read from the replicas again."""
+    session.info.pop(_WROTE, None)
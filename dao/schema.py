@@ -0,0 +1,158 @@
+"""
+Schema migrations for the Secretaria El Cano application.
+
+The schema is versioned with Alembic (see the migrations directory). This
+module upgrades a database to the latest revision and reports whether the
+revision of a database matches the one the code expects.
+"""
+
+import functools
+import threading
+import weakref
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from dao.search import FalleroSearchIndex
+from models import FalleroSearchToken, metadata
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ALEMBIC_INI = PROJECT_ROOT / "alembic.ini"
+MIGRATIONS_DIR = PROJECT_ROOT / "migrations"
+# Revision matching the tables created with create_all before migrations existed
+BASELINE_REVISION = "0001"
+
+# Revision found by the bootstrap of each engine, so it runs once per process
+_bootstrapped: "weakref.WeakKeyDictionary[Engine, Optional[str]]" = weakref.WeakKeyDictionary()
+_bootstrap_lock = threading.Lock()
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """
+    Build the Alembic configuration of the project.
+    
+    Args:
+        connection: Connection the migrations run on, instead of DATABASE_URL.
+    
+    Returns:
+        Alembic configuration.
+    """
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+@functools.lru_cache(maxsize=None)
+def head_revision() -> str:
+    """Return the latest revision of the migration scripts."""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(engine: Engine) -> Optional[str]:
+    """
+    Get the revision a database is at.
+    
+    Args:
+        engine: Engine of the database.
+    
+    Returns:
+        Revision identifier, or None if the database is not versioned.
+    """
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def is_schema_current(engine: Engine) -> bool:
+    """Return whether a database is at the latest revision."""
+    return current_revision(engine) == head_revision()
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Upgrade a database to the latest revision.
+    
+    An empty database gets the whole schema. An unversioned database created
+    with create_all is stamped first with the revision matching its tables,
+    so only the later migrations run on it.
+    
+    Args:
+        engine: Engine of the database.
+    """
+    with engine.begin() as connection:
+        config = alembic_config(connection)
+        revision = MigrationContext.configure(connection).get_current_revision()
+        if revision is None and inspect(connection).has_table("Fallero"):
+            revision = _unversioned_revision(connection)
+            logger.info(f"Stamping unversioned schema with revision {revision}")
+            command.stamp(config, revision)
+        command.upgrade(config, "head")
+    logger.info(f"Database schema at revision {head_revision()}")
+
+
+def _unversioned_revision(connection: Connection) -> str:
+    """
+    Get the revision matching an unversioned schema created with create_all.
+    
+    Args:
+        connection: Connection to the database.
+    
+    Returns:
+        The latest revision if the database already has every table and index
+        of the models, otherwise the baseline revision of the tables created
+        before migrations existed.
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    for table in metadata.sorted_tables:
+        if table.name not in tables:
+            return BASELINE_REVISION
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        if any(index.name not in indexes for index in table.indexes):
+            return BASELINE_REVISION
+    return head_revision()
+
+
+def bootstrap_schema(engine: Engine, init_db: bool) -> Optional[str]:
+    """
+    Prepare the schema of a database once per process.
+    
+    The first call for an engine migrates the schema and backfills the name
+    search index when init_db is set, and reads the schema revision; later
+    calls return that revision without touching the database. Concurrent
+    first calls are serialized so the DDL only runs once.
+    
+    Args:
+        engine: Engine of the database.
+        init_db: Whether to migrate the schema to the latest revision.
+    
+    Returns:
+        Revision identifier of the database, or None if it is not versioned.
+    """
+    with _bootstrap_lock:
+        if engine not in _bootstrapped:
+            if init_db:
+                upgrade_schema(engine)
+                _backfill_search_index(engine)
+            _bootstrapped[engine] = current_revision(engine)
+        return _bootstrapped[engine]
+
+
+def _backfill_search_index(engine: Engine) -> None:
+    """Build the name search index for falleros created before it existed."""
+    with Session(engine) as session:
+        if session.query(FalleroSearchToken).first() is None:
+            indexed = FalleroSearchIndex.rebuild(session)
+            session.commit()
+            logger.info(f"Search index rebuilt for {indexed} falleros")
@@ -0,0 +1,84 @@
+"""
+Fallero name search for the Secretaria El Cano application.
+
+This module builds indexed prefix/token search conditions over the
+FalleroSearchToken table and maintains that index.
+"""
+
+from typing import Optional
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from models.fallero import Fallero
+from models.fallero_search import FalleroSearchToken
+from utils.text import tokenize
+
+
+class FalleroSearchIndex:
+    """
+    Accent- and case-insensitive name search over falleros.
+    
+    Every word typed by the user must be the prefix of some token of the
+    fallero, in any order: "garc lop" matches "López García", and "Garcia"
+    matches "García". Matching runs on the (campo, token) index, so it works
+    the same on MySQL and on the SQLite databases used by the tests.
+    """
+
+    @staticmethod
+    def condition(texto: Optional[str], campo: Optional[str] = None) -> Optional[ColumnElement]:
+        """
+        Build a filter condition on Fallero for a search text.
+        
+        Args:
+            texto: Text typed by the user.
+            campo: Fallero field to search ("nombre" or "apellidos"), or None for both.
+            
+        Returns:
+            SQL condition on Fallero, or None if the text has no searchable tokens.
+        """
+        tokens = tokenize(texto)
+        if not tokens:
+            return None
+        
+        conditions = []
+        for token in dict.fromkeys(tokens):
+            matching = select(FalleroSearchToken.fallero_id).where(
+                FalleroSearchToken.token.like(f"{token}%")
+            )
+            if campo is not None:
+                matching = matching.where(FalleroSearchToken.campo == campo)
+            conditions.append(Fallero.id.in_(matching))
+        return and_(*conditions)
+
+    @staticmethod
+    def rebuild(session: Session, batch_size: int = 1000) -> int:
+        """
+        Rebuild the whole search index from the Fallero table.
+        
+        Used to backfill existing databases; regular inserts and updates keep
+        the index up to date through mapper events.
+        
+        Args:
+            session: Open database session; the caller commits.
+            batch_size: Number of falleros read per batch.
+            
+        Returns:
+            Number of falleros indexed.
+        """
+        session.execute(FalleroSearchToken.__table__.delete())
+        
+        indexed = 0
+        rows = session.execute(
+            select(Fallero.id, Fallero.nombre, Fallero.apellidos)
+            .execution_options(yield_per=batch_size)
+        )
+        for partition in rows.partitions():
+            tokens = []
+            for fallero_id, nombre, apellidos in partition:
+                tokens.extend(FalleroSearchToken.rows_for(fallero_id, nombre, apellidos))
+            if tokens:
+                session.execute(FalleroSearchToken.__table__.insert(), tokens)
+            indexed += len(partition)
+        return indexed
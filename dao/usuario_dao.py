@@ -5,10 +5,114 @@ This module provides data access operations for Usuario entities,
 including user creation and retrieval operations.
 """
 
-import bcrypt
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
 from models.usuario import Usuario
 from dao.database import DatabaseManager
+from dao.pagination import DEFAULT_PAGE_SIZE, Cursor, Page, fetch_page
+from dao.query_cache import get_query_cache
+from dao.read_models import USUARIO_LIST_COLUMNS, USUARIO_TABLES
+from utils.password_hasher import get_password_hasher
+
+# Unique keyset sort columns of the users listing, by sort option
+USUARIO_SORT_COLUMNS = {
+    "nombre": (Usuario.nombre, Usuario.id),
+    "email": (Usuario.email, Usuario.id),
+}
+
+
+def prefix_condition(column, texto: Optional[str]) -> Optional[ColumnElement]:
+    """
+    Build an index-friendly prefix filter on a text column.
+    
+    The LIKE pattern is anchored at the start so MySQL can range-scan the
+    column index; its case-insensitive collation (and SQLite's LIKE) make
+    the match case-insensitive without wrapping the column in LOWER().
+    
+    Args:
+        column: Column to filter.
+        texto: Prefix typed by the user.
+        
+    Returns:
+        SQL condition, or None if the prefix is empty.
+    """
+    texto = (texto or "").strip()
+    if not texto:
+        return None
+    # "/" rather than a backslash, which MySQL also treats as a string escape
+    escaped = texto.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return column.like(f"{escaped}%", escape="/")
+
+
+def usuarios_statement(nombre: Optional[str] = None, email: Optional[str] = None,
+                       estado: Optional[str] = None) -> Select:
+    """
+    Build the filtered select() of the users listing columns.
+    
+    Args:
+        nombre: Optional name prefix.
+        email: Optional email prefix.
+        estado: Optional filter by status ("Activos", "Inactivos", or None for all).
+        
+    Returns:
+        Statement without ORDER BY or LIMIT, ready for keyset pagination.
+    """
+    statement = select(*USUARIO_LIST_COLUMNS)
+    for condition in (prefix_condition(Usuario.nombre, nombre),
+                      prefix_condition(Usuario.email, email)):
+        if condition is not None:
+            statement = statement.where(condition)
+    if estado == "Activos":
+        statement = statement.where(Usuario.activo == True)
+    elif estado == "Inactivos":
+        statement = statement.where(Usuario.activo == False)
+    return statement
+
+
+class CredentialsCache:
+    """
+    Process-wide cache of the login credentials of active users.
+    
+    The credentials map is loaded at most once per TTL and shared by every
+    session. UsuarioDAO invalidates it whenever a user is created or
+    deactivated, so changes take effect on the next rerun.
+    """
+    
+    _lock = threading.Lock()
+    _credentials: Optional[Dict[str, Any]] = None
+    _loaded_at: float = 0.0
+    _version: int = 0
+    
+    @classmethod
+    def get(cls, usuario_dao: 'UsuarioDAO', ttl: int) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get the credentials map, reloading it if it is missing or expired.
+        
+        Args:
+            usuario_dao: DAO used to load the credentials on a cache miss.
+            ttl: Maximum age of the cached map in seconds.
+            
+        Returns:
+            Tuple of (cache version, credentials map). The version changes
+            every time the map is reloaded. The map is shared and must be
+            copied before being handed to code that mutates it.
+        """
+        with cls._lock:
+            if cls._credentials is None or time.monotonic() - cls._loaded_at > ttl:
+                cls._credentials = usuario_dao.get_active_credentials()
+                cls._loaded_at = time.monotonic()
+                cls._version += 1
+            return cls._version, cls._credentials
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached credentials so the next access reloads them."""
+        with cls._lock:
+            cls._credentials = None
 
 
 class UsuarioDAO:
@@ -32,6 +136,9 @@ class UsuarioDAO:
         """
         Create a new user with hashed password.
         
+        The password is hashed on the shared bcrypt worker pool with the
+        cost factor configured in AuthConfig.
+        
         Args:
             nombre: Display name for the user.
             email: Email address for authentication (must be unique).
@@ -43,10 +150,7 @@ class UsuarioDAO:
         Raises:
             Exception: If there's an error during user creation or email already exists.
         """
-        hashed_password = bcrypt.hashpw(
-            plain_password.encode('utf-8'), 
-            bcrypt.gensalt()
-        ).decode('utf-8')
+        hashed_password = get_password_hasher().hash(plain_password)
         
         nuevo_usuario = Usuario(
             nombre=nombre,
@@ -59,9 +163,89 @@ class UsuarioDAO:
             session.add(nuevo_usuario)
             session.commit()
             session.refresh(nuevo_usuario)
-            
+        
+        CredentialsCache.invalidate()
         return nuevo_usuario
 
+    def desactivar_usuario(self, email: str) -> bool:
+        """
+        Deactivate a user so it can no longer log in.
+        
+        Args:
+            email: Email address of the user to deactivate.
+            
+        Returns:
+            True if a user was deactivated, False if no user has that email.
+        """
+        with self.db_manager.get_db_session() as session:
+            result = session.execute(
+                update(Usuario).where(Usuario.email == email).values(activo=False)
+            )
+            session.commit()
+        
+        CredentialsCache.invalidate()
+        return result.rowcount > 0
+
+    def get_active_credentials(self) -> Dict[str, Any]:
+        """
+        Build the streamlit-authenticator credentials map of active users.
+        
+        Only the email and password hash columns are read.
+        
+        Returns:
+            Credentials dictionary keyed by "usernames" and then by email.
+        """
+        with self.db_manager.get_db_session() as session:
+            rows = session.execute(
+                select(Usuario.email, Usuario.hashed_password).where(Usuario.activo == True)
+            )
+            return {
+                "usernames": {
+                    email: {"name": email, "password": hashed_password}
+                    for email, hashed_password in rows
+                }
+            }
+
+    def buscar_usuarios(self, nombre: Optional[str] = None, email: Optional[str] = None,
+                        estado: Optional[str] = None, orden: str = "nombre",
+                        cursor: Optional[Cursor] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                        with_total: bool = False) -> Page:
+        """
+        Retrieve one keyset page of the users listing, filtered in SQL.
+        
+        Only the USUARIO_LIST_COLUMNS are read, and pages are served from the
+        query cache until the Usuario table is written.
+        
+        Args:
+            nombre: Optional name prefix.
+            email: Optional email prefix.
+            estado: Optional filter by status ("Activos", "Inactivos", or None for all).
+            orden: Sort option, a key of USUARIO_SORT_COLUMNS.
+            cursor: Sort key of the last row of the previous page, or None for the first page.
+            page_size: Maximum number of rows in the page.
+            with_total: Whether to also count all rows matching the filters.
+            
+        Returns:
+            Page of result rows with the values of USUARIO_LIST_COLUMNS.
+            
+        Raises:
+            ValueError: If the sort option is unknown.
+        """
+        if orden not in USUARIO_SORT_COLUMNS:
+            raise ValueError(f"Unknown users sort option: {orden}")
+        
+        def load() -> Page:
+            statement = usuarios_statement(nombre, email, estado)
+            with self.db_manager.get_db_session() as session:
+                return fetch_page(
+                    session, statement, USUARIO_SORT_COLUMNS[orden], cursor=cursor,
+                    page_size=page_size, with_total=with_total
+                )
+        
+        params = dict(nombre=nombre, email=email, estado=estado, orden=orden, cursor=cursor,
+                      page_size=page_size, with_total=with_total)
+        return get_query_cache().get_or_load("usuarios_page", params, USUARIO_TABLES, load)
+
     def get_usuario_por_email(self, email: str) -> Optional[Usuario]:
         """
         Retrieve a user by email address.
@@ -86,7 +270,4 @@ class UsuarioDAO:
         Returns:
             True if passwords match, False otherwise.
         """
-        return bcrypt.checkpw(
-            plain_password.encode('utf-8'), 
-            hashed_password.encode('utf-8')
-        )
+        return get_password_hasher().verify(plain_password, hashed_password)
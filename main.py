@@ -17,14 +17,13 @@ sys.path.insert(0, str(project_root))
 def main():
     """Main entry point for the application."""
     try:
-        from app import SecretariaElCanoApp
+        from app import run_app
         from utils.logger import get_logger
         
         logger = get_logger(__name__)
         logger.info("Starting Secretaria El Cano application")
         
-        app = SecretariaElCanoApp()
-        app.run()
+        run_app()
         
     except ImportError as e:
         print(f"Error importing required modules: {e}")
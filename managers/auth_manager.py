@@ -5,13 +5,93 @@ This module handles user authentication using streamlit-authenticator
 and manages user sessions.
 """
 
-from typing import Tuple, Optional
+import copy
+import math
+from typing import Any, Callable, Dict, Tuple, Optional
 import streamlit as st
 import streamlit_authenticator as stauth
 from dao.database import DatabaseManager
-from dao.usuario_dao import UsuarioDAO
+from dao.usuario_dao import CredentialsCache, UsuarioDAO
 from constants.messages import AuthTranslations, Messages
 from config.settings import settings
+from exceptions import AuthenticationException
+from utils.logger import get_logger
+from utils.password_hasher import get_password_hasher
+from utils.rate_limiter import TokenBucketLimiter
+
+logger = get_logger(__name__)
+
+# Shared by every session, so a burst of attempts is throttled process-wide
+_login_limiter = TokenBucketLimiter(
+    capacity=settings.get_auth_config().login_burst,
+    refill_rate=settings.get_auth_config().login_rate_per_minute / 60.0,
+)
+
+
+def _login_limit_keys(username: Optional[str]) -> Tuple[str, Optional[str]]:
+    """
+    Build the rate-limit keys of a login attempt.
+    
+    Args:
+        username: Username (email) typed in the login form.
+        
+    Returns:
+        Key of the email, and key of the client IP address or None if unknown.
+    """
+    email_key = f"email:{(username or '').strip().lower()}"
+    ip_address = getattr(st.context, "ip_address", None)
+    return email_key, (f"ip:{ip_address}" if ip_address else None)
+
+
+def _make_credentials_checker(model) -> Callable[[str, str], bool]:
+    """
+    Build a credentials check that is rate limited and runs bcrypt off-thread.
+    
+    Replaces the authentication model's own check, which would call bcrypt
+    synchronously on the script thread for every attempt. Every attempt is
+    charged to the email, but only failed ones to the client IP, so the
+    volunteers logging in behind the casal's shared address do not lock
+    each other out.
+    
+    Args:
+        model: streamlit-authenticator authentication model holding the credentials.
+        
+    Returns:
+        Function with the signature of AuthenticationModel.check_credentials.
+        
+    Raises:
+        stauth.LoginError: When the attempt exceeds the login rate limit.
+    """
+    def check_credentials(username: str, password: str) -> bool:
+        email_key, ip_key = _login_limit_keys(username)
+        keys = [key for key in (email_key, ip_key) if key]
+        ip_blocked = ip_key is not None and _login_limiter.retry_after([ip_key]) > 0
+        if ip_blocked or not _login_limiter.allow(email_key):
+            logger.warning(f"Login rate limit exceeded for {keys}")
+            seconds = math.ceil(_login_limiter.retry_after(keys))
+            raise stauth.LoginError(Messages.AUTH_TOO_MANY_ATTEMPTS.format(seconds=seconds))
+        
+        user = model.credentials['usernames'].get(username)
+        if user is None:
+            if ip_key is not None:
+                _login_limiter.allow(ip_key)
+            return False
+        try:
+            valid = get_password_hasher().verify(password, user['password'])
+        except AuthenticationException as e:
+            raise stauth.LoginError(e.message)
+        except (TypeError, ValueError) as e:
+            # A malformed or legacy stored hash must not crash the login page
+            logger.error(f"Cannot verify the password of {username}: {str(e)}")
+            valid = False
+        if not valid:
+            if ip_key is not None:
+                _login_limiter.allow(ip_key)
+            # Keeps the authenticator's max_login_attempts counters working
+            model._record_failed_login_attempts(username)
+        return valid
+    
+    return check_credentials
 
 
 class AuthManager:
@@ -31,33 +111,53 @@ class AuthManager:
         """
         self.db_manager = db_manager
         self.usuario_dao = UsuarioDAO(db_manager)
-        self.authenticator = self._setup_authenticator()
+        self.authenticator = self._get_authenticator()
         
-    def _setup_authenticator(self) -> stauth.Authenticate:
+    def _get_authenticator(self) -> stauth.Authenticate:
         """
-        Set up the streamlit authenticator with user credentials.
+        Get the session's authenticator, rebuilding it only when credentials change.
+        
+        The authenticator is kept in the session state across reruns and is
+        rebuilt only when the shared credentials cache has been reloaded.
         
         Returns:
             Configured streamlit authenticator instance.
         """
-        users = self.db_manager.get_all_users()
-        credentials = {
-            "usernames": {
-                user.email: {
-                    "name": user.email,
-                    "password": user.hashed_password,
-                }
-                for user in users if user.activo
-            }
-        }
+        auth_config = settings.get_auth_config()
+        version, credentials = CredentialsCache.get(
+            self.usuario_dao, auth_config.credentials_cache_ttl
+        )
+        
+        cached = st.session_state.get("_authenticator")
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        authenticator = self._setup_authenticator(copy.deepcopy(credentials))
+        st.session_state["_authenticator"] = (version, authenticator)
+        return authenticator
+
+    def _setup_authenticator(self, credentials: Dict[str, Any]) -> stauth.Authenticate:
+        """
+        Set up the streamlit authenticator with user credentials.
+        
+        Args:
+            credentials: Credentials map of the active users; the authenticator
+                takes ownership of it.
         
+        Returns:
+            Configured streamlit authenticator instance.
+        """
         auth_config = settings.get_auth_config()
-        return stauth.Authenticate(
+        authenticator = stauth.Authenticate(
             credentials,
             auth_config.cookie_name,
             auth_config.secret_key,
             cookie_expiry_days=auth_config.cookie_expiry_days,
+            auto_hash=False,
         )
+        model = authenticator.authentication_controller.authentication_model
+        model.check_credentials = _make_credentials_checker(model)
+        return authenticator
 
     def login(self) -> Optional[Tuple[Optional[str], Optional[bool], Optional[str]]]:
         """
@@ -68,7 +168,11 @@ class AuthManager:
         """
         app_config = settings.get_app_config()
         st.image(app_config.logo_path, width=180)
-        return self.authenticator.login("main", fields=AuthTranslations.LOGIN_FORM)
+        try:
+            return self.authenticator.login("main", fields=AuthTranslations.LOGIN_FORM)
+        except stauth.LoginError as e:
+            st.error(str(e))
+            return None
 
     def logout(self, location: str = 'sidebar') -> None:
         """
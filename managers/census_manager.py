@@ -0,0 +1,158 @@
+"""
+Census statistics manager for the Secretaria El Cano application.
+
+This module serves the census dashboard from the CensusSummary table and
+decides when to recompute it: after falleros are written in this process,
+when the summary is older than AppConfig.census_refresh_seconds, or on
+demand. It can also be run from a scheduler:
+
+    python -m managers.census_manager
+"""
+
+import sys
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy.engine import Engine
+
+from config.settings import settings
+from constants.messages import Messages
+from dao.census_dao import CensusDAO
+from dao.database import DatabaseManager
+from dao.query_cache import TableVersions
+from models.fallero import Fallero
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_COLUMNS = ["dimension", "bucket", "activo", "total"]
+
+
+@dataclass
+class CensusReport:
+    """
+    Headcounts of the census, as stored in the summary table.
+
+    Attributes:
+        rows: DataFrame with one row per (dimension, bucket, activo).
+        refreshed_at: When the counts were computed.
+    """
+
+    rows: pd.DataFrame
+    refreshed_at: Optional[datetime]
+
+    def totals(self) -> Tuple[int, int]:
+        """Return the number of (active, inactive) falleros."""
+        estado = self.by_dimension("estado")
+        if estado.empty:
+            return 0, 0
+        return int(estado[True].sum()), int(estado[False].sum())
+
+    def by_dimension(self, dimension: str) -> pd.DataFrame:
+        """
+        Pivot the counts of one dimension.
+
+        Args:
+            dimension: Dimension name.
+
+        Returns:
+            DataFrame indexed by bucket with one column per status (True/False).
+        """
+        subset = self.rows[self.rows["dimension"] == dimension]
+        return (
+            subset.pivot_table(index="bucket", columns="activo", values="total",
+                               aggfunc="sum", fill_value=0)
+            .reindex(columns=[True, False], fill_value=0)
+        )
+
+
+class CensusStatsManager:
+    """
+    Keeps the census summary table fresh and serves the dashboard from it.
+    """
+
+    _lock = threading.Lock()
+    # Version of the Fallero table the summary of each engine was computed at
+    _fallero_versions: "weakref.WeakKeyDictionary[Engine, Tuple[int, ...]]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, db_manager: DatabaseManager, max_age_seconds: Optional[int] = None):
+        """
+        Initialize the manager.
+
+        Args:
+            db_manager: Database manager instance for database operations.
+            max_age_seconds: Maximum age of the summary, defaults to
+                AppConfig.census_refresh_seconds.
+        """
+        self.db_manager = db_manager
+        self.census_dao = CensusDAO(db_manager)
+        if max_age_seconds is None:
+            max_age_seconds = settings.get_app_config().census_refresh_seconds
+        self.max_age = timedelta(seconds=max_age_seconds)
+
+    def report(self) -> CensusReport:
+        """
+        Get the census headcounts, refreshing the summary first if it is stale.
+
+        When the summary is fresh this reads only the summary table, whose
+        size does not depend on the number of falleros.
+
+        Returns:
+            Census report.
+        """
+        with self._lock:
+            rows, refreshed_at = self.census_dao.read_summary()
+            if self._is_stale(refreshed_at):
+                rows, refreshed_at = self._refresh()
+        return CensusReport(pd.DataFrame(rows, columns=SUMMARY_COLUMNS), refreshed_at)
+
+    def refresh(self) -> CensusReport:
+        """
+        Recompute the summary table now.
+
+        Returns:
+            Census report with the new counts.
+        """
+        with self._lock:
+            rows, refreshed_at = self._refresh()
+        return CensusReport(pd.DataFrame(rows, columns=SUMMARY_COLUMNS), refreshed_at)
+
+    def _is_stale(self, refreshed_at: Optional[datetime]) -> bool:
+        """Return whether the summary is missing, too old or predates a write to Fallero."""
+        if refreshed_at is None or datetime.now() - refreshed_at > self.max_age:
+            return True
+        engine = self.db_manager.engine
+        version = TableVersions.get((Fallero.__tablename__,))
+        # The first read in a process trusts a summary that is recent enough
+        return self._fallero_versions.setdefault(engine, version) != version
+
+    def _refresh(self) -> Tuple[List[tuple], datetime]:
+        """Run the aggregates and store them; the caller holds the lock."""
+        version = TableVersions.get((Fallero.__tablename__,))
+        refreshed_at = datetime.now().replace(microsecond=0)
+        rows = self.census_dao.aggregate(refreshed_at.date())
+        self.census_dao.replace_summary(rows, refreshed_at)
+        self._fallero_versions[self.db_manager.engine] = version
+        logger.info(f"Census summary refreshed: {len(rows)} rows")
+        return rows, refreshed_at
+
+
+def main() -> int:
+    """
+    Command line entry point refreshing the census summary.
+
+    Returns:
+        Process exit code.
+    """
+    report = CensusStatsManager(DatabaseManager()).refresh()
+    activos, inactivos = report.totals()
+    print(Messages.DASHBOARD_REFRESHED_SUMMARY.format(activos=activos, inactivos=inactivos))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
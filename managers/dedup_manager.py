@@ -0,0 +1,347 @@
+"""
+Duplicate detection job for the Secretaria El Cano application.
+
+This module finds falleros that may have been registered twice, with a
+typo in the DNI or a different spelling of the name. Instead of comparing
+every pair of the census, each fallero gets a few blocking keys and only
+falleros sharing a key are compared, so the cost grows with the size of
+the blocks rather than with the square of the census.
+
+Pairs scoring above a threshold are written to the review queue
+(FalleroDuplicateCandidate) for the secretaría to resolve.
+
+It can be run from the command line or a scheduler:
+
+    python -m managers.dedup_manager --threshold 0.8
+"""
+
+import argparse
+import sys
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import insert, select
+
+from constants.messages import Messages
+from dao.database import DatabaseManager
+from models.fallero import Fallero
+from models.fallero_duplicate import ESTADO_PENDIENTE, FalleroDuplicateCandidate
+from utils.logger import get_logger
+from utils.text import normalize_text, phonetic_key, tokenize
+
+logger = get_logger(__name__)
+
+DEFAULT_THRESHOLD = 0.8
+# Blocks larger than this are too generic to be useful and are skipped
+DEFAULT_MAX_BLOCK_SIZE = 200
+WEIGHTS = {"name": 0.5, "dni": 0.3, "date": 0.2}
+
+_run_lock = threading.Lock()
+
+
+class Person(NamedTuple):
+    """Fields of a fallero used for blocking and scoring."""
+
+    id: int
+    nombre: str
+    apellidos: str
+    dni: str
+    fecha_nacimiento: Optional[date]
+
+
+class PairScore(NamedTuple):
+    """Similarity of a pair of falleros, overall and per field."""
+
+    score: float
+    name_score: float
+    dni_score: float
+    date_score: float
+
+
+@dataclass
+class DedupReport:
+    """
+    Result of a run of the duplicate detection job.
+
+    Attributes:
+        falleros: Number of falleros read.
+        blocks: Number of blocks with at least two falleros.
+        skipped_blocks: Number of blocks skipped for being too large.
+        comparisons: Number of pairs scored.
+        matches: Number of pairs scoring above the threshold.
+        queued: Number of new pairs written to the review queue.
+    """
+
+    falleros: int = 0
+    blocks: int = 0
+    skipped_blocks: int = 0
+    comparisons: int = 0
+    matches: int = 0
+    queued: int = 0
+
+
+def blocking_keys(person: Person) -> Set[str]:
+    """
+    Build the blocking keys of a fallero.
+
+    Two falleros are compared only if they share at least one key:
+    first surname and birth year, phonetic codes of first surname and
+    first name, or the number of the DNI/NIE without its control letter.
+
+    Args:
+        person: Fallero to build the keys for.
+
+    Returns:
+        Set of blocking keys.
+    """
+    keys = set()
+    surnames, names = tokenize(person.apellidos), tokenize(person.nombre)
+    if surnames and person.fecha_nacimiento:
+        keys.add(f"surname-year:{surnames[0]}:{person.fecha_nacimiento.year}")
+    if surnames and names:
+        keys.add(f"phonetic:{phonetic_key(surnames[0])}:{phonetic_key(names[0])}")
+    if len(person.dni) > 1:
+        keys.add(f"dni:{person.dni[:-1]}")
+    return keys
+
+
+def score_pair(first: Person, second: Person) -> PairScore:
+    """
+    Score how likely two falleros are the same person.
+
+    Args:
+        first: A fallero.
+        second: Another fallero.
+
+    Returns:
+        Weighted overall score and per-field similarities, between 0 and 1.
+    """
+    name_score = _similarity(
+        normalize_text(f"{first.nombre} {first.apellidos}"),
+        normalize_text(f"{second.nombre} {second.apellidos}"),
+    )
+    dni_score = _similarity(first.dni, second.dni)
+    date_score = _date_similarity(first.fecha_nacimiento, second.fecha_nacimiento)
+    score = (WEIGHTS["name"] * name_score + WEIGHTS["dni"] * dni_score
+             + WEIGHTS["date"] * date_score)
+    return PairScore(round(score, 4), round(name_score, 4), round(dni_score, 4), date_score)
+
+
+def _similarity(first: str, second: str) -> float:
+    """Return the similarity ratio of two strings."""
+    if not first or not second:
+        return 0.0
+    return SequenceMatcher(None, first, second).ratio()
+
+
+def _date_similarity(first: Optional[date], second: Optional[date]) -> float:
+    """
+    Compare two birth dates, allowing for typical typing mistakes.
+
+    Returns 1 for equal dates, 0.5 for dates in the same year with the same
+    day or month or with day and month swapped, and 0 otherwise.
+    """
+    if first is None or second is None:
+        return 0.0
+    if first == second:
+        return 1.0
+    if first.year == second.year and (
+        first.month == second.month or first.day == second.day
+        or (first.day, first.month) == (second.month, second.day)
+    ):
+        return 0.5
+    return 0.0
+
+
+class DuplicateDetector:
+    """
+    Duplicate detection job over the whole census.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, threshold: float = DEFAULT_THRESHOLD,
+                 max_block_size: int = DEFAULT_MAX_BLOCK_SIZE, batch_size: int = 1000):
+        """
+        Initialize the job.
+
+        Args:
+            db_manager: Database manager instance for database operations.
+            threshold: Minimum score for a pair to be queued for review.
+            max_block_size: Blocks with more falleros than this are skipped.
+            batch_size: Number of falleros read per round trip.
+        """
+        self.db_manager = db_manager
+        self.threshold = threshold
+        self.max_block_size = max_block_size
+        self.batch_size = batch_size
+
+    def run(self) -> DedupReport:
+        """
+        Find likely duplicates and add the new ones to the review queue.
+
+        Pairs already in the queue, pending or reviewed, are not added again.
+
+        Returns:
+            Report with the counts of the run.
+        """
+        report = DedupReport()
+        people = {person.id: person for person in self._read_people()}
+        report.falleros = len(people)
+
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for person in people.values():
+            for key in blocking_keys(person):
+                blocks[key].append(person.id)
+
+        matches: Dict[Tuple[int, int], PairScore] = {}
+        for pair in self._candidate_pairs(blocks.values(), report):
+            report.comparisons += 1
+            result = score_pair(people[pair[0]], people[pair[1]])
+            if result.score >= self.threshold:
+                matches[pair] = result
+        report.matches = len(matches)
+
+        report.queued = self._queue(matches)
+        logger.info(
+            f"Duplicate detection: {report.falleros} falleros, {report.blocks} blocks "
+            f"({report.skipped_blocks} skipped), {report.comparisons} comparisons, "
+            f"{report.matches} matches, {report.queued} queued"
+        )
+        return report
+
+    def _read_people(self) -> Iterable[Person]:
+        """Stream the fields of every fallero used by the job."""
+        statement = select(
+            Fallero.id, Fallero.nombre, Fallero.apellidos, Fallero.dni, Fallero.fecha_nacimiento
+        ).execution_options(stream_results=True, yield_per=self.batch_size)
+        with self.db_manager.get_db_session() as session:
+            for row in session.execute(statement):
+                yield Person(row.id, row.nombre or "", row.apellidos or "", row.dni or "",
+                             row.fecha_nacimiento)
+
+    def _candidate_pairs(self, blocks: Iterable[List[int]],
+                         report: DedupReport) -> Iterable[Tuple[int, int]]:
+        """
+        Generate each pair of falleros sharing a block, once.
+
+        Args:
+            blocks: Fallero ids of each block.
+            report: Report updated with the block counts.
+
+        Yields:
+            (lower id, higher id) pairs.
+        """
+        seen: Set[Tuple[int, int]] = set()
+        for ids in blocks:
+            if len(ids) < 2:
+                continue
+            if len(ids) > self.max_block_size:
+                report.skipped_blocks += 1
+                continue
+            report.blocks += 1
+            ids = sorted(ids)
+            for i, first in enumerate(ids):
+                for second in ids[i + 1:]:
+                    pair = (first, second)
+                    if pair not in seen:
+                        seen.add(pair)
+                        yield pair
+
+    def _queue(self, matches: Dict[Tuple[int, int], PairScore]) -> int:
+        """
+        Insert the pairs not yet in the review queue.
+
+        Args:
+            matches: Scores of the pairs above the threshold.
+
+        Returns:
+            Number of pairs inserted.
+        """
+        if not matches:
+            return 0
+
+        with self.db_manager.get_db_session() as session:
+            existing = {tuple(row) for row in session.execute(select(
+                FalleroDuplicateCandidate.fallero_id_a, FalleroDuplicateCandidate.fallero_id_b
+            ))}
+            rows = [
+                {
+                    "fallero_id_a": first,
+                    "fallero_id_b": second,
+                    "estado": ESTADO_PENDIENTE,
+                    **result._asdict(),
+                }
+                for (first, second), result in matches.items()
+                if (first, second) not in existing
+            ]
+            if rows:
+                session.execute(insert(FalleroDuplicateCandidate), rows)
+                session.commit()
+        return len(rows)
+
+
+def run_in_background(db_manager: DatabaseManager, **options) -> bool:
+    """
+    Start the duplicate detection job in a background thread.
+
+    Only one run can be in progress per process.
+
+    Args:
+        db_manager: Database manager instance for database operations.
+        **options: Arguments for DuplicateDetector.
+
+    Returns:
+        True if the job was started, False if a run is already in progress.
+    """
+    if not _run_lock.acquire(blocking=False):
+        return False
+
+    def run() -> None:
+        try:
+            DuplicateDetector(db_manager, **options).run()
+        except Exception:
+            logger.exception("Duplicate detection failed")
+        finally:
+            _run_lock.release()
+
+    threading.Thread(target=run, name="dedup-job", daemon=True).start()
+    return True
+
+
+def is_running() -> bool:
+    """Return whether a background run of the job is in progress."""
+    return _run_lock.locked()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point for the duplicate detection job.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Busca falleros posiblemente duplicados.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Puntuación mínima (0-1) para proponer una pareja.")
+    parser.add_argument("--max-block-size", type=int, default=DEFAULT_MAX_BLOCK_SIZE,
+                        help="Tamaño máximo de bloque a comparar.")
+    args = parser.parse_args(argv)
+
+    report = DuplicateDetector(
+        DatabaseManager(), threshold=args.threshold, max_block_size=args.max_block_size
+    ).run()
+    print(Messages.DEDUP_SUMMARY.format(
+        falleros=report.falleros, comparisons=report.comparisons,
+        matches=report.matches, queued=report.queued
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""
+Census export manager for the Secretaria El Cano application.
+
+This module writes the fallero census to CSV, XLSX or Parquet files,
+streaming rows from the database in batches so memory use stays bounded
+regardless of the number of members.
+"""
+
+import csv
+import io
+import os
+import tempfile
+import weakref
+from datetime import date
+from typing import IO, BinaryIO, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from dao.database import FALLERO_SORT_COLUMNS, DatabaseManager
+from models.fallero import Fallero
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = (
+    Fallero.id,
+    Fallero.nombre,
+    Fallero.apellidos,
+    Fallero.dni,
+    Fallero.fecha_nacimiento,
+    Fallero.fecha_alta,
+    Fallero.activo,
+)
+EXPORT_HEADER = [column.key for column in EXPORT_COLUMNS]
+
+
+def _remove_file(path: str) -> None:
+    """Delete a file if it still exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class TempExport:
+    """
+    Export written to a temporary file on disk.
+    
+    The file stays on disk while the object lives, so it can be downloaded
+    any number of times. It is deleted when the next export replaces it,
+    when the object is garbage collected (the Streamlit session holding it
+    ended) or at process exit, whichever comes first.
+    
+    Attributes:
+        path: Path of the temporary file.
+        rows: Number of rows written.
+        formato: One of the ExportFormat values.
+    """
+    
+    def __init__(self, path: str, rows: int, formato: str):
+        """
+        Initialize the export and schedule the deletion of its file.
+        
+        Args:
+            path: Path of the temporary file.
+            rows: Number of rows written.
+            formato: One of the ExportFormat values.
+        """
+        self.path = path
+        self.rows = rows
+        self.formato = formato
+        # weakref.finalize also runs at interpreter exit
+        self._finalizer = weakref.finalize(self, _remove_file, path)
+
+    @property
+    def exists(self) -> bool:
+        """Return whether the file has not been deleted yet."""
+        return self._finalizer.alive and os.path.exists(self.path)
+
+    def open(self) -> BinaryIO:
+        """
+        Open the file for its download.
+        
+        Returns:
+            The file opened for binary reading.
+        """
+        return open(self.path, "rb")
+
+    def delete(self) -> None:
+        """Delete the file now."""
+        self._finalizer()
+
+
+class ExportFormat:
+    """Supported export file formats."""
+    
+    CSV = "csv"
+    XLSX = "xlsx"
+    PARQUET = "parquet"
+    
+    MIME_TYPES = {
+        CSV: "text/csv",
+        XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        PARQUET: "application/vnd.apache.parquet",
+    }
+
+    @staticmethod
+    def available() -> List[str]:
+        """Return the formats whose optional dependencies are installed."""
+        formats = [ExportFormat.CSV, ExportFormat.XLSX]
+        try:
+            import pyarrow  # noqa: F401
+            formats.append(ExportFormat.PARQUET)
+        except ImportError:
+            pass
+        return formats
+
+
+class FalleroExportManager:
+    """
+    Streaming exporter of the fallero census.
+    
+    Rows are read with a server-side cursor in batches of batch_size and
+    written incrementally, so neither the ORM objects nor the whole table
+    are ever held in memory.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize the export manager.
+        
+        Args:
+            db_manager: Database manager instance for database operations.
+            batch_size: Number of rows fetched from the database per batch.
+        """
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+
+    def iter_batches(self, nombre: Optional[str] = None, apellidos: Optional[str] = None,
+                     estado: Optional[str] = None) -> Iterator[List[Tuple]]:
+        """
+        Stream the falleros matching the filters in batches of row tuples.
+        
+        The filters are the same as in DatabaseManager.get_filtered_falleros.
+        
+        Args:
+            nombre: Optional filter by first name.
+            apellidos: Optional filter by last names.
+            estado: Optional filter by status ("Activos", "Inactivos", or None for all).
+            
+        Yields:
+            Lists of tuples with the values of EXPORT_COLUMNS.
+        """
+        statement = DatabaseManager.apply_fallero_filters(
+            select(*EXPORT_COLUMNS), nombre, apellidos, estado
+        ).order_by(*FALLERO_SORT_COLUMNS)
+        
+        with self.db_manager.get_db_session() as session:
+            result = session.execute(
+                statement.execution_options(stream_results=True, yield_per=self.batch_size)
+            )
+            for partition in result.partitions():
+                yield [tuple(row) for row in partition]
+
+    def export(self, fileobj: IO[bytes], formato: str, **filters) -> int:
+        """
+        Write the falleros matching the filters to a binary file object.
+        
+        Args:
+            fileobj: Writable binary file object.
+            formato: One of the ExportFormat values.
+            **filters: Filters accepted by iter_batches.
+            
+        Returns:
+            Number of rows written.
+        """
+        writers = {
+            ExportFormat.CSV: self._write_csv,
+            ExportFormat.XLSX: self._write_xlsx,
+            ExportFormat.PARQUET: self._write_parquet,
+        }
+        if formato not in writers:
+            raise ValueError(f"Unsupported export format: {formato}")
+        
+        rows = writers[formato](fileobj, self.iter_batches(**filters))
+        logger.info(f"Exported {rows} falleros to {formato}")
+        return rows
+
+    def export_to_tempfile(self, formato: str, **filters) -> TempExport:
+        """
+        Write the export to a temporary file on disk.
+        
+        Used by the UI, so the export is never built in memory before the
+        user downloads it.
+        
+        Args:
+            formato: One of the ExportFormat values.
+            **filters: Filters accepted by iter_batches.
+            
+        Returns:
+            TempExport owning the temporary file.
+        """
+        with tempfile.NamedTemporaryFile(suffix=f".{formato}", delete=False) as fileobj:
+            try:
+                rows = self.export(fileobj, formato, **filters)
+            except Exception:
+                fileobj.close()
+                _remove_file(fileobj.name)
+                raise
+        return TempExport(fileobj.name, rows, formato)
+
+    @staticmethod
+    def _write_csv(fileobj: IO[bytes], batches: Iterator[List[Tuple]]) -> int:
+        """Write the batches as UTF-8 CSV (with BOM, so Excel detects the encoding)."""
+        text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+        try:
+            writer = csv.writer(text)
+            writer.writerow(EXPORT_HEADER)
+            rows = 0
+            for batch in batches:
+                writer.writerows(batch)
+                rows += len(batch)
+            text.flush()
+        finally:
+            text.detach()
+        return rows
+
+    @staticmethod
+    def _write_xlsx(fileobj: IO[bytes], batches: Iterator[List[Tuple]]) -> int:
+        """Write the batches to an Excel workbook in write-only (streaming) mode."""
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Falleros")
+        sheet.append(EXPORT_HEADER)
+        rows = 0
+        for batch in batches:
+            for row in batch:
+                sheet.append(row)
+            rows += len(batch)
+        workbook.save(fileobj)
+        return rows
+
+    @staticmethod
+    def _write_parquet(fileobj: IO[bytes], batches: Iterator[List[Tuple]]) -> int:
+        """Write each batch as a row group of a Parquet file."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        schema = pa.schema([
+            ("id", pa.int64()),
+            ("nombre", pa.string()),
+            ("apellidos", pa.string()),
+            ("dni", pa.string()),
+            ("fecha_nacimiento", pa.date32()),
+            ("fecha_alta", pa.date32()),
+            ("activo", pa.bool_()),
+        ])
+        rows = 0
+        with pq.ParquetWriter(fileobj, schema) as writer:
+            for batch in batches:
+                columns = list(zip(*batch))
+                writer.write_batch(pa.record_batch(
+                    [pa.array(values, type=f.type) for values, f in zip(columns, schema)],
+                    schema=schema,
+                ))
+                rows += len(batch)
+        return rows
+
+
+def export_file_name(formato: str) -> str:
+    """
+    Build the download file name for a census export.
+    
+    Args:
+        formato: One of the ExportFormat values.
+        
+    Returns:
+        File name including today's date.
+    """
+    return f"censo_falleros_{date.today().isoformat()}.{formato}"
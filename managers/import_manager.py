@@ -0,0 +1,389 @@
+"""
+Bulk import manager for the Secretaria El Cano application.
+
+This module loads a census of falleros from a CSV or Excel file in chunks,
+validating every row and inserting each chunk with a single multi-row
+INSERT inside its own transaction.
+
+It can also be run from the command line:
+
+    python -m managers.import_manager censo.csv --dry-run
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Set, Union
+
+import pandas as pd
+from sqlalchemy import insert, select
+
+from dao.database import DatabaseManager
+from models.fallero import Fallero
+from models.fallero_search import FalleroSearchToken
+from validators.batch import BatchValidator
+from validators.identity import normalize_identities
+from constants.messages import Messages
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+REQUIRED_COLUMNS = ("nombre", "apellidos", "dni", "fecha_nacimiento")
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+Source = Union[str, Path, IO[bytes]]
+
+
+@dataclass
+class ImportRowError:
+    """
+    Validation errors of a single row of the import file.
+    
+    Attributes:
+        row_number: Line number in the file (the header is line 1).
+        dni: DNI as written in the file.
+        errors: Error messages for the row.
+    """
+    
+    row_number: int
+    dni: str
+    errors: List[str]
+
+
+@dataclass
+class ImportReport:
+    """
+    Result of a bulk import.
+    
+    Attributes:
+        dry_run: Whether the rows were only validated, without inserting.
+        total_rows: Number of data rows read from the file.
+        imported: Number of rows inserted (or that would be inserted in a dry run).
+        errors: Per-row validation errors.
+    """
+    
+    dry_run: bool
+    total_rows: int = 0
+    imported: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+    
+    @property
+    def rejected(self) -> int:
+        """Return the number of rows rejected by validation."""
+        return len(self.errors)
+    
+    def errors_dataframe(self) -> pd.DataFrame:
+        """
+        Build a table with one line per rejected row.
+        
+        Returns:
+            DataFrame with the row number, DNI and joined error messages.
+        """
+        return pd.DataFrame.from_records(
+            [(e.row_number, e.dni, "; ".join(e.errors)) for e in self.errors],
+            columns=["fila", "dni", "errores"],
+        )
+
+
+class FalleroImportManager:
+    """
+    Bulk importer of falleros from CSV/XLSX files.
+    
+    Rows are streamed in chunks. For each chunk, DNIs already in the database
+    are found with one set-based query, and the valid rows are inserted with
+    one multi-row INSERT in a single transaction.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the import manager.
+        
+        Args:
+            db_manager: Database manager instance for database operations.
+            chunk_size: Number of rows validated and inserted per transaction.
+        """
+        self.db_manager = db_manager
+        self.chunk_size = chunk_size
+        self.validator = BatchValidator()
+    
+    def import_file(self, source: Source, file_name: Optional[str] = None,
+                    dry_run: bool = False) -> ImportReport:
+        """
+        Import falleros from a CSV or XLSX file.
+        
+        Args:
+            source: Path or binary file object with the census.
+            file_name: File name used to detect the format when source is a file object.
+            dry_run: Validate every row and report errors without inserting anything.
+        
+        Returns:
+            Import report with counts and per-row errors.
+        """
+        file_name = file_name or getattr(source, "name", None) or str(source)
+        report = ImportReport(dry_run=dry_run)
+        seen_dnis: Set[str] = set()
+        
+        logger.info(f"Importing falleros from {file_name} (dry_run={dry_run})")
+        first_row_number = 2
+        for chunk in self._read_chunks(source, file_name):
+            self._import_chunk(chunk, first_row_number, seen_dnis, report)
+            first_row_number += len(chunk)
+        
+        logger.info(
+            f"Import finished: {report.total_rows} rows, {report.imported} imported, "
+            f"{report.rejected} rejected"
+        )
+        return report
+    
+    def _read_chunks(self, source: Source, file_name: str) -> Iterator[List[Dict[str, str]]]:
+        """
+        Stream the rows of the file in chunks of at most chunk_size rows.
+        
+        Args:
+            source: Path or binary file object with the census.
+            file_name: File name used to detect the format.
+        
+        Yields:
+            Lists of rows as dictionaries keyed by lowercase column name.
+        """
+        suffix = Path(file_name).suffix.lower()
+        if suffix in (".xlsx", ".xlsm"):
+            yield from self._read_excel_chunks(source)
+        elif suffix == ".csv":
+            for frame in pd.read_csv(source, dtype=str, keep_default_na=False,
+                                     chunksize=self.chunk_size, sep=None, engine="python"):
+                frame.columns = [str(c).strip().lower() for c in frame.columns]
+                self._check_columns(frame.columns)
+                yield frame.to_dict("records")
+        else:
+            raise ValueError(Messages.IMPORT_UNSUPPORTED_FORMAT.format(format=suffix or file_name))
+    
+    def _read_excel_chunks(self, source: Source) -> Iterator[List[Dict[str, str]]]:
+        """
+        Stream the rows of the first worksheet of an Excel file.
+        
+        Args:
+            source: Path or binary file object with the workbook.
+        
+        Yields:
+            Lists of rows as dictionaries keyed by lowercase column name.
+        """
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = [str(c).strip().lower() if c is not None else "" for c in next(rows, ())]
+            self._check_columns(header)
+            
+            chunk: List[Dict[str, str]] = []
+            for values in rows:
+                chunk.append({
+                    column: "" if value is None else value
+                    for column, value in zip(header, values)
+                })
+                if len(chunk) >= self.chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _check_columns(columns) -> None:
+        """Raise ValueError if any required column is missing from the header."""
+        missing = [c for c in REQUIRED_COLUMNS if c not in set(columns)]
+        if missing:
+            raise ValueError(Messages.IMPORT_MISSING_COLUMNS.format(columns=", ".join(missing)))
+    
+    def _import_chunk(self, chunk: List[Dict[str, str]], first_row_number: int,
+                      seen_dnis: Set[str], report: ImportReport) -> None:
+        """
+        Validate a chunk of rows and insert the valid ones in one transaction.
+        
+        Args:
+            chunk: Rows of the chunk.
+            first_row_number: File line number of the first row in the chunk.
+            seen_dnis: DNIs accepted so far in this file, updated in place.
+            report: Import report, updated in place.
+        """
+        report.total_rows += len(chunk)
+        candidates = []
+        for offset, (row, values, errors) in enumerate(zip(chunk, *self._validate_chunk(chunk))):
+            row_number = first_row_number + offset
+            if not errors and values["dni"] in seen_dnis:
+                errors.append(Messages.IMPORT_DUPLICATE_IN_FILE)
+            if errors:
+                report.errors.append(ImportRowError(row_number, str(row.get("dni", "")), errors))
+            else:
+                seen_dnis.add(values["dni"])
+                candidates.append((row_number, values))
+        
+        if not candidates:
+            return
+        
+        with self.db_manager.get_db_session() as session:
+            existing = set(session.scalars(
+                select(Fallero.dni).where(Fallero.dni.in_([v["dni"] for _, v in candidates]))
+            ))
+            valid = []
+            for row_number, values in candidates:
+                if values["dni"] in existing:
+                    report.errors.append(ImportRowError(
+                        row_number, values["dni"], [Messages.IMPORT_DUPLICATE_IN_DB]
+                    ))
+                else:
+                    valid.append(values)
+            
+            if valid and not report.dry_run:
+                session.execute(insert(Fallero), valid)
+                self._index_inserted(session, [v["dni"] for v in valid])
+                session.commit()
+            report.imported += len(valid)
+    
+    @staticmethod
+    def _index_inserted(session, dnis: List[str]) -> None:
+        """
+        Write the search tokens of falleros inserted in bulk.
+        
+        Bulk INSERTs do not fire the per-object mapper events that keep the
+        search index in sync, so the tokens are written here in one statement.
+        
+        Args:
+            session: Session holding the chunk transaction.
+            dnis: DNIs of the inserted falleros.
+        """
+        tokens = []
+        inserted = session.execute(
+            select(Fallero.id, Fallero.nombre, Fallero.apellidos).where(Fallero.dni.in_(dnis))
+        )
+        for fallero_id, nombre, apellidos in inserted:
+            tokens.extend(FalleroSearchToken.rows_for(fallero_id, nombre, apellidos))
+        if tokens:
+            session.execute(insert(FalleroSearchToken), tokens)
+    
+    def _validate_chunk(self, chunk: List[Dict[str, str]]):
+        """
+        Validate and normalize the rows of a chunk in one vectorized pass.
+        
+        Args:
+            chunk: Rows keyed by lowercase column name.
+        
+        Returns:
+            Tuple of (column values ready for insertion, list of error messages),
+            each with one entry per row.
+        """
+        frame = pd.DataFrame.from_records(chunk).reindex(
+            columns=[*REQUIRED_COLUMNS, "fecha_alta", "activo"], fill_value=""
+        )
+        frame["nombre"] = frame["nombre"].fillna("").astype(str).str.strip()
+        frame["apellidos"] = frame["apellidos"].fillna("").astype(str).str.strip()
+        frame["dni"] = normalize_identities(frame["dni"])
+        
+        raw_dates = frame[["fecha_nacimiento", "fecha_alta"]]
+        frame["fecha_nacimiento"] = raw_dates["fecha_nacimiento"].map(_parse_date)
+        frame["fecha_alta"] = raw_dates["fecha_alta"].map(_parse_date)
+        
+        matrix = self.validator.validate(frame[list(REQUIRED_COLUMNS)])
+        for column in ("fecha_nacimiento", "fecha_alta"):
+            unparsed = frame[column].isna() & ~raw_dates[column].isin([None, ""])
+            if column not in matrix:
+                matrix[column] = pd.Series(None, index=matrix.index, dtype=object)
+            matrix.loc[unparsed, column] = Messages.IMPORT_INVALID_DATE.format(field=column)
+        
+        today = date.today()
+        values = [
+            {
+                "nombre": nombre,
+                "apellidos": apellidos,
+                "dni": dni,
+                "fecha_nacimiento": fecha_nacimiento,
+                "fecha_alta": fecha_alta or today,
+                "activo": _parse_bool(activo, default=True),
+            }
+            for nombre, apellidos, dni, fecha_nacimiento, fecha_alta, activo in zip(
+                frame["nombre"], frame["apellidos"], frame["dni"],
+                frame["fecha_nacimiento"], frame["fecha_alta"], frame["activo"]
+            )
+        ]
+        return values, BatchValidator.row_errors(matrix)
+
+
+def _parse_date(value) -> Optional[date]:
+    """
+    Parse a date cell from the import file.
+    
+    Args:
+        value: Cell value (a date, a datetime or a string in a supported format).
+    
+    Returns:
+        The parsed date, or None if the cell is empty or not a valid date.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or "").strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_bool(value, default: bool) -> bool:
+    """
+    Parse a yes/no cell from the import file.
+    
+    Args:
+        value: Cell value.
+        default: Value to use when the cell is empty.
+    
+    Returns:
+        The parsed boolean.
+    """
+    text = str(value if value is not None else "").strip().lower()
+    if not text:
+        return default
+    return text in ("1", "true", "si", "sí", "s", "x", "activo")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point for the bulk import.
+    
+    Args:
+        argv: Command line arguments, defaults to sys.argv.
+    
+    Returns:
+        Process exit code: 0 when every row was accepted, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Importa falleros desde un fichero CSV o XLSX.")
+    parser.add_argument("file", help="Fichero CSV o XLSX con el censo.")
+    parser.add_argument("--dry-run", action="store_true", help="Valida sin insertar nada.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Filas por transacción.")
+    parser.add_argument("--report", help="Ruta del CSV donde guardar las filas rechazadas.")
+    args = parser.parse_args(argv)
+    
+    importer = FalleroImportManager(DatabaseManager(), chunk_size=args.chunk_size)
+    report = importer.import_file(args.file, dry_run=args.dry_run)
+    
+    print(Messages.IMPORT_SUMMARY.format(
+        total=report.total_rows, imported=report.imported, rejected=report.rejected
+    ))
+    if report.errors:
+        if args.report:
+            report.errors_dataframe().to_csv(args.report, index=False)
+        else:
+            print(report.errors_dataframe().to_string(index=False))
+    return 0 if not report.errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,12 +5,37 @@ This module handles all user interface components and interactions
 using Streamlit for the web interface.
 """
 
+import time
+from datetime import date
 import streamlit as st
 import pandas as pd
 from typing import Optional
 
+from config.settings import settings
 from dao.database import DatabaseManager
+from dao.audit_dao import AuditDAO
+from dao.census_dao import ANTIGUEDAD_BANDS
+from dao.concurrency import run_concurrently
+from dao.cuota_dao import CuotaDAO
+from dao.duplicate_dao import DuplicateReviewDAO
+from dao.fallero_dao import FalleroDAO
+from dao.pagination import DEFAULT_PAGE_SIZE, Cursor
+from dao.query_cache import TableVersions
+from dao.read_models import FALLERO_TABLES, FalleroReadModel, UsuarioReadModel, filter_falleros_frame
+from dao.usuario_dao import UsuarioDAO
+from managers.export_manager import ExportFormat, FalleroExportManager, export_file_name
+from managers.census_manager import CensusReport, CensusStatsManager
+from managers.dedup_manager import is_running as dedup_is_running, run_in_background as run_dedup
+from managers.import_manager import FalleroImportManager
+from models.fallero_duplicate import ESTADO_DISTINTOS, ESTADO_DUPLICADO
 from constants.messages import Messages
+from validators import Validators
+from utils.profiler import RequestProfiler, profiled
+
+PAGE_SIZE_OPTIONS = [25, DEFAULT_PAGE_SIZE, 100, 200]
+DUPLICATES_PER_PAGE = 20
+# Session state key of the falleros scope frame used for client-side filtering
+FALLEROS_SCOPE_KEY = "falleros_scope"
 
 
 class UIManager:
@@ -36,6 +61,7 @@ class UIManager:
         )
 
     @staticmethod
+    @profiled("display_sidebar")
     def display_sidebar(username: str, logout_callback) -> str:
         """
         Display the sidebar with navigation menu and user information.
@@ -53,10 +79,20 @@ class UIManager:
             st.title("🔥 Secretaría El Cano")
             return st.radio(
                 Messages.MENU_NAVIGATION,
-                [Messages.MENU_VIEW_FALLEROS, Messages.MENU_ADD_FALLERO, Messages.MENU_VIEW_USERS]
+                [
+                    Messages.MENU_VIEW_FALLEROS,
+                    Messages.MENU_DASHBOARD,
+                    Messages.MENU_CUOTAS,
+                    Messages.MENU_ADD_FALLERO,
+                    Messages.MENU_IMPORT_FALLEROS,
+                    Messages.MENU_REVIEW_DUPLICATES,
+                    Messages.MENU_VIEW_USERS,
+                    Messages.MENU_AUDIT,
+                ]
             )
 
     @staticmethod
+    @profiled("display_falleros_view")
     def display_falleros_view(db_manager: DatabaseManager) -> None:
         """
         Display the falleros list view with filtering capabilities.
@@ -65,7 +101,20 @@ class UIManager:
             db_manager: Database manager for data operations.
         """
         st.header(Messages.FALLEROS_TITLE)
+        UIManager._falleros_listing(db_manager)
+
+    @staticmethod
+    @st.fragment
+    def _falleros_listing(db_manager: DatabaseManager) -> None:
+        """
+        Display the filters, table and pagination of the falleros list.
         
+        Runs as a fragment: changing a filter or a page reruns only this part
+        of the page, not the authentication, sidebar or the rest of the view.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
         with st.expander(Messages.FALLEROS_FILTER_TITLE, expanded=False):
             col1, col2, col3 = st.columns([1, 1, 1])
             with col1:
@@ -79,21 +128,195 @@ class UIManager:
                     key="filtro_estado"
                 )
         
-        falleros = db_manager.get_filtered_falleros(filtro_nombre, filtro_apellidos, filtro_activos)
+        page_size = st.session_state.get("falleros_page_size", DEFAULT_PAGE_SIZE)
+        scope = UIManager._get_falleros_scope(db_manager, filtro_activos)
+        cursores = UIManager._get_page_cursors(
+            "falleros", (filtro_nombre, filtro_apellidos, filtro_activos, page_size, scope is None)
+        )
+        if scope is not None:
+            # Text filters narrow the cached scope without querying the database
+            filtrados = filter_falleros_frame(scope, filtro_nombre, filtro_apellidos)
+            offset = cursores[-1] or 0
+            df_falleros = FalleroReadModel.scope_page(filtrados, offset, page_size)
+            total = len(filtrados)
+            next_cursor = offset + page_size if offset + page_size < total else None
+        else:
+            page = FalleroReadModel(db_manager).page(
+                filtro_nombre, filtro_apellidos, filtro_activos,
+                cursor=cursores[-1], page_size=page_size, with_total=True
+            )
+            df_falleros = FalleroReadModel.to_frame(page.items)
+            total, next_cursor = page.total, page.next_cursor
         
-        if not falleros:
+        if df_falleros.empty:
             st.info(Messages.FALLEROS_NOT_FOUND)
         else:
-            df_falleros = pd.DataFrame([vars(f) for f in falleros])
-            df_falleros = df_falleros.drop(columns=['_sa_instance_state'], errors='ignore')
-            
             with st.container():
                 st.dataframe(df_falleros, use_container_width=True, hide_index=True)
                 UIManager.set_responsive_layout()
             
             st.write(Messages.FALLEROS_TOTAL_SHOWN.format(count=len(df_falleros)))
+        
+        UIManager._display_pagination_controls(
+            "falleros", cursores, next_cursor,
+            Messages.FALLEROS_PAGE_INFO.format(page=len(cursores), total=total)
+        )
+        
+        UIManager._display_export_section(
+            db_manager, nombre=filtro_nombre, apellidos=filtro_apellidos, estado=filtro_activos
+        )
+
+    @staticmethod
+    def _get_falleros_scope(db_manager: DatabaseManager, estado: str) -> Optional[pd.DataFrame]:
+        """
+        Get the falleros of the selected status for client-side filtering.
+        
+        The scope frame is kept in the session, so typing in the text filters
+        never queries the database (Streamlit only reruns on Enter or blur,
+        so there are no keystrokes to debounce). The debounce applies to
+        writes instead: when other sessions write falleros, the scope is
+        reloaded at most once every AppConfig.scope_debounce_seconds, so a
+        burst of altas elsewhere does not reload it on every rerun. Writes
+        made by this session call _discard_falleros_scope(), so they always
+        show on the next rerun.
+        
+        Args:
+            db_manager: Database manager for data operations.
+            estado: Selected status filter.
+            
+        Returns:
+            The scope frame, or None if the scope is too large to filter in
+            memory and the listing must be paginated in the database.
+        """
+        config = settings.get_app_config()
+        version = TableVersions.get(FALLERO_TABLES)
+        now = time.monotonic()
+        cached = st.session_state.get(FALLEROS_SCOPE_KEY)
+        if cached is not None and cached["estado"] == estado and (
+            cached["version"] == version
+            or now - cached["loaded_at"] < config.scope_debounce_seconds
+        ):
+            return cached["frame"]
+        
+        frame = FalleroReadModel(db_manager).scope(estado, config.client_filter_max_rows)
+        st.session_state[FALLEROS_SCOPE_KEY] = {
+            "estado": estado, "version": version, "loaded_at": now, "frame": frame
+        }
+        return frame
+
+    @staticmethod
+    def _discard_falleros_scope() -> None:
+        """Drop the session's scope frame after this session wrote falleros."""
+        st.session_state.pop(FALLEROS_SCOPE_KEY, None)
+
+    @staticmethod
+    @st.fragment
+    def _display_export_section(db_manager: DatabaseManager, **filtros) -> None:
+        """
+        Display the census export controls for the current filters.
+        
+        The export is streamed to a temporary file on disk and then offered
+        through a download button, so the table is never built in memory.
+        Runs as a fragment nested in the listing, so preparing an export does
+        not reload the table.
+        
+        Args:
+            db_manager: Database manager for data operations.
+            **filtros: Fallero filters currently applied to the listing.
+        """
+        with st.expander(Messages.EXPORT_TITLE, expanded=False):
+            col1, col2 = st.columns([1, 1])
+            with col1:
+                formato = st.selectbox(
+                    Messages.EXPORT_FORMAT, ExportFormat.available(), key="export_formato"
+                )
+            with col2:
+                prepare = st.button(Messages.EXPORT_PREPARE, key="export_prepare")
+            
+            if prepare:
+                previous = st.session_state.pop("export_fichero", None)
+                if previous is not None:
+                    previous.delete()
+                try:
+                    st.session_state["export_fichero"] = FalleroExportManager(
+                        db_manager
+                    ).export_to_tempfile(formato, **filtros)
+                except Exception as e:
+                    st.error(Messages.EXPORT_ERROR.format(error=str(e)))
+            
+            export = st.session_state.get("export_fichero")
+            if export is not None and export.exists:
+                # The file is only opened when the button is clicked, and stays
+                # until the next export; "ignore" keeps the click from rerunning
+                # the listing
+                st.download_button(
+                    Messages.EXPORT_DOWNLOAD.format(count=export.rows),
+                    data=export.open,
+                    file_name=export_file_name(export.formato),
+                    mime=ExportFormat.MIME_TYPES[export.formato],
+                    key="export_download",
+                    on_click="ignore",
+                )
+
+    @staticmethod
+    def _get_page_cursors(view_key: str, filtros: tuple) -> list:
+        """
+        Get the stack of page-start cursors for a paginated view.
+        
+        The stack is reset to the first page whenever the filters change.
+        
+        Args:
+            view_key: Prefix for the session state keys of the view.
+            filtros: Current filter values (including the page size).
+            
+        Returns:
+            List of cursors, one per visited page; the last one is the current page.
+        """
+        if st.session_state.get(f"{view_key}_filtros") != filtros:
+            st.session_state[f"{view_key}_filtros"] = filtros
+            st.session_state[f"{view_key}_cursores"] = [None]
+        return st.session_state[f"{view_key}_cursores"]
+
+    @staticmethod
+    def _display_pagination_controls(view_key: str, cursores: list,
+                                     next_cursor: Optional[Cursor], info: str) -> None:
+        """
+        Display previous/next buttons and the page size selector of a paginated view.
+        
+        Args:
+            view_key: Prefix for the session state keys of the view.
+            cursores: Stack of page-start cursors returned by _get_page_cursors.
+            next_cursor: Cursor for the following page, or None on the last page.
+            info: Page information text to show between the buttons.
+        """
+        col1, col2, col3, col4 = st.columns([1, 2, 1, 1])
+        with col1:
+            st.button(
+                Messages.PAGINATION_PREVIOUS,
+                key=f"{view_key}_prev_page",
+                disabled=len(cursores) <= 1,
+                on_click=cursores.pop,
+            )
+        with col2:
+            st.caption(info)
+        with col3:
+            st.button(
+                Messages.PAGINATION_NEXT,
+                key=f"{view_key}_next_page",
+                disabled=next_cursor is None,
+                on_click=cursores.append,
+                args=(next_cursor,),
+            )
+        with col4:
+            st.selectbox(
+                Messages.PAGINATION_PAGE_SIZE,
+                PAGE_SIZE_OPTIONS,
+                index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE),
+                key=f"{view_key}_page_size",
+            )
 
     @staticmethod
+    @profiled("display_add_fallero_view")
     def display_add_fallero_view(db_manager: DatabaseManager) -> None:
         """
         Display the form for adding a new fallero.
@@ -103,7 +326,17 @@ class UIManager:
         """
         UIManager.set_responsive_layout()
         st.header(Messages.ADD_FALLERO_TITLE)
+        UIManager._add_fallero_form(db_manager)
+
+    @staticmethod
+    @st.fragment
+    def _add_fallero_form(db_manager: DatabaseManager) -> None:
+        """
+        Display the add fallero form; submitting it reruns only this fragment.
         
+        Args:
+            db_manager: Database manager for data operations.
+        """
         with st.form("add_fallero_form", clear_on_submit=True):
             col1, col2 = st.columns([1, 1])
             with col1:
@@ -137,11 +370,388 @@ class UIManager:
                             dni=dni.strip().upper(),
                             fecha_nacimiento=fecha_nacimiento
                         )
+                        UIManager._discard_falleros_scope()
                         st.success(Messages.ADD_FALLERO_SUCCESS)
                     except Exception as e:
                         st.error(Messages.DB_ERROR_INSERT_FALLERO.format(error=str(e)))
 
     @staticmethod
+    @profiled("display_import_falleros_view")
+    def display_import_falleros_view(db_manager: DatabaseManager) -> None:
+        """
+        Display the bulk import form for loading falleros from a CSV/XLSX file.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        UIManager.set_responsive_layout()
+        st.header(Messages.IMPORT_TITLE)
+        UIManager._import_falleros_form(db_manager)
+
+    @staticmethod
+    @st.fragment
+    def _import_falleros_form(db_manager: DatabaseManager) -> None:
+        """
+        Display the import form and its report; submitting it reruns only this fragment.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        with st.form("import_falleros_form"):
+            fichero = st.file_uploader(
+                Messages.IMPORT_FILE,
+                type=["csv", "xlsx"],
+                help=Messages.IMPORT_FILE_HELP,
+                key="import_falleros_file"
+            )
+            dry_run = st.checkbox(Messages.IMPORT_DRY_RUN, value=True, key="import_falleros_dry_run")
+            submitted = st.form_submit_button(Messages.IMPORT_SUBMIT)
+        
+        if not submitted or fichero is None:
+            return
+        
+        try:
+            report = FalleroImportManager(db_manager).import_file(
+                fichero, file_name=fichero.name, dry_run=dry_run
+            )
+        except Exception as e:
+            st.error(Messages.DB_ERROR_IMPORT.format(error=str(e)))
+            return
+        
+        if not report.dry_run:
+            UIManager._discard_falleros_scope()
+        st.success(Messages.IMPORT_DRY_RUN_DONE if report.dry_run else Messages.IMPORT_SUCCESS)
+        st.write(Messages.IMPORT_SUMMARY.format(
+            total=report.total_rows, imported=report.imported, rejected=report.rejected
+        ))
+        
+        if report.errors:
+            df_errores = report.errors_dataframe()
+            st.subheader(Messages.IMPORT_ERRORS_TITLE)
+            st.dataframe(df_errores, use_container_width=True, hide_index=True)
+            st.download_button(
+                Messages.IMPORT_ERRORS_DOWNLOAD,
+                data=df_errores.to_csv(index=False).encode("utf-8"),
+                file_name="errores_importacion.csv",
+                mime="text/csv",
+            )
+
+    @staticmethod
+    @profiled("display_dashboard_view")
+    def display_dashboard_view(db_manager: DatabaseManager) -> None:
+        """
+        Display the census headcounts from the precomputed summary table.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        UIManager.set_responsive_layout()
+        st.header(Messages.DASHBOARD_TITLE)
+        UIManager._dashboard_content(db_manager)
+
+    @staticmethod
+    @st.fragment
+    def _dashboard_content(db_manager: DatabaseManager) -> None:
+        """
+        Display the census headcounts; the refresh button reruns only this fragment.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        stats = CensusStatsManager(db_manager)
+        if st.button(Messages.DASHBOARD_REFRESH, key="dashboard_refresh_btn",
+                     help=Messages.DASHBOARD_REFRESH_HELP):
+            report = stats.refresh()
+        else:
+            report = stats.report()
+        
+        activos, inactivos = report.totals()
+        if activos + inactivos == 0:
+            st.info(Messages.DASHBOARD_EMPTY)
+            return
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric(Messages.DASHBOARD_TOTAL, activos + inactivos)
+        col2.metric(Messages.FALLEROS_STATUS_ACTIVE, activos)
+        col3.metric(Messages.FALLEROS_STATUS_INACTIVE, inactivos)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader(Messages.DASHBOARD_BY_AGE)
+            st.bar_chart(UIManager._dashboard_frame(report, "edad", ["infantil", "adulto"]))
+        with col2:
+            st.subheader(Messages.DASHBOARD_BY_ANTIGUEDAD)
+            bands = [label for _, label in reversed(ANTIGUEDAD_BANDS)]
+            st.bar_chart(UIManager._dashboard_frame(report, "antiguedad", bands))
+        
+        st.subheader(Messages.DASHBOARD_BY_ALTA_YEAR)
+        st.bar_chart(UIManager._dashboard_frame(report, "anio_alta"))
+        
+        if report.refreshed_at:
+            st.caption(Messages.DASHBOARD_REFRESHED_AT.format(refreshed_at=report.refreshed_at))
+
+    @staticmethod
+    def _dashboard_frame(report: CensusReport, dimension: str, order: Optional[list] = None) -> pd.DataFrame:
+        """Build the chart data of a dimension, with one column per status."""
+        frame = report.by_dimension(dimension).rename(columns={
+            True: Messages.FALLEROS_STATUS_ACTIVE, False: Messages.FALLEROS_STATUS_INACTIVE
+        })
+        if order is not None:
+            frame = frame.reindex(order, fill_value=0)
+        return frame
+
+    @staticmethod
+    @profiled("display_cuotas_view")
+    def display_cuotas_view(db_manager: DatabaseManager) -> None:
+        """
+        Display the cuotas of an ejercicio: totals, fee schedule, payments and morosos.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        UIManager.set_responsive_layout()
+        st.header(Messages.CUOTAS_TITLE)
+        ejercicio = int(st.number_input(
+            Messages.CUOTAS_EJERCICIO, min_value=2000, max_value=2100,
+            value=date.today().year, step=1, key="cuotas_ejercicio"
+        ))
+        UIManager._cuotas_content(db_manager, ejercicio)
+
+    @staticmethod
+    @st.fragment
+    def _cuotas_content(db_manager: DatabaseManager, ejercicio: int) -> None:
+        """
+        Display the cuotas of an ejercicio; every action reruns only this fragment.
+        
+        Args:
+            db_manager: Database manager for data operations.
+            ejercicio: Year the ejercicio starts in.
+        """
+        cuota_dao = CuotaDAO(db_manager)
+        usuario = st.session_state.get("username")
+        
+        with st.expander(Messages.CUOTAS_TARIFAS_TITLE, expanded=False):
+            st.caption(Messages.CUOTAS_TARIFAS_HELP)
+            tarifas = st.data_editor(
+                pd.DataFrame(
+                    [(edad, importe / 100) for edad, importe in cuota_dao.get_tarifas(ejercicio).items()],
+                    columns=[Messages.CUOTAS_EDAD_DESDE, Messages.CUOTAS_IMPORTE],
+                ).astype({Messages.CUOTAS_EDAD_DESDE: "int64", Messages.CUOTAS_IMPORTE: "float64"}),
+                num_rows="dynamic",
+                hide_index=True,
+                key=f"cuotas_tarifas_{ejercicio}",
+            )
+            col1, col2 = st.columns(2)
+            if col1.button(Messages.CUOTAS_TARIFAS_SAVE, key="cuotas_tarifas_save"):
+                try:
+                    cuota_dao.set_tarifas(ejercicio, {
+                        int(edad): round(importe * 100)
+                        for edad, importe in tarifas.dropna().itertuples(index=False)
+                    })
+                    st.success(Messages.CUOTAS_TARIFAS_SAVED)
+                except Exception as e:
+                    st.error(Messages.CUOTAS_ERROR.format(error=str(e)))
+            if col2.button(Messages.CUOTAS_GENERATE, key="cuotas_generate",
+                           help=Messages.CUOTAS_GENERATE_HELP):
+                if not cuota_dao.get_tarifas(ejercicio):
+                    st.warning(Messages.CUOTAS_NO_TARIFAS)
+                else:
+                    generados = cuota_dao.generar_cargos(ejercicio, registrado_por=usuario)
+                    st.success(Messages.CUOTAS_GENERATED.format(count=generados))
+        
+        with st.expander(Messages.CUOTAS_PAYMENT_TITLE, expanded=False):
+            with st.form("cuotas_payment_form", clear_on_submit=True):
+                col1, col2 = st.columns(2)
+                dni = col1.text_input(Messages.CUOTAS_PAYMENT_DNI, max_chars=12, key="cuotas_payment_dni")
+                importe = col2.number_input(Messages.CUOTAS_PAYMENT_AMOUNT, min_value=0.0, step=5.0,
+                                            format="%.2f", key="cuotas_payment_amount")
+                submitted = st.form_submit_button(Messages.CUOTAS_PAYMENT_SUBMIT)
+            if submitted:
+                fallero = FalleroDAO(db_manager).get_fallero_por_dni(dni)
+                if fallero is None:
+                    st.error(Messages.CUOTAS_PAYMENT_NOT_FOUND)
+                elif importe <= 0:
+                    st.error(Messages.CUOTAS_PAYMENT_INVALID_AMOUNT)
+                else:
+                    try:
+                        cuota_dao.registrar_pago(fallero.id, ejercicio, round(importe * 100),
+                                                 registrado_por=usuario)
+                        st.success(Messages.CUOTAS_PAYMENT_SUCCESS.format(
+                            nombre=fallero.full_name,
+                            saldo=UIManager._format_euros(cuota_dao.saldo(fallero.id)),
+                        ))
+                    except Exception as e:
+                        st.error(Messages.CUOTAS_ERROR.format(error=str(e)))
+        
+        col1, col2, col3 = st.columns(3)
+        st.subheader(Messages.CUOTAS_MOROSOS_TITLE)
+        historico = st.checkbox(Messages.CUOTAS_MOROSOS_ALL_YEARS, key="cuotas_morosos_historico")
+        page_size = st.session_state.get("morosos_page_size", DEFAULT_PAGE_SIZE)
+        cursores = UIManager._get_page_cursors("morosos", (ejercicio, historico, page_size))
+        
+        # The totals and the morosos page are independent, so they are read together
+        results = run_concurrently({
+            "resumen": lambda: cuota_dao.resumen(ejercicio),
+            "morosos": lambda: cuota_dao.morosos(
+                None if historico else ejercicio, cursor=cursores[-1], page_size=page_size,
+                with_total=True
+            ),
+        })
+        cargado, cobrado = results["resumen"]
+        col1.metric(Messages.CUOTAS_CHARGED, UIManager._format_euros(cargado))
+        col2.metric(Messages.CUOTAS_PAID, UIManager._format_euros(cobrado))
+        col3.metric(Messages.CUOTAS_PENDING, UIManager._format_euros(cargado - cobrado))
+        
+        page = results["morosos"]
+        if not page.items:
+            st.info(Messages.CUOTAS_MOROSOS_EMPTY)
+        else:
+            st.dataframe(
+                pd.DataFrame({
+                    "nombre": [row.nombre for row in page.items],
+                    "apellidos": [row.apellidos for row in page.items],
+                    "dni": [row.dni for row in page.items],
+                    "activo": [row.activo for row in page.items],
+                    Messages.CUOTAS_PENDING: [UIManager._format_euros(row.pendiente) for row in page.items],
+                }),
+                use_container_width=True,
+                hide_index=True,
+            )
+        UIManager._display_pagination_controls(
+            "morosos", cursores, page.next_cursor,
+            Messages.CUOTAS_MOROSOS_PAGE_INFO.format(page=len(cursores), total=page.total)
+        )
+
+    @staticmethod
+    def _format_euros(centimos: int) -> str:
+        """Format an amount in céntimos the Spanish way ("1.234,50 €")."""
+        texto = f"{centimos / 100:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+        return f"{texto} €"
+
+    @staticmethod
+    @profiled("display_audit_view")
+    def display_audit_view(db_manager: DatabaseManager) -> None:
+        """
+        Display the audit trail, newest changes first.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        UIManager.set_responsive_layout()
+        st.header(Messages.AUDIT_TITLE)
+        UIManager._audit_listing(db_manager)
+
+    @staticmethod
+    @st.fragment
+    def _audit_listing(db_manager: DatabaseManager) -> None:
+        """
+        Display the audit filters and the current page; paging reruns only this fragment.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        audit_dao = AuditDAO(db_manager)
+        col1, col2, col3 = st.columns(3)
+        entidad = col1.selectbox(
+            Messages.AUDIT_FILTER_ENTIDAD, [Messages.AUDIT_ALL] + audit_dao.entidades(),
+            key="audit_entidad"
+        )
+        entidad = None if entidad == Messages.AUDIT_ALL else entidad
+        entidad_id = col2.text_input(Messages.AUDIT_FILTER_ENTIDAD_ID, key="audit_entidad_id",
+                                     disabled=entidad is None).strip()
+        usuario = col3.text_input(Messages.AUDIT_FILTER_USUARIO, key="audit_usuario").strip()
+        
+        page_size = st.session_state.get("audit_page_size", DEFAULT_PAGE_SIZE)
+        cursores = UIManager._get_page_cursors("audit", (entidad, entidad_id, usuario, page_size))
+        page = audit_dao.page(
+            entidad, entidad_id or None, usuario or None, cursor=cursores[-1],
+            page_size=page_size, with_total=True
+        )
+        if not page.items:
+            st.info(Messages.AUDIT_EMPTY)
+        else:
+            st.dataframe(
+                pd.DataFrame({
+                    "fecha": [row.occurred_at for row in page.items],
+                    "usuario": [row.usuario for row in page.items],
+                    "acción": [Messages.AUDIT_ACTIONS.get(row.accion, row.accion) for row in page.items],
+                    "tabla": [row.entidad for row in page.items],
+                    "id": [row.entidad_id for row in page.items],
+                    "cambios": [row.cambios for row in page.items],
+                }),
+                use_container_width=True,
+                hide_index=True,
+            )
+        UIManager._display_pagination_controls(
+            "audit", cursores, page.next_cursor,
+            Messages.AUDIT_PAGE_INFO.format(page=len(cursores), total=page.total)
+        )
+
+    @staticmethod
+    @profiled("display_duplicates_view")
+    def display_duplicates_view(db_manager: DatabaseManager) -> None:
+        """
+        Display the review queue of possible duplicate falleros.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        UIManager.set_responsive_layout()
+        st.header(Messages.DEDUP_TITLE)
+        UIManager._duplicates_queue(db_manager)
+
+    @staticmethod
+    @st.fragment
+    def _duplicates_queue(db_manager: DatabaseManager) -> None:
+        """
+        Display the review queue; resolving a pair reruns only this fragment.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
+        if st.button(Messages.DEDUP_RUN, key="dedup_run_btn", help=Messages.DEDUP_RUN_HELP,
+                     disabled=dedup_is_running()):
+            if run_dedup(db_manager):
+                st.info(Messages.DEDUP_RUN_STARTED)
+            else:
+                st.warning(Messages.DEDUP_RUN_IN_PROGRESS)
+        elif dedup_is_running():
+            st.info(Messages.DEDUP_RUN_IN_PROGRESS)
+        
+        review_dao = DuplicateReviewDAO(db_manager)
+        st.write(Messages.DEDUP_PENDING_COUNT.format(count=review_dao.pending_count()))
+        pares = review_dao.pending(limit=DUPLICATES_PER_PAGE)
+        if not pares:
+            st.info(Messages.DEDUP_EMPTY)
+            return
+        
+        usuario = st.session_state.get("username")
+        for par in pares:
+            with st.container(border=True):
+                st.markdown(Messages.DEDUP_SCORE.format(
+                    score=par.score, name=par.name_score, dni=par.dni_score, date=par.date_score
+                ))
+                st.dataframe(
+                    pd.DataFrame({
+                        Messages.DEDUP_FIELD: ["Nombre", "Apellidos", "DNI/NIE", "Fecha de nacimiento"],
+                        f"#{par.id_a}": [par.nombre_a, par.apellidos_a, par.dni_a, str(par.fecha_nacimiento_a)],
+                        f"#{par.id_b}": [par.nombre_b, par.apellidos_b, par.dni_b, str(par.fecha_nacimiento_b)],
+                    }),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+                col1, col2 = st.columns(2)
+                col1.button(
+                    Messages.DEDUP_SAME_PERSON, key=f"dedup_same_{par.id}",
+                    on_click=review_dao.resolve, args=(par.id, ESTADO_DUPLICADO, usuario)
+                )
+                col2.button(
+                    Messages.DEDUP_DIFFERENT, key=f"dedup_different_{par.id}",
+                    on_click=review_dao.resolve, args=(par.id, ESTADO_DISTINTOS, usuario)
+                )
+
+    @staticmethod
+    @profiled("display_usuarios_view")
     def display_usuarios_view(db_manager: DatabaseManager) -> None:
         """
         Display the users list view with filtering capabilities.
@@ -151,10 +761,21 @@ class UIManager:
         """
         UIManager.set_responsive_layout()
         st.header(Messages.USERS_TITLE)
+        UIManager._add_usuario_section(db_manager)
+        UIManager._usuarios_listing(db_manager)
 
+    @staticmethod
+    @st.fragment
+    def _usuarios_listing(db_manager: DatabaseManager) -> None:
+        """
+        Display the filters and table of the users list; filtering reruns only this fragment.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
         # Filters
         with st.expander(Messages.USERS_FILTER_TITLE, expanded=False):
-            col1, col2, col3 = st.columns([1, 1, 1])
+            col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
             with col1:
                 filtro_nombre = st.text_input(Messages.USERS_FILTER_USERNAME, key="filtro_usuario_nombre")
             with col2:
@@ -165,8 +786,45 @@ class UIManager:
                     [Messages.FALLEROS_STATUS_ALL, Messages.FALLEROS_STATUS_ACTIVE, Messages.FALLEROS_STATUS_INACTIVE], 
                     key="filtro_usuario_estado"
                 )
+            with col4:
+                orden = st.selectbox(
+                    Messages.USERS_SORT,
+                    list(Messages.USERS_SORT_OPTIONS),
+                    format_func=Messages.USERS_SORT_OPTIONS.get,
+                    key="orden_usuarios"
+                )
+
+        # One page of users, filtered and sorted by the database
+        page_size = st.session_state.get("usuarios_page_size", DEFAULT_PAGE_SIZE)
+        cursores = UIManager._get_page_cursors(
+            "usuarios", (filtro_nombre, filtro_email, filtro_activo, orden, page_size)
+        )
+        page = UsuarioDAO(db_manager).buscar_usuarios(
+            filtro_nombre, filtro_email, filtro_activo, orden=orden,
+            cursor=cursores[-1], page_size=page_size, with_total=True
+        )
+
+        if not page.items:
+            st.info(Messages.USERS_NOT_FOUND)
+        else:
+            df_usuarios = UsuarioReadModel.to_frame(page.items)
+            st.dataframe(df_usuarios, use_container_width=True, hide_index=True)
+            st.write(Messages.USERS_TOTAL_SHOWN.format(count=len(df_usuarios)))
+
+        UIManager._display_pagination_controls(
+            "usuarios", cursores, page.next_cursor,
+            Messages.USERS_PAGE_INFO.format(page=len(cursores), total=page.total)
+        )
 
-        # Add user button
+    @staticmethod
+    @st.fragment
+    def _add_usuario_section(db_manager: DatabaseManager) -> None:
+        """
+        Display the add user button and popover; using them reruns only this fragment.
+        
+        Args:
+            db_manager: Database manager for data operations.
+        """
         st.markdown(
             """
             <style>
@@ -178,50 +836,32 @@ class UIManager:
         if st.button("➕", key="add_user_btn", help=Messages.USERS_ADD_BUTTON_HELP, use_container_width=False):
             st.session_state["show_add_user_popup"] = True
 
-        # Get and filter users
-        usuarios = db_manager.get_all_users()
-        usuarios_filtrados = UIManager._filter_users(usuarios, filtro_nombre, filtro_email, filtro_activo)
-
-        if not usuarios_filtrados:
-            st.info(Messages.USERS_NOT_FOUND)
-        else:
-            df_usuarios = pd.DataFrame([vars(u) for u in usuarios_filtrados])
-            if "_sa_instance_state" in df_usuarios.columns:
-                df_usuarios = df_usuarios.drop(columns=['_sa_instance_state'])
-            st.dataframe(df_usuarios, use_container_width=True, hide_index=True)
-            st.write(Messages.USERS_TOTAL_SHOWN.format(count=len(df_usuarios)))
-
-        # Popup for adding user
         if st.session_state.get("show_add_user_popup", False):
             UIManager._display_add_usuario_popup(db_manager)
 
     @staticmethod
-    def _filter_users(usuarios, filtro_nombre: Optional[str], filtro_email: Optional[str], 
-                     filtro_activo: Optional[str]) -> list:
+    def display_profiler_panel(profiler: RequestProfiler) -> None:
         """
-        Filter users based on provided criteria.
+        Display the timing of the current rerun in a sidebar debug panel.
         
         Args:
-            usuarios: List of users to filter.
-            filtro_nombre: Name filter.
-            filtro_email: Email filter.
-            filtro_activo: Status filter.
-            
-        Returns:
-            Filtered list of users.
-        """
-        usuarios_filtrados = []
-        for u in usuarios:
-            if filtro_nombre and filtro_nombre.lower() not in (u.nombre or "").lower():
-                continue
-            if filtro_email and filtro_email.lower() not in (u.email or "").lower():
-                continue
-            if filtro_activo == Messages.FALLEROS_STATUS_ACTIVE and not getattr(u, "activo", True):
-                continue
-            if filtro_activo == Messages.FALLEROS_STATUS_INACTIVE and getattr(u, "activo", True):
-                continue
-            usuarios_filtrados.append(u)
-        return usuarios_filtrados
+            profiler: Profile collected during the rerun.
+        """
+        with st.sidebar.expander(Messages.PROFILER_TITLE, expanded=False):
+            st.write(Messages.PROFILER_TOTAL.format(ms=profiler.total_seconds * 1000))
+            st.write(Messages.PROFILER_SQL.format(
+                count=profiler.sql_count, ms=profiler.sql_seconds * 1000
+            ))
+            st.dataframe(
+                pd.DataFrame.from_records(
+                    [(name, round(seconds * 1000, 1)) for name, seconds in profiler.phases],
+                    columns=["fase", "ms"],
+                ),
+                use_container_width=True,
+                hide_index=True,
+            )
+            if profiler.dump_path:
+                st.caption(Messages.PROFILER_DUMP.format(path=profiler.dump_path))
 
     @staticmethod
     def _display_add_usuario_popup(db_manager: DatabaseManager) -> None:
@@ -269,12 +909,12 @@ class UIManager:
             List of validation error messages.
         """
         errores = []
-        if not nombre.strip():
-            errores.append(Messages.VALIDATION_NAME_REQUIRED)
-        if not apellidos.strip():
-            errores.append(Messages.VALIDATION_SURNAME_REQUIRED)
-        if not dni.strip() or len(dni) != 9 or not dni[:8].isdigit() or not dni[8].isalpha():
-            errores.append(Messages.VALIDATION_DNI_INVALID)
+        for result in (
+            Validators.validate_name(nombre, "nombre"),
+            Validators.validate_name(apellidos, "apellidos"),
+            Validators.validate_dni(dni),
+        ):
+            errores.extend(result.errors)
         return errores
 
     @staticmethod
@@ -0,0 +1,49 @@
+"""Baseline schema: Fallero and Usuario
+
+These are exactly the tables of the databases created with create_all
+before migrations existed, which dao.schema.upgrade_schema stamps with
+this revision. Later tables belong in later revisions.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "Fallero",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("nombre", sa.String(length=100), nullable=False),
+        sa.Column("apellidos", sa.String(length=255), nullable=False),
+        sa.Column("dni", sa.String(length=20), nullable=False),
+        sa.Column("fecha_nacimiento", sa.Date(), nullable=False),
+        sa.Column("fecha_alta", sa.Date(), nullable=False),
+        sa.Column("activo", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("dni"),
+    )
+    op.create_table(
+        "Usuario",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("nombre", sa.String(length=255), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("activo", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("Usuario")
+    op.drop_table("Fallero")
@@ -0,0 +1,40 @@
+"""Name search index table
+
+Earlier versions of the 0001 baseline created this table, so databases
+stamped or migrated with them already have it and it is only created
+when missing.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001a"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("FalleroSearchToken"):
+        return
+    op.create_table(
+        "FalleroSearchToken",
+        sa.Column("fallero_id", sa.Integer(), nullable=False),
+        sa.Column("campo", sa.String(length=20), nullable=False),
+        sa.Column("token", sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(["fallero_id"], ["Fallero.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("fallero_id", "campo", "token"),
+    )
+    op.create_index(
+        "ix_fallero_search_token_campo_token", "FalleroSearchToken", ["campo", "token"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fallero_search_token_campo_token", table_name="FalleroSearchToken")
+    op.drop_table("FalleroSearchToken")
@@ -0,0 +1,52 @@
+"""Indexes for the falleros and users listings
+
+On MySQL the indexes are built with ALGORITHM=INPLACE, LOCK=NONE so the
+tables stay readable and writable while they are created. Indexes that
+already exist (tables created with create_all from models declaring them)
+are left as they are.
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-17
+"""
+
+from typing import List
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001a"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_fallero_activo_apellidos_nombre", "Fallero", ["activo", "apellidos", "nombre"]),
+    ("ix_fallero_apellidos_nombre", "Fallero", ["apellidos", "nombre"]),
+    ("ix_fallero_fecha_alta", "Fallero", ["fecha_alta"]),
+    ("ix_usuario_activo_nombre", "Usuario", ["activo", "nombre"]),
+)
+
+
+def _create_index(name: str, table: str, columns: List[str]) -> None:
+    """Create an index without rebuilding or locking the table on MySQL."""
+    if op.get_bind().dialect.name == "mysql":
+        column_list = ", ".join(f"`{column}`" for column in columns)
+        op.execute(
+            f"CREATE INDEX `{name}` ON `{table}` ({column_list}) ALGORITHM=INPLACE LOCK=NONE"
+        )
+    else:
+        op.create_index(name, table, columns)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            _create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
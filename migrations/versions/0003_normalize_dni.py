@@ -0,0 +1,49 @@
+"""Store every Fallero DNI/NIE in canonical form
+
+Values that would collide with an existing canonical DNI are left as they
+are and logged, so they can be merged by hand.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+from validators.identity import normalize_identity
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+fallero = sa.table("Fallero", sa.column("id", sa.Integer), sa.column("dni", sa.String))
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(fallero.c.id, fallero.c.dni)).all()
+    taken = {dni for _, dni in rows}
+    for fallero_id, dni in rows:
+        canonical = normalize_identity(dni)
+        if canonical == dni:
+            continue
+        if canonical in taken:
+            logger.warning(f"Fallero {fallero_id}: DNI {dni!r} duplicates {canonical!r}, not normalized")
+            continue
+        connection.execute(
+            sa.update(fallero).where(fallero.c.id == fallero_id).values(dni=canonical)
+        )
+        taken.discard(dni)
+        taken.add(canonical)
+
+
+def downgrade() -> None:
+    # The original spelling of the identifiers is not kept
+    pass
@@ -0,0 +1,44 @@
+"""Review queue of possible duplicate falleros
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "FalleroDuplicateCandidate",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("fallero_id_a", sa.Integer(), nullable=False),
+        sa.Column("fallero_id_b", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("name_score", sa.Float(), nullable=False),
+        sa.Column("dni_score", sa.Float(), nullable=False),
+        sa.Column("date_score", sa.Float(), nullable=False),
+        sa.Column("estado", sa.String(length=20), nullable=False),
+        sa.Column("detected_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("resolved_at", sa.DateTime(), nullable=True),
+        sa.Column("resolved_by", sa.String(length=255), nullable=True),
+        sa.ForeignKeyConstraint(["fallero_id_a"], ["Fallero.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["fallero_id_b"], ["Fallero.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("fallero_id_a", "fallero_id_b", name="uq_fallero_duplicate_pair"),
+    )
+    op.create_index(
+        "ix_fallero_duplicate_estado_score", "FalleroDuplicateCandidate", ["estado", "score"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fallero_duplicate_estado_score", table_name="FalleroDuplicateCandidate")
+    op.drop_table("FalleroDuplicateCandidate")
@@ -0,0 +1,31 @@
+"""Summary table of the census dashboard
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "CensusSummary",
+        sa.Column("dimension", sa.String(length=20), nullable=False),
+        sa.Column("bucket", sa.String(length=50), nullable=False),
+        sa.Column("activo", sa.Boolean(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("dimension", "bucket", "activo"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("CensusSummary")
@@ -0,0 +1,31 @@
+"""Index for the users listing filtered by name prefix
+
+The users view filters by name prefix across both statuses and sorts by
+name, which ix_usuario_activo_nombre cannot serve. Email prefixes already
+use the unique index on Usuario.email.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "mysql":
+        op.execute(
+            "CREATE INDEX `ix_usuario_nombre` ON `Usuario` (`nombre`) ALGORITHM=INPLACE LOCK=NONE"
+        )
+    else:
+        op.create_index("ix_usuario_nombre", "Usuario", ["nombre"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_usuario_nombre", table_name="Usuario")
@@ -0,0 +1,57 @@
+"""Cuota fee schedule and ledger
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "CuotaTarifa",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("ejercicio", sa.Integer(), nullable=False),
+        sa.Column("edad_desde", sa.Integer(), nullable=False),
+        sa.Column("importe", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("ejercicio", "edad_desde", name="uq_cuota_tarifa_band"),
+    )
+    op.create_table(
+        "CuotaMovimiento",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("fallero_id", sa.Integer(), nullable=False),
+        sa.Column("ejercicio", sa.Integer(), nullable=False),
+        sa.Column("tipo", sa.String(length=10), nullable=False),
+        sa.Column("concepto", sa.String(length=255), nullable=False),
+        sa.Column("importe", sa.Integer(), nullable=False),
+        sa.Column("ejercicio_cargo", sa.Integer(), nullable=True),
+        sa.Column("fecha", sa.Date(), nullable=False),
+        sa.Column("registrado_por", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["fallero_id"], ["Fallero.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("fallero_id", "ejercicio_cargo", name="uq_cuota_movimiento_cargo"),
+    )
+    op.create_index(
+        "ix_cuota_movimiento_fallero_ejercicio", "CuotaMovimiento",
+        ["fallero_id", "ejercicio", "importe"]
+    )
+    op.create_index(
+        "ix_cuota_movimiento_ejercicio_tipo", "CuotaMovimiento", ["ejercicio", "tipo", "importe"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cuota_movimiento_ejercicio_tipo", table_name="CuotaMovimiento")
+    op.drop_index("ix_cuota_movimiento_fallero_ejercicio", table_name="CuotaMovimiento")
+    op.drop_table("CuotaMovimiento")
+    op.drop_table("CuotaTarifa")
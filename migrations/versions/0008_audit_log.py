@@ -0,0 +1,37 @@
+"""Append-only audit trail
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "AuditLog",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+        sa.Column("usuario", sa.String(length=255), nullable=True),
+        sa.Column("accion", sa.String(length=20), nullable=False),
+        sa.Column("entidad", sa.String(length=64), nullable=False),
+        sa.Column("entidad_id", sa.String(length=64), nullable=True),
+        sa.Column("cambios", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_audit_log_entidad", "AuditLog", ["entidad", "entidad_id", "id"])
+    op.create_index("ix_audit_log_usuario", "AuditLog", ["usuario", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_usuario", table_name="AuditLog")
+    op.drop_index("ix_audit_log_entidad", table_name="AuditLog")
+    op.drop_table("AuditLog")
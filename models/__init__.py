@@ -0,0 +1,19 @@
+"""
+Data models of the Secretaria El Cano application.
+
+Importing this package registers every model in the shared Base.
+"""
+
+from models.audit import AuditLog
+from models.base import Base, metadata
+from models.census_summary import CensusSummary
+from models.cuota import CuotaMovimiento, CuotaTarifa
+from models.fallero import Fallero
+from models.fallero_duplicate import FalleroDuplicateCandidate
+from models.fallero_search import FalleroSearchToken
+from models.usuario import Usuario
+
+__all__ = [
+    "AuditLog", "Base", "metadata", "CensusSummary", "CuotaMovimiento", "CuotaTarifa", "Fallero",
+    "FalleroDuplicateCandidate", "FalleroSearchToken", "Usuario",
+]
@@ -0,0 +1,60 @@
+"""
+Audit trail model for the Secretaria El Cano application.
+
+This module defines the append-only AuditLog table, written in batches by
+dao.audit from the changes captured in every database session.
+"""
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from models.base import Base
+
+ACCION_INSERT = "insert"
+ACCION_UPDATE = "update"
+ACCION_DELETE = "delete"
+# Set-based statements (INSERT ... SELECT, UPDATE ... WHERE) run without entities
+ACCION_BULK_INSERT = "bulk_insert"
+ACCION_BULK_UPDATE = "bulk_update"
+ACCION_BULK_DELETE = "bulk_delete"
+
+
+class AuditLog(Base):
+    """
+    Entry of the audit trail: one change of one entity, or one set-based statement.
+    
+    Rows are only ever inserted. The newest entries come first in the audit
+    view, which pages backwards by id.
+    
+    Attributes:
+        id: Primary key identifier, increasing with the order of the changes.
+        occurred_at: When the change was committed.
+        usuario: Email of the logged-in user, or None for jobs and scripts.
+        accion: Kind of change (insert, update, delete or bulk_*).
+        entidad: Name of the changed table.
+        entidad_id: Primary key of the changed row, if known.
+        cambios: JSON with the new values (insert), the [old, new] pairs of
+            the changed columns (update) or the last values (delete).
+    """
+    
+    __tablename__ = "AuditLog"
+    __table_args__ = (
+        # History of one entity, newest first
+        Index("ix_audit_log_entidad", "entidad", "entidad_id", "id"),
+        # Changes of one user, newest first
+        Index("ix_audit_log_usuario", "usuario", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    occurred_at = Column(DateTime, nullable=False)
+    usuario = Column(String(255), nullable=True)
+    accion = Column(String(20), nullable=False)
+    entidad = Column(String(64), nullable=False)
+    entidad_id = Column(String(64), nullable=True)
+    cambios = Column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of the AuditLog instance."""
+        return (
+            f"<AuditLog(id={self.id}, usuario='{self.usuario}', accion='{self.accion}', "
+            f"entidad='{self.entidad}', entidad_id='{self.entidad_id}')>"
+        )
@@ -0,0 +1,11 @@
+"""
+Declarative base for the Secretaria El Cano application.
+
+Every model derives from this Base, so all tables share one registry and one
+MetaData that can be created, compared and migrated as a unit.
+"""
+
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+metadata = Base.metadata
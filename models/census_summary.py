@@ -0,0 +1,43 @@
+"""
+Census summary model for the Secretaria El Cano application.
+
+This module defines the small summary table holding the headcounts of the
+census dashboard, so the dashboard never has to scan the Fallero table.
+"""
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, String
+
+from models.base import Base
+
+DIMENSION_ESTADO = "estado"
+DIMENSION_EDAD = "edad"
+DIMENSION_ANTIGUEDAD = "antiguedad"
+DIMENSION_ANIO_ALTA = "anio_alta"
+
+
+class CensusSummary(Base):
+    """
+    Headcount of falleros in one bucket of a census dimension.
+    
+    Attributes:
+        dimension: Dimension the bucket belongs to (estado, edad, antiguedad or anio_alta).
+        bucket: Bucket label within the dimension (e.g. "infantil" or "2015").
+        activo: Whether the count is of active or inactive falleros.
+        total: Number of falleros in the bucket.
+        refreshed_at: When the counts were computed.
+    """
+    
+    __tablename__ = "CensusSummary"
+    
+    dimension = Column(String(20), primary_key=True)
+    bucket = Column(String(50), primary_key=True)
+    activo = Column(Boolean, primary_key=True)
+    total = Column(Integer, nullable=False)
+    refreshed_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string representation of the CensusSummary instance."""
+        return (
+            f"<CensusSummary(dimension='{self.dimension}', bucket='{self.bucket}', "
+            f"activo={self.activo}, total={self.total})>"
+        )
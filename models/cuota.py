@@ -0,0 +1,101 @@
+"""
+Cuota (membership fee) models for the Secretaria El Cano application.
+
+This module defines the fee schedule of each ejercicio and the ledger of
+charges and payments of every fallero. Amounts are stored in céntimos as
+integers, so sums are exact on every backend.
+"""
+
+from sqlalchemy import (
+    Column, Date, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func
+)
+
+from models.base import Base
+
+TIPO_CARGO = "cargo"
+TIPO_PAGO = "pago"
+
+
+class CuotaTarifa(Base):
+    """
+    Fee of an age band for an ejercicio.
+
+    A band starts at edad_desde and ends where the next band of the same
+    ejercicio starts; the age is taken on the reference date of the charge run.
+
+    Attributes:
+        id: Primary key identifier for the band.
+        ejercicio: Year the falla ejercicio starts in.
+        edad_desde: Minimum age of the band, in years.
+        importe: Fee of the band, in céntimos.
+    """
+
+    __tablename__ = "CuotaTarifa"
+    __table_args__ = (
+        UniqueConstraint("ejercicio", "edad_desde", name="uq_cuota_tarifa_band"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ejercicio = Column(Integer, nullable=False)
+    edad_desde = Column(Integer, nullable=False)
+    importe = Column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string representation of the CuotaTarifa instance."""
+        return (
+            f"<CuotaTarifa(ejercicio={self.ejercicio}, edad_desde={self.edad_desde}, "
+            f"importe={self.importe})>"
+        )
+
+
+class CuotaMovimiento(Base):
+    """
+    Entry of the cuota ledger: a charge or a payment of a fallero.
+
+    Charges have a positive importe and payments a negative one, so the
+    outstanding balance of a fallero is the sum of their entries. A fallero
+    has at most one charge per ejercicio: ejercicio_cargo repeats the
+    ejercicio on charges only, and is unique per fallero.
+
+    Attributes:
+        id: Primary key identifier for the entry.
+        fallero_id: Identifier of the fallero.
+        ejercicio: Year the falla ejercicio starts in.
+        tipo: Entry type (cargo or pago).
+        concepto: Description shown to the secretaría.
+        importe: Signed amount in céntimos.
+        ejercicio_cargo: The ejercicio on charges, None on payments.
+        fecha: Date of the charge or payment.
+        registrado_por: Email of the user who recorded the entry.
+        created_at: When the entry was written.
+    """
+
+    __tablename__ = "CuotaMovimiento"
+    __table_args__ = (
+        # Balances per fallero and ejercicio; importe makes the index covering
+        # so the aggregates never read the table rows
+        Index("ix_cuota_movimiento_fallero_ejercicio", "fallero_id", "ejercicio", "importe"),
+        # Totals of an ejercicio, also covering
+        Index("ix_cuota_movimiento_ejercicio_tipo", "ejercicio", "tipo", "importe"),
+        # NULLs never collide, so payments are not limited; a portable
+        # alternative to a partial unique index on the charges
+        UniqueConstraint("fallero_id", "ejercicio_cargo", name="uq_cuota_movimiento_cargo"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    fallero_id = Column(Integer, ForeignKey("Fallero.id", ondelete="CASCADE"), nullable=False)
+    ejercicio = Column(Integer, nullable=False)
+    tipo = Column(String(10), nullable=False)
+    concepto = Column(String(255), nullable=False)
+    importe = Column(Integer, nullable=False)
+    ejercicio_cargo = Column(Integer, nullable=True)
+    fecha = Column(Date, nullable=False)
+    registrado_por = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        """Return string representation of the CuotaMovimiento instance."""
+        return (
+            f"<CuotaMovimiento(id={self.id}, fallero_id={self.fallero_id}, "
+            f"ejercicio={self.ejercicio}, tipo='{self.tipo}', importe={self.importe})>"
+        )
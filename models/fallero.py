@@ -4,10 +4,11 @@ Fallero model definition for the Secretaria El Cano application.
 This module defines the Fallero entity which represents a member of the falla organization.
 """
 
-from sqlalchemy import Boolean, Column, Date, Integer, String
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Boolean, Column, Date, Index, Integer, String
+from sqlalchemy.orm import validates
 
-Base = declarative_base()
+from models.base import Base
+from validators.identity import normalize_identity
 
 
 class Fallero(Base):
@@ -21,13 +22,20 @@ class Fallero(Base):
         id: Primary key identifier for the fallero.
         nombre: First name of the fallero.
         apellidos: Last names of the fallero.
-        dni: Spanish national identification number (DNI).
+        dni: Spanish identity document (DNI or NIE), stored in canonical form.
         fecha_nacimiento: Date of birth.
         fecha_alta: Registration date in the organization.
         activo: Boolean flag indicating if the fallero is active.
     """
     
     __tablename__ = "Fallero"
+    __table_args__ = (
+        # Listing filtered by estado, sorted by name (InnoDB appends the id)
+        Index("ix_fallero_activo_apellidos_nombre", "activo", "apellidos", "nombre"),
+        # Unfiltered listing and keyset pagination in name order
+        Index("ix_fallero_apellidos_nombre", "apellidos", "nombre"),
+        Index("ix_fallero_fecha_alta", "fecha_alta"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     nombre = Column(String(100), nullable=False)
@@ -37,6 +45,11 @@ class Fallero(Base):
     fecha_alta = Column(Date, nullable=False)
     activo = Column(Boolean, default=True)
 
+    @validates("dni")
+    def _normalize_dni(self, key: str, dni: str) -> str:
+        """Store the DNI/NIE in canonical form, so lookups can match it exactly."""
+        return normalize_identity(dni)
+
     def __repr__(self) -> str:
         """Return string representation of the Fallero instance."""
         return f"<Fallero(id={self.id}, nombre='{self.nombre}', apellidos='{self.apellidos}')>"
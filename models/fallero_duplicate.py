@@ -0,0 +1,64 @@
+"""
+Fallero duplicate review model for the Secretaria El Cano application.
+
+This module defines the review queue filled by the duplicate detection job:
+each row is a pair of falleros that may be the same person.
+"""
+
+from sqlalchemy import (
+    Column, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint, func
+)
+
+from models.base import Base
+
+ESTADO_PENDIENTE = "pendiente"
+ESTADO_DUPLICADO = "duplicado"
+ESTADO_DISTINTOS = "distintos"
+
+
+class FalleroDuplicateCandidate(Base):
+    """
+    Pair of falleros that may be the same person, pending or reviewed.
+    
+    The pair is stored with the lower id first, so each pair appears once
+    and a reviewed pair is not queued again by later runs of the job.
+    
+    Attributes:
+        id: Primary key identifier for the candidate pair.
+        fallero_id_a: Identifier of the fallero with the lower id.
+        fallero_id_b: Identifier of the fallero with the higher id.
+        score: Overall similarity between 0 and 1.
+        name_score: Similarity of the full names.
+        dni_score: Similarity of the DNIs/NIEs.
+        date_score: Similarity of the birth dates.
+        estado: Review state (pendiente, duplicado or distintos).
+        detected_at: When the job found the pair.
+        resolved_at: When the pair was reviewed.
+        resolved_by: Email of the user who reviewed the pair.
+    """
+    
+    __tablename__ = "FalleroDuplicateCandidate"
+    __table_args__ = (
+        UniqueConstraint("fallero_id_a", "fallero_id_b", name="uq_fallero_duplicate_pair"),
+        # Review queue: pending pairs, most similar first
+        Index("ix_fallero_duplicate_estado_score", "estado", "score"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    fallero_id_a = Column(Integer, ForeignKey("Fallero.id", ondelete="CASCADE"), nullable=False)
+    fallero_id_b = Column(Integer, ForeignKey("Fallero.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    name_score = Column(Float, nullable=False)
+    dni_score = Column(Float, nullable=False)
+    date_score = Column(Float, nullable=False)
+    estado = Column(String(20), nullable=False, default=ESTADO_PENDIENTE)
+    detected_at = Column(DateTime, nullable=False, server_default=func.now())
+    resolved_at = Column(DateTime, nullable=True)
+    resolved_by = Column(String(255), nullable=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of the FalleroDuplicateCandidate instance."""
+        return (
+            f"<FalleroDuplicateCandidate(id={self.id}, fallero_id_a={self.fallero_id_a}, "
+            f"fallero_id_b={self.fallero_id_b}, score={self.score:.2f}, estado='{self.estado}')>"
+        )
@@ -0,0 +1,86 @@
+"""
+Fallero search index model for the Secretaria El Cano application.
+
+This module defines the token table used for indexed, accent- and
+case-insensitive name search, and keeps it in sync with Fallero rows.
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, event, inspect
+
+from models.base import Base
+from models.fallero import Fallero
+from utils.text import tokenize
+
+SEARCH_FIELDS = ("nombre", "apellidos")
+
+
+class FalleroSearchToken(Base):
+    """
+    Normalized name token of a fallero.
+    
+    Each fallero has one row per distinct token of its nombre and apellidos,
+    so a prefix search ("garc%") can use the (campo, token) index instead of
+    scanning the Fallero table with a leading wildcard.
+    
+    Attributes:
+        fallero_id: Identifier of the fallero the token belongs to.
+        campo: Name of the Fallero field the token comes from.
+        token: Normalized token (lowercase, without accents).
+    """
+    
+    __tablename__ = "FalleroSearchToken"
+    __table_args__ = (
+        Index("ix_fallero_search_token_campo_token", "campo", "token"),
+    )
+    
+    fallero_id = Column(Integer, ForeignKey("Fallero.id", ondelete="CASCADE"), primary_key=True)
+    campo = Column(String(20), primary_key=True)
+    token = Column(String(100), primary_key=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of the FalleroSearchToken instance."""
+        return f"<FalleroSearchToken(fallero_id={self.fallero_id}, campo='{self.campo}', token='{self.token}')>"
+
+    @staticmethod
+    def rows_for(fallero_id: int, nombre: Optional[str], apellidos: Optional[str]) -> List[Dict]:
+        """
+        Build the token rows for a fallero.
+        
+        Args:
+            fallero_id: Identifier of the fallero.
+            nombre: First name of the fallero.
+            apellidos: Last names of the fallero.
+            
+        Returns:
+            List of column dictionaries ready for a multi-row INSERT.
+        """
+        rows = []
+        for campo, value in zip(SEARCH_FIELDS, (nombre, apellidos)):
+            for token in dict.fromkeys(tokenize(value)):
+                rows.append({"fallero_id": fallero_id, "campo": campo, "token": token[:100]})
+        return rows
+
+
+def _write_search_tokens(connection, target: Fallero) -> None:
+    """Replace the search tokens of a fallero within the current flush."""
+    table = FalleroSearchToken.__table__
+    connection.execute(table.delete().where(table.c.fallero_id == target.id))
+    rows = FalleroSearchToken.rows_for(target.id, target.nombre, target.apellidos)
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+@event.listens_for(Fallero, "after_insert")
+def _index_new_fallero(mapper, connection, target: Fallero) -> None:
+    """Index the name tokens of a newly inserted fallero."""
+    _write_search_tokens(connection, target)
+
+
+@event.listens_for(Fallero, "after_update")
+def _reindex_updated_fallero(mapper, connection, target: Fallero) -> None:
+    """Reindex the name tokens of a fallero whose name has changed."""
+    state = inspect(target)
+    if any(state.attrs[campo].history.has_changes() for campo in SEARCH_FIELDS):
+        _write_search_tokens(connection, target)
@@ -4,10 +4,9 @@ Usuario model definition for the Secretaria El Cano application.
 This module defines the Usuario entity which represents system users with authentication capabilities.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Column, Index, Integer, String, Boolean
 
-Base = declarative_base()
+from models.base import Base
 
 
 class Usuario(Base):
@@ -25,6 +24,12 @@ class Usuario(Base):
     """
     
     __tablename__ = "Usuario"
+    __table_args__ = (
+        # Active credentials and the users listing sorted by name
+        Index("ix_usuario_activo_nombre", "activo", "nombre"),
+        # Name prefix filter of the users listing, for any status
+        Index("ix_usuario_nombre", "nombre"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     nombre = Column(String(255), nullable=False)
@@ -9,6 +9,58 @@ import sys
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# The audit writer thread cannot reach in-memory databases; tests/test_audit.py
+# enables it against database files
+os.environ.setdefault("AUDIT_ENABLED", "False")
+
+from config.settings import DatabaseConfig  # noqa: E402
+from dao.database import DatabaseManager, dispose_engines  # noqa: E402
+from models import Base  # noqa: E402
+
+def make_db_config(url: str = "sqlite:///:memory:") -> DatabaseConfig:
+    """Build a database configuration pointing at a test database."""
+    return DatabaseConfig(
+        url=url,
+        init_db=True,
+        host="localhost",
+        port=0,
+        database="test",
+        username="test",
+        password="test",
+    )
+
+def _create_database(request, url: str) -> DatabaseManager:
+    """Create the schema at a URL and give its manager to the test case as self.manager."""
+    manager = DatabaseManager(make_db_config(url))
+    Base.metadata.create_all(manager.engine)
+    if request.instance is not None:
+        request.instance.manager = manager
+    return manager
+
+@pytest.fixture
+def db_config_factory(request, tmp_path):
+    """
+    Provide make_db_config() and dispose the engines built during the test.
+    
+    TestCase classes using the fixture get it as self.make_db_config, and a
+    temporary directory for database files as self.db_dir.
+    """
+    if request.instance is not None:
+        request.instance.make_db_config = make_db_config
+        request.instance.db_dir = tmp_path
+    yield make_db_config
+    dispose_engines()
+
+@pytest.fixture
+def db_manager(request, db_config_factory):
+    """Provide a DatabaseManager on a fresh in-memory database."""
+    return _create_database(request, "sqlite:///:memory:")
+
+@pytest.fixture
+def file_db_manager(request, db_config_factory, tmp_path):
+    """Provide a DatabaseManager on a fresh database file, reachable from other threads."""
+    return _create_database(request, f"sqlite:///{tmp_path / 'censo.db'}")
+
 @pytest.fixture
 def test_db_url():
     """Provide a test database URL."""
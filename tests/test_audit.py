@@ -0,0 +1,183 @@
+"""
+Test suite for the audit trail.
+"""
+
+import io
+import json
+import threading
+import unittest
+from datetime import date
+from unittest import mock
+
+import pytest
+from sqlalchemy import update
+
+from config.settings import AuditConfig, settings
+from dao import audit
+from dao.audit import AuditWriter, get_audit_writer, set_user_provider
+from dao.audit_dao import AuditDAO
+from dao.cuota_dao import CuotaDAO
+from dao.usuario_dao import UsuarioDAO
+from managers.import_manager import FalleroImportManager
+from models import AuditLog, Fallero, Usuario
+
+
+@pytest.mark.usefixtures("file_db_manager")
+class AuditTestCase(unittest.TestCase):
+    """Base test case auditing a SQLite file the writer thread can reach."""
+
+    def setUp(self):
+        patcher = mock.patch.object(settings, "audit", AuditConfig(flush_interval=0.05))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        set_user_provider(lambda: "secretaria@falla.com")
+        self.addCleanup(set_user_provider, None)
+
+    def entries(self):
+        """Flush the writer and return the audit entries in order."""
+        self.assertTrue(get_audit_writer().flush(timeout=5))
+        with self.manager.get_db_session() as session:
+            return session.query(AuditLog).order_by(AuditLog.id).all()
+
+
+class TestAuditCapture(AuditTestCase):
+    """Test cases for the session event capture."""
+
+    def test_entity_changes_are_recorded_with_user(self):
+        """Test insert, update and delete entries with their values."""
+        fallero_id = self.manager.insert_fallero("Juan", "García", "12345678Z", date(1990, 1, 1)).id
+        with self.manager.get_db_session() as session:
+            fallero = session.get(Fallero, fallero_id)
+            fallero.nombre = "Joan"
+            session.commit()
+            session.delete(fallero)
+            session.commit()
+
+        entries = [entry for entry in self.entries() if entry.entidad == "Fallero"]
+        self.assertEqual([entry.accion for entry in entries], ["insert", "update", "delete"])
+        self.assertEqual({entry.entidad_id for entry in entries}, {str(fallero_id)})
+        self.assertEqual({entry.usuario for entry in entries}, {"secretaria@falla.com"})
+        self.assertEqual(json.loads(entries[0].cambios)["dni"], "12345678Z")
+        self.assertEqual(json.loads(entries[1].cambios), {"nombre": ["Juan", "Joan"]})
+
+    def test_rolled_back_changes_are_not_recorded(self):
+        """Test that only committed transactions reach the audit trail."""
+        with self.manager.get_db_session() as session:
+            session.add(Fallero(nombre="Juan", apellidos="García", dni="12345678Z",
+                                fecha_nacimiento=date(1990, 1, 1), fecha_alta=date(2020, 1, 1)))
+            session.flush()
+            session.rollback()
+
+        self.assertEqual(self.entries(), [])
+
+    def test_passwords_are_redacted(self):
+        """Test that password hashes never reach the audit trail."""
+        with self.manager.get_db_session() as session:
+            session.add(Usuario(nombre="Admin", email="admin@falla.com", hashed_password="secret"))
+            session.commit()
+
+        (entry,) = self.entries()
+        self.assertEqual(json.loads(entry.cambios)["hashed_password"], audit.REDACTED_VALUE)
+        self.assertNotIn("secret", entry.cambios)
+
+    def test_set_based_statements_are_recorded(self):
+        """Test that INSERT ... SELECT charges leave a bulk entry."""
+        cuota_dao = CuotaDAO(self.manager)
+        cuota_dao.set_tarifas(2026, {0: 5000})
+        self.manager.insert_fallero("Juan", "García", "12345678Z", date(1990, 1, 1))
+        cuota_dao.generar_cargos(2026, fecha=date(2026, 3, 1))
+
+        acciones = [(entry.accion, entry.entidad) for entry in self.entries()]
+        self.assertIn(("bulk_insert", "CuotaMovimiento"), acciones)
+        self.assertIn(("bulk_insert", "CuotaTarifa"), acciones)
+        self.assertNotIn("FalleroSearchToken", {entidad for _, entidad in acciones})
+
+    def test_targeted_updates_record_condition_and_values(self):
+        """Test that a set-based UPDATE says which row changed and how."""
+        with self.manager.get_db_session() as session:
+            usuario = Usuario(nombre="Admin", email="admin@falla.com", hashed_password="x")
+            session.add(usuario)
+            session.commit()
+            usuario_id = usuario.id
+        UsuarioDAO(self.manager).desactivar_usuario("admin@falla.com")
+        with self.manager.get_db_session() as session:
+            session.execute(
+                update(Usuario).where(Usuario.id == usuario_id).values(nombre="Administración")
+            )
+            session.commit()
+
+        desactivar, renombrar = [entry for entry in self.entries() if entry.accion == "bulk_update"]
+        cambios = json.loads(desactivar.cambios)
+        self.assertEqual(list(cambios["params"].values()), ["admin@falla.com"])
+        self.assertEqual(cambios["set"], {"activo": False})
+        self.assertIn("email", cambios["where"])
+        self.assertEqual(renombrar.entidad_id, str(usuario_id))
+        self.assertEqual(json.loads(renombrar.cambios)["set"], {"nombre": "Administración"})
+
+    def test_imports_record_each_row(self):
+        """Test that a bulk import leaves one entry per fallero with its values."""
+        FalleroImportManager(self.manager).import_file(
+            io.BytesIO(b"nombre,apellidos,dni,fecha_nacimiento\n"
+                       b"Juan,Soler,12345678Z,1990-01-01\nAna,Ferrer,00000001R,1985-05-05\n"),
+            file_name="censo.csv",
+        )
+
+        entries = [entry for entry in self.entries() if entry.entidad == "Fallero"]
+        self.assertEqual([entry.accion for entry in entries], ["bulk_insert"] * 2)
+        self.assertEqual(sorted(json.loads(entry.cambios)["dni"] for entry in entries),
+                         ["00000001R", "12345678Z"])
+
+
+class TestAuditWriter(unittest.TestCase):
+    """Test cases for the batching writer."""
+
+    def test_full_queue_drops_records(self):
+        """Test that memory stays bounded when the database falls behind."""
+        blocked = threading.Event()
+        writer = AuditWriter(AuditConfig(queue_size=2, batch_size=1, put_timeout=0.01))
+        with mock.patch.object(writer, "_write", side_effect=lambda batch: blocked.wait(5)):
+            writer.submit(None, [{"n": n} for n in range(10)])
+            self.assertGreaterEqual(writer.dropped, 7)
+            blocked.set()
+            self.assertTrue(writer.flush(timeout=5))
+        writer.shutdown(timeout=5)
+
+    def test_shutdown_writes_queued_records(self):
+        """Test that every queued record is written before the thread stops."""
+        written = []
+        writer = AuditWriter(AuditConfig(batch_size=3, flush_interval=0.05))
+        with mock.patch.object(writer, "_write",
+                               side_effect=lambda batch: written.extend(batch)):
+            writer.submit("engine", [{"n": n} for n in range(10)])
+            writer.shutdown(timeout=5)
+
+        self.assertEqual(len(written), 10)
+        self.assertFalse(writer._thread.is_alive())
+
+
+class TestAuditDAO(AuditTestCase):
+    """Test cases for the audit view queries."""
+
+    def test_pages_go_backwards_and_filter(self):
+        """Test newest-first keyset pages and the entity filter."""
+        ids = [
+            self.manager.insert_fallero(f"Fallero{n}", "Soler", dni, date(1990, 1, 1)).id
+            for n, dni in enumerate(["00000000T", "00000001R", "00000002W"])
+        ]
+        self.entries()
+        dao = AuditDAO(self.manager)
+
+        first = dao.page(entidad="Fallero", page_size=2, with_total=True)
+        second = dao.page(entidad="Fallero", cursor=first.next_cursor, page_size=2)
+
+        self.assertEqual(first.total, 3)
+        self.assertEqual([row.entidad_id for row in first.items + second.items],
+                         [str(fallero_id) for fallero_id in reversed(ids)])
+        self.assertIsNone(second.next_cursor)
+        self.assertEqual(len(dao.page(entidad="Fallero", entidad_id=str(ids[0])).items), 1)
+        self.assertEqual(dao.page(usuario="otro@falla.com").items, [])
+        self.assertIn("Fallero", dao.entidades())
+
+
+if __name__ == '__main__':
+    unittest.main()
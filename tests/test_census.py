@@ -0,0 +1,77 @@
+"""
+Test suite for the census statistics and their summary table.
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import pytest
+
+from dao.census_dao import CensusDAO, years_ago
+from managers.census_manager import CensusStatsManager
+from models import Fallero
+
+TODAY = date(2024, 6, 15)
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestCensusAggregates(unittest.TestCase):
+    """Test cases for the GROUP BY aggregates and the summary refresh."""
+
+    def setUp(self):
+        self._alta("Lucía", "00000000T", date(2015, 3, 1), date(2020, 1, 1))
+        self._alta("Pau", "00000001R", date(2010, 6, 15), date(2024, 1, 1))
+        self._alta("Amparo", "00000002W", date(1960, 1, 1), date(1990, 1, 1))
+        self._alta("Joan", "00000003A", date(1980, 1, 1), date(2020, 5, 1), activo=False)
+
+    def _alta(self, nombre, dni, fecha_nacimiento, fecha_alta, activo=True):
+        with self.manager.get_db_session() as session:
+            session.add(Fallero(nombre=nombre, apellidos="Soler", dni=dni, activo=activo,
+                                fecha_nacimiento=fecha_nacimiento, fecha_alta=fecha_alta))
+            session.commit()
+
+    def test_aggregate_counts_buckets(self):
+        """Test the age, antigüedad and alta year buckets."""
+        rows = {(d, b, a): t for d, b, a, t in CensusDAO(self.manager).aggregate(TODAY)}
+
+        self.assertEqual(rows[("estado", "total", True)], 3)
+        self.assertEqual(rows[("estado", "total", False)], 1)
+        self.assertEqual(rows[("edad", "infantil", True)], 1)
+        self.assertEqual(rows[("edad", "adulto", True)], 2)
+        self.assertEqual(rows[("antiguedad", "<1", True)], 1)
+        self.assertEqual(rows[("antiguedad", "25+", True)], 1)
+        self.assertEqual(rows[("antiguedad", "1-4", False)], 1)
+        self.assertEqual(rows[("anio_alta", "2020", True)], 1)
+
+    def test_years_ago_handles_leap_day(self):
+        """Test that 29 February falls back to 28 February."""
+        self.assertEqual(years_ago(date(2024, 2, 29), 1), date(2023, 2, 28))
+
+    def test_report_reads_summary_until_falleros_change(self):
+        """Test that the dashboard reads the summary and refreshes after an alta."""
+        stats = CensusStatsManager(self.manager, max_age_seconds=3600)
+        self.assertEqual(stats.report().totals(), (3, 1))
+
+        with mock.patch.object(CensusDAO, "aggregate") as aggregate:
+            self.assertEqual(stats.report().totals(), (3, 1))
+        aggregate.assert_not_called()
+
+        self.manager.insert_fallero("Rosa", "Soler", "00000004G", date(1990, 1, 1))
+        self.assertEqual(stats.report().totals(), (4, 1))
+
+    def test_old_summary_is_refreshed(self):
+        """Test that a summary older than the maximum age is recomputed."""
+        stats = CensusStatsManager(self.manager, max_age_seconds=60)
+        stats.report()
+        dao = CensusDAO(self.manager)
+        rows, _ = dao.read_summary()
+        dao.replace_summary(rows, datetime.now() - timedelta(minutes=5))
+
+        with mock.patch.object(CensusDAO, "aggregate", return_value=[]) as aggregate:
+            stats.report()
+        aggregate.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
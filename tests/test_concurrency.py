@@ -0,0 +1,56 @@
+"""
+Test suite for the concurrent page queries helper.
+"""
+
+import contextvars
+import time
+import unittest
+
+from dao.concurrency import run_concurrently
+
+_request = contextvars.ContextVar("request", default=None)
+
+
+class TestRunConcurrently(unittest.TestCase):
+    """Test cases for running independent queries together."""
+
+    def test_latency_is_that_of_the_slowest_query(self):
+        """Test that independent waits overlap instead of adding up."""
+        def query(value, seconds):
+            time.sleep(seconds)
+            return value
+
+        started = time.perf_counter()
+        results = run_concurrently({
+            "a": lambda: query(1, 0.2), "b": lambda: query(2, 0.2), "c": lambda: query(3, 0.2),
+        })
+
+        self.assertEqual(results, {"a": 1, "b": 2, "c": 3})
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+    def test_failure_is_raised_after_all_finish(self):
+        """Test that a failing query does not abandon the others."""
+        finished = []
+
+        def fails():
+            raise ValueError("boom")
+
+        def slow():
+            time.sleep(0.05)
+            finished.append(True)
+
+        with self.assertRaises(ValueError):
+            run_concurrently({"fails": fails, "slow": slow})
+        self.assertEqual(finished, [True])
+
+    def test_queries_see_the_callers_context(self):
+        """Test that the request profiler of the rerun follows the queries."""
+        token = _request.set("rerun")
+        try:
+            self.assertEqual(run_concurrently({"a": _request.get}), {"a": "rerun"})
+        finally:
+            _request.reset(token)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Test suite for the cuota ledger.
+"""
+
+import unittest
+from datetime import date
+from unittest import mock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from dao.cuota_dao import CuotaDAO
+from models import CuotaMovimiento, Fallero
+from models.cuota import TIPO_CARGO
+
+FECHA = date(2026, 3, 20)
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestCuotaDAO(unittest.TestCase):
+    """Test cases for charge generation, balances and the morosos list."""
+
+    def setUp(self):
+        self.dao = CuotaDAO(self.manager)
+        self.dao.set_tarifas(2026, {0: 0, 3: 5000, 14: 12000, 65: 8000})
+        self.bebe = self._alta("Bebé", "00000000T", date(2025, 1, 1))
+        self.infantil = self._alta("Pau", "00000001R", date(2016, 5, 1))
+        self.adulto = self._alta("Amparo", "00000002W", date(1980, 1, 1))
+        # Turns 14 on the day of the charge: adult fee
+        self.cumple = self._alta("Lucía", "00000003A", date(2012, 3, 20))
+        self.baja = self._alta("Joan", "00000004G", date(1970, 1, 1), activo=False)
+
+    def _alta(self, nombre, dni, fecha_nacimiento, activo=True):
+        with self.manager.get_db_session() as session:
+            fallero = Fallero(nombre=nombre, apellidos="Soler", dni=dni, activo=activo,
+                              fecha_nacimiento=fecha_nacimiento, fecha_alta=date(2020, 1, 1))
+            session.add(fallero)
+            session.commit()
+            return fallero.id
+
+    def test_charges_follow_age_bands(self):
+        """Test one charge per active fallero with the fee of their band."""
+        self.assertEqual(self.dao.generar_cargos(2026, fecha=FECHA, registrado_por="admin"), 3)
+
+        self.assertEqual(self.dao.saldo(self.infantil), 5000)
+        self.assertEqual(self.dao.saldo(self.adulto), 12000)
+        self.assertEqual(self.dao.saldo(self.cumple), 12000)
+        self.assertEqual(self.dao.saldo(self.bebe), 0)
+        self.assertEqual(self.dao.saldo(self.baja), 0)
+
+    def test_charges_are_not_repeated(self):
+        """Test that a second run only charges the new altas."""
+        self.dao.generar_cargos(2026, fecha=FECHA)
+        nuevo = self._alta("Vicent", "00000005M", date(1990, 1, 1))
+
+        self.assertEqual(self.dao.generar_cargos(2026, fecha=FECHA), 1)
+        self.assertEqual(self.dao.saldo(nuevo), 12000)
+        with self.manager.get_db_session() as session:
+            self.assertEqual(session.query(CuotaMovimiento).count(), 4)
+
+    def test_second_charge_is_rejected_by_the_database(self):
+        """Test that the unique key allows one charge but many payments per ejercicio."""
+        self.dao.generar_cargos(2026, fecha=FECHA)
+        self.dao.registrar_pago(self.adulto, 2026, 5000, fecha=FECHA)
+        self.dao.registrar_pago(self.adulto, 2026, 7000, fecha=FECHA)
+
+        with self.manager.get_db_session() as session:
+            session.add(CuotaMovimiento(
+                fallero_id=self.adulto, ejercicio=2026, tipo=TIPO_CARGO, concepto="Cuota",
+                importe=12000, ejercicio_cargo=2026, fecha=FECHA,
+            ))
+            with self.assertRaises(IntegrityError):
+                session.commit()
+
+    def test_concurrent_charge_run_is_retried(self):
+        """Test that losing the race to another run retries instead of failing."""
+        insert_cargos = self.dao._insert_cargos
+
+        def other_run_wins(*args):
+            # The first attempt loses against a run that charged one fallero
+            if insert.call_count == 1:
+                with self.manager.get_db_session() as session:
+                    session.add(CuotaMovimiento(
+                        fallero_id=self.adulto, ejercicio=2026, tipo=TIPO_CARGO, concepto="Cuota",
+                        importe=12000, ejercicio_cargo=2026, fecha=FECHA,
+                    ))
+                    session.commit()
+                raise IntegrityError("INSERT", {}, Exception("uq_cuota_movimiento_cargo"))
+            return insert_cargos(*args)
+
+        with mock.patch.object(self.dao, "_insert_cargos", side_effect=other_run_wins) as insert:
+            self.assertEqual(self.dao.generar_cargos(2026, fecha=FECHA), 2)
+        self.assertEqual(insert.call_count, 2)
+        self.assertEqual(self.dao.saldo(self.adulto), 12000)
+
+    def test_ejercicio_without_schedule_is_rejected(self):
+        """Test that charges need a fee schedule."""
+        with self.assertRaises(ValueError):
+            self.dao.generar_cargos(2027, fecha=FECHA)
+
+    def test_payments_reduce_balance_and_summary(self):
+        """Test balances and totals after partial and full payments."""
+        self.dao.generar_cargos(2026, fecha=FECHA)
+        self.dao.registrar_pago(self.adulto, 2026, 12000, fecha=FECHA)
+        self.dao.registrar_pago(self.infantil, 2026, 2000, fecha=FECHA)
+
+        self.assertEqual(self.dao.saldo(self.adulto, 2026), 0)
+        self.assertEqual(self.dao.saldo(self.infantil), 3000)
+        self.assertEqual(self.dao.resumen(2026), (29000, 14000))
+        with self.assertRaises(ValueError):
+            self.dao.registrar_pago(self.adulto, 2026, 0)
+
+    def test_morosos_are_paginated_in_name_order(self):
+        """Test the keyset pages of falleros with an outstanding balance."""
+        self.dao.generar_cargos(2026, fecha=FECHA)
+        self.dao.registrar_pago(self.adulto, 2026, 12000, fecha=FECHA)
+
+        first = self.dao.morosos(2026, page_size=1, with_total=True)
+        second = self.dao.morosos(2026, cursor=first.next_cursor, page_size=1)
+
+        self.assertEqual(first.total, 2)
+        self.assertEqual([(row.nombre, row.pendiente) for row in first.items + second.items],
+                         [("Lucía", 12000), ("Pau", 5000)])
+        self.assertIsNone(second.next_cursor)
+        self.assertEqual(self.dao.morosos(2025).items, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
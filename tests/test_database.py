@@ -0,0 +1,93 @@
+"""
+Test suite for the DatabaseManager.
+"""
+
+import unittest
+from datetime import date
+
+import pytest
+
+from dao.database import DatabaseManager, dispose_engines
+
+
+@pytest.mark.usefixtures("db_config_factory")
+class TestDatabaseManagerEngine(unittest.TestCase):
+    """Test cases for the shared engine registry."""
+
+    def test_managers_share_engine_and_session_factory(self):
+        """Test that managers for the same URL reuse one engine."""
+        config = self.make_db_config()
+        first = DatabaseManager(config)
+        second = DatabaseManager(config)
+
+        self.assertIs(first.engine, second.engine)
+        self.assertIs(first.SessionLocal, second.SessionLocal)
+
+    def test_dispose_engines_rebuilds_engine(self):
+        """Test that disposing the registry creates a new engine on next use."""
+        config = self.make_db_config()
+        first = DatabaseManager(config)
+        dispose_engines()
+        second = DatabaseManager(config)
+
+        self.assertIsNot(first.engine, second.engine)
+
+    def test_sqlite_engine_ignores_pool_sizing(self):
+        """Test that SQLite engines are created without QueuePool sizing."""
+        config = self.make_db_config()
+        config.pool_size = 1
+        config.max_overflow = 0
+        manager = DatabaseManager(config)
+
+        with manager.engine.connect() as connection:
+            self.assertEqual(connection.exec_driver_sql("SELECT 1").scalar(), 1)
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestFalleroPagination(unittest.TestCase):
+    """Test cases for keyset pagination of the falleros listing."""
+
+    def setUp(self):
+        apellidos = ["Pérez", "García", "López", "García", "Martí", "Soler", "García"]
+        for i, apellido in enumerate(apellidos):
+            self.manager.insert_fallero(
+                nombre=f"Nombre{i % 3}",
+                apellidos=apellido,
+                dni=f"{i:08d}A",
+                fecha_nacimiento=date(1990, 1, 1),
+            )
+
+    def _all_pages(self, page_size, **filters):
+        rows, cursor = [], None
+        while True:
+            page = self.manager.get_falleros_page(cursor=cursor, page_size=page_size, **filters)
+            rows.extend(page.items)
+            if not page.has_next:
+                return rows
+            cursor = page.next_cursor
+
+    def test_pages_cover_all_rows_in_sort_order(self):
+        """Test that walking the cursors returns every row once, sorted."""
+        rows = self._all_pages(page_size=2)
+        keys = [(f.apellidos, f.nombre, f.id) for f in rows]
+
+        self.assertEqual(len(keys), 7)
+        self.assertEqual(keys, sorted(keys))
+
+    def test_last_page_has_no_cursor(self):
+        """Test that a page holding the remaining rows ends the listing."""
+        page = self.manager.get_falleros_page(page_size=7)
+
+        self.assertEqual(len(page.items), 7)
+        self.assertIsNone(page.next_cursor)
+
+    def test_total_counts_filtered_rows(self):
+        """Test that the total ignores the page size but honours the filters."""
+        page = self.manager.get_falleros_page(apellidos="García", page_size=1, with_total=True)
+
+        self.assertEqual(page.total, 3)
+        self.assertEqual(len(self._all_pages(page_size=1, apellidos="García")), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Test suite for the duplicate detection job and review queue.
+"""
+
+import unittest
+from datetime import date
+
+import pytest
+
+from dao.duplicate_dao import DuplicateReviewDAO
+from managers.dedup_manager import DuplicateDetector, Person, blocking_keys, score_pair
+from models.fallero_duplicate import ESTADO_DUPLICADO
+from utils.text import phonetic_key
+
+
+class TestScoring(unittest.TestCase):
+    """Test cases for blocking keys and pair scoring."""
+
+    def test_phonetic_key_merges_spellings(self):
+        """Test that common spelling variants share a phonetic code."""
+        self.assertEqual(phonetic_key("Giménez"), phonetic_key("Jimenes"))
+        self.assertEqual(phonetic_key("Vicent"), phonetic_key("Bicent"))
+        self.assertNotEqual(phonetic_key("García"), phonetic_key("Martínez"))
+
+    def test_phonetic_key_keeps_hard_and_soft_g_apart(self):
+        """Test that "gu" before e/i sounds like g, and a bare g like j."""
+        self.assertEqual(phonetic_key("Gil"), phonetic_key("Jil"))
+        self.assertEqual(phonetic_key("Guerra"), "gr")
+        self.assertNotEqual(phonetic_key("Guerra"), phonetic_key("Jerra"))
+        self.assertNotEqual(phonetic_key("Guillén"), phonetic_key("Jilén"))
+        self.assertEqual(phonetic_key("Guillén"), phonetic_key("Guiyén"))
+
+    def test_typo_pair_shares_a_block_and_scores_high(self):
+        """Test that a DNI typo with a spelling variant is found."""
+        first = Person(1, "Vicent", "Giménez Soler", "12345678Z", date(1980, 5, 4))
+        second = Person(2, "Bicent", "Jiménez Soler", "12345687Z", date(1980, 4, 5))
+
+        self.assertTrue(blocking_keys(first) & blocking_keys(second))
+        self.assertGreater(score_pair(first, second).score, 0.8)
+
+    def test_different_people_score_low(self):
+        """Test that relatives with the same surname are not flagged."""
+        first = Person(1, "Amparo", "García Peris", "12345678Z", date(1960, 1, 1))
+        second = Person(2, "Salvador", "García Peris", "87654321X", date(1990, 7, 12))
+
+        self.assertLess(score_pair(first, second).score, 0.8)
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestDuplicateDetector(unittest.TestCase):
+    """Test cases for the detection job over a database."""
+
+    def setUp(self):
+        self.manager.insert_fallero("Vicent", "Giménez Soler", "12345678Z", date(1980, 5, 4))
+        self.manager.insert_fallero("Bicent", "Jiménez Soler", "12345687Z", date(1980, 5, 4))
+        self.manager.insert_fallero("Amparo", "García Peris", "87654321X", date(1960, 1, 1))
+        for i in range(5):
+            self.manager.insert_fallero("Carmen", f"Ferrer {i}", f"{i:08d}T", date(1970 + i, 1, 1))
+        self.review = DuplicateReviewDAO(self.manager)
+
+    def test_run_queues_likely_duplicates(self):
+        """Test that only the typo pair is queued, after few comparisons."""
+        report = DuplicateDetector(self.manager).run()
+        pending = self.review.pending()
+
+        self.assertEqual(report.queued, 1)
+        self.assertLess(report.comparisons, 8 * 7 // 2)
+        self.assertEqual({pending[0].nombre_a, pending[0].nombre_b}, {"Vicent", "Bicent"})
+
+    def test_rerun_does_not_requeue_resolved_pairs(self):
+        """Test that a reviewed pair stays out of the queue."""
+        DuplicateDetector(self.manager).run()
+        candidate = self.review.pending()[0]
+
+        self.assertTrue(self.review.resolve(candidate.id, ESTADO_DUPLICADO, "admin@falla.com"))
+        self.assertEqual(DuplicateDetector(self.manager).run().queued, 0)
+        self.assertEqual(self.review.pending_count(), 0)
+
+    def test_oversized_blocks_are_skipped(self):
+        """Test that blocks above the size limit are not compared."""
+        report = DuplicateDetector(self.manager, max_block_size=1).run()
+
+        self.assertEqual(report.comparisons, 0)
+        self.assertGreater(report.skipped_blocks, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Test suite for the census export.
+"""
+
+import csv
+import gc
+import io
+import os
+import unittest
+from datetime import date
+
+import pytest
+
+from managers.export_manager import ExportFormat, FalleroExportManager
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestFalleroExportManager(unittest.TestCase):
+    """Test cases for streaming exports of the census."""
+
+    def setUp(self):
+        for i, apellidos in enumerate(["Soler", "García", "Martí"]):
+            self.manager.insert_fallero("Nombre", apellidos, f"{i:08d}A", date(1990, 1, 1))
+        self.exporter = FalleroExportManager(self.manager, batch_size=2)
+
+    def test_batches_are_bounded_and_sorted(self):
+        """Test that rows are streamed in batches of at most batch_size, in order."""
+        batches = list(self.exporter.iter_batches())
+
+        self.assertEqual([len(b) for b in batches], [2, 1])
+        self.assertEqual([row[2] for b in batches for row in b], ["García", "Martí", "Soler"])
+
+    def test_csv_export_honours_filters(self):
+        """Test that the CSV export writes the header and the filtered rows."""
+        buffer = io.BytesIO()
+        rows = self.exporter.export(buffer, ExportFormat.CSV, apellidos="garcia")
+
+        lines = list(csv.reader(io.StringIO(buffer.getvalue().decode("utf-8-sig"))))
+        self.assertEqual(rows, 1)
+        self.assertEqual(lines[0][:3], ["id", "nombre", "apellidos"])
+        self.assertEqual(lines[1][2], "García")
+
+    def test_xlsx_export(self):
+        """Test that the Excel export contains every row."""
+        from openpyxl import load_workbook
+
+        buffer = io.BytesIO()
+        self.exporter.export(buffer, ExportFormat.XLSX)
+
+        sheet = load_workbook(buffer, read_only=True).worksheets[0]
+        self.assertEqual(len(list(sheet.iter_rows())), 4)
+
+    def test_tempfile_can_be_downloaded_again(self):
+        """Test that the temporary export survives its downloads until deleted."""
+        export = self.exporter.export_to_tempfile(ExportFormat.CSV)
+        path = export.path
+
+        for _ in range(2):
+            with export.open() as fileobj:
+                self.assertIn(b"Soler", fileobj.read())
+        self.assertTrue(export.exists)
+
+        export.delete()
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(export.exists)
+
+    def test_tempfile_is_deleted_with_its_session(self):
+        """Test that an export never downloaded is deleted when it is released."""
+        export = self.exporter.export_to_tempfile(ExportFormat.CSV)
+        path = export.path
+
+        del export
+        gc.collect()
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
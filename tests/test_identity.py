@@ -0,0 +1,56 @@
+"""
+Test suite for DNI/NIE validation and normalization.
+"""
+
+import unittest
+
+import pandas as pd
+
+from validators import Validators
+from validators.identity import (
+    DNI_LETTERS, check_identities, control_letter, is_valid_identity,
+    normalize_identities, normalize_identity
+)
+
+SAMPLES = [
+    "12345678Z", "12345678z", "1234567-l", "00000000T", "X1234567L", "x 123456 7 l",
+    "Y0000000Z", "Z0000000M", "12345678A", "X1234567A", "W1234567L", "1234", "", None,
+    "123456789Z", "X12345678L", "1234567ÑL",
+]
+
+
+class TestIdentity(unittest.TestCase):
+    """Test cases for the DNI/NIE helpers."""
+
+    def test_normalize_identity(self):
+        """Test separators, case and the missing leading zero."""
+        self.assertEqual(normalize_identity(" 1234567-l"), "01234567L")
+        self.assertEqual(normalize_identity("x.123456.7l"), "X1234567L")
+        self.assertEqual(normalize_identity("y-123456-l"), "Y0123456L")
+        self.assertEqual(normalize_identity(None), "")
+
+    def test_nie_control_letter(self):
+        """Test that NIE prefixes count as the leading digit of the number."""
+        self.assertEqual(control_letter("X1234567"), DNI_LETTERS[1234567 % 23])
+        self.assertEqual(control_letter("Y1234567"), DNI_LETTERS[11234567 % 23])
+        self.assertEqual(control_letter("Z1234567"), DNI_LETTERS[21234567 % 23])
+
+    def test_validate_dni_accepts_nie(self):
+        """Test that the form validator accepts NIEs and rejects wrong letters."""
+        self.assertTrue(Validators.validate_dni("X1234567L").is_valid)
+        self.assertFalse(Validators.validate_dni("X1234567A").is_valid)
+        self.assertFalse(Validators.validate_dni("W1234567L").is_valid)
+
+    def test_vectorized_matches_single_value(self):
+        """Test that the bulk path agrees with the single-value helpers."""
+        canonical = normalize_identities(pd.Series(SAMPLES, dtype=object))
+        well_formed, valid = check_identities(canonical.tolist())
+
+        self.assertEqual(canonical.tolist(), [normalize_identity(v) for v in SAMPLES])
+        self.assertEqual(valid.tolist(), [is_valid_identity(v) for v in SAMPLES])
+        self.assertEqual(well_formed.tolist()[:10], [True] * 10)
+        self.assertFalse(well_formed[10:].any())
+
+
+if __name__ == '__main__':
+    unittest.main()
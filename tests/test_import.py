@@ -0,0 +1,69 @@
+"""
+Test suite for the bulk fallero import.
+"""
+
+import io
+import unittest
+from datetime import date
+
+import pytest
+
+from managers.import_manager import FalleroImportManager
+from models import Fallero
+
+CSV_CENSO = (
+    "nombre,apellidos,dni,fecha_nacimiento,fecha_alta\n"
+    "Juan,García López,12345678Z,1990-01-01,2020-03-01\n"
+    "Ana,Pérez,00000001R,15/06/2010,\n"
+    ",Soler,00000002W,2000-01-01,\n"
+    "Pep,Martí,00000003X,no es fecha,\n"
+    "Rosa,Ferrer,12345678Z,1985-05-05,\n"
+    "Luis,Gómez,00000004G,1970-07-07,\n"
+)
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestFalleroImportManager(unittest.TestCase):
+    """Test cases for importing falleros from CSV files."""
+    
+    def setUp(self):
+        self.manager.insert_fallero("Luis", "Gómez", "00000004G", date(1970, 7, 7))
+        self.importer = FalleroImportManager(self.manager, chunk_size=2)
+    
+    def _import(self, dry_run=False):
+        return self.importer.import_file(
+            io.BytesIO(CSV_CENSO.encode("utf-8")), file_name="censo.csv", dry_run=dry_run
+        )
+    
+    def test_import_reports_rejected_rows(self):
+        """Test that invalid, repeated and existing DNIs are reported per row."""
+        report = self._import()
+        
+        self.assertEqual(report.total_rows, 6)
+        self.assertEqual(report.imported, 2)
+        self.assertEqual(sorted(e.row_number for e in report.errors), [4, 5, 6, 7])
+    
+    def test_import_inserts_valid_rows_and_indexes_them(self):
+        """Test that imported falleros are stored and searchable."""
+        self._import()
+        
+        falleros = self.manager.get_filtered_falleros(apellidos="garcia")
+        self.assertEqual([f.dni for f in falleros], ["12345678Z"])
+        self.assertEqual(falleros[0].fecha_alta, date(2020, 3, 1))
+    
+    def test_dry_run_does_not_insert(self):
+        """Test that a dry run validates without writing anything."""
+        report = self._import(dry_run=True)
+        
+        self.assertEqual(report.imported, 2)
+        with self.manager.get_db_session() as session:
+            self.assertEqual(session.query(Fallero).count(), 1)
+    
+    def test_missing_columns_are_rejected(self):
+        """Test that a file without the required columns fails early."""
+        with self.assertRaises(ValueError):
+            self.importer.import_file(io.BytesIO(b"nombre,dni\nJuan,1\n"), file_name="censo.csv")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Test suite for the logging configuration.
+"""
+
+import json
+import logging
+import unittest
+
+from utils.logger import JsonFormatter, get_logger
+
+
+class TestLogger(unittest.TestCase):
+    """Test cases for the queue-based logging setup."""
+
+    def test_loggers_share_one_queue_handler(self):
+        """Test that every named logger uses the same queue handler."""
+        first = get_logger("tests.logger.first")
+        second = get_logger("tests.logger.second")
+
+        self.assertEqual(len(first.handlers), 1)
+        self.assertIs(first.handlers[0], second.handlers[0])
+        self.assertIsInstance(first.handlers[0], logging.handlers.QueueHandler)
+
+    def test_json_formatter(self):
+        """Test that records are written as one JSON object."""
+        record = logging.LogRecord("app", logging.INFO, __file__, 1, "Alta de %s", ("Juan",), None)
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["logger"], "app")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["message"], "Alta de Juan")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Test suite for the per-rerun request profiler.
+"""
+
+import unittest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from config.settings import settings
+from utils.profiler import RequestProfiler, instrument_engine, profile_phase, profiled
+
+
+class TestRequestProfiler(unittest.TestCase):
+    """Test cases for phase timing and SQL statement counting."""
+
+    def setUp(self):
+        self._profile = settings.app.profile
+        settings.app.profile = True
+        self.engine = create_engine("sqlite:///:memory:")
+        instrument_engine(self.engine)
+
+    def tearDown(self):
+        settings.app.profile = self._profile
+        self.engine.dispose()
+
+    def test_phases_and_sql_are_recorded(self):
+        """Test that phases are timed and statements counted during a rerun."""
+        @profiled("view")
+        def view():
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+        with RequestProfiler.for_rerun() as profiler:
+            with profile_phase("setup"):
+                pass
+            view()
+
+        self.assertEqual([name for name, _ in profiler.phases], ["setup", "view"])
+        self.assertEqual(profiler.sql_count, 2)
+        self.assertGreater(profiler.total_seconds, 0)
+        self.assertIsNone(RequestProfiler.current())
+
+    def test_failed_statement_does_not_skew_the_next_one(self):
+        """Test that a statement that raises leaves no start time behind."""
+        with RequestProfiler.for_rerun() as profiler:
+            with self.engine.connect() as connection:
+                with self.assertRaises(OperationalError):
+                    connection.execute(text("SELECT * FROM missing"))
+                self.assertEqual(connection.info["profiler_started"], [])
+                connection.execute(text("SELECT 1"))
+
+        self.assertEqual(profiler.sql_count, 2)
+
+    def test_sql_outside_rerun_is_ignored(self):
+        """Test that statements outside a profiled rerun are not counted."""
+        with RequestProfiler.for_rerun() as profiler:
+            pass
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        self.assertEqual(profiler.sql_count, 0)
+
+    def test_disabled_profiling_yields_none(self):
+        """Test that nothing is collected when profiling is off."""
+        settings.app.profile = False
+        with RequestProfiler.for_rerun() as profiler:
+            with profile_phase("setup"):
+                pass
+
+        self.assertIsNone(profiler)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Test suite for the query result cache.
+"""
+
+import io
+import unittest
+from datetime import date
+from unittest import mock
+
+import pytest
+
+from dao.fallero_dao import FalleroDAO
+from dao.query_cache import QueryCache, get_query_cache
+from dao.read_models import FalleroReadModel
+from managers.import_manager import FalleroImportManager
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test cases for the LRU/TTL behaviour of QueryCache."""
+
+    def test_repeated_query_is_served_from_cache(self):
+        """Test that the loader runs once for equal parameters."""
+        cache = QueryCache(max_entries=4, ttl=60)
+        loader = mock.Mock(return_value=[1])
+
+        cache.get_or_load("q", {"nombre": "García"}, ("T",), loader)
+        result = cache.get_or_load("q", {"nombre": " garcia "}, ("T",), loader)
+
+        self.assertEqual(result, [1])
+        self.assertEqual(loader.call_count, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never holds more than max_entries results."""
+        cache = QueryCache(max_entries=2, ttl=60)
+        loader = mock.Mock(return_value=None)
+
+        for value in ("a", "b", "c", "a"):
+            cache.get_or_load("q", {"nombre": value}, ("T",), loader)
+
+        self.assertEqual(loader.call_count, 4)
+
+    def test_expired_entry_is_reloaded(self):
+        """Test that results older than the TTL are loaded again."""
+        cache = QueryCache(max_entries=4, ttl=0)
+        loader = mock.Mock(return_value=None)
+
+        with mock.patch("dao.query_cache.time.monotonic", side_effect=[0.0, 1.0]):
+            cache.get_or_load("q", {}, ("T",), loader)
+            cache.get_or_load("q", {}, ("T",), loader)
+
+        self.assertEqual(loader.call_count, 2)
+
+    def test_zero_size_disables_cache(self):
+        """Test that a cache without room always runs the query."""
+        cache = QueryCache(max_entries=0, ttl=60)
+        loader = mock.Mock(return_value=None)
+
+        cache.get_or_load("q", {}, ("T",), loader)
+        cache.get_or_load("q", {}, ("T",), loader)
+
+        self.assertEqual(loader.call_count, 2)
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestQueryCacheInvalidation(unittest.TestCase):
+    """Test cases for invalidation of cached pages on writes."""
+
+    def setUp(self):
+        self.manager.insert_fallero("Juan", "García", "12345678Z", date(1990, 1, 1))
+        self.read_model = FalleroReadModel(self.manager)
+
+    def _total(self):
+        return self.read_model.page(with_total=True).total
+
+    def test_repeated_page_hits_cache(self):
+        """Test that an unchanged listing is not queried twice."""
+        cache = get_query_cache()
+        self._total()
+        hits = cache.hits
+
+        self.assertEqual(self._total(), 1)
+        self.assertEqual(cache.hits, hits + 1)
+
+    def test_insert_fallero_invalidates_page(self):
+        """Test that a new alta shows up on the next read."""
+        self._total()
+        self.manager.insert_fallero("Ana", "López", "87654321X", date(1991, 1, 1))
+
+        self.assertEqual(self._total(), 2)
+
+    def test_dao_insert_invalidates_page(self):
+        """Test that ORM writes through the DAO invalidate the listing."""
+        self._total()
+        FalleroDAO(self.manager).crear_fallero("Ana", "López", "87654321X",
+                                               date(1991, 1, 1), date.today())
+
+        self.assertEqual(self._total(), 2)
+
+    def test_bulk_import_invalidates_search(self):
+        """Test that bulk INSERT statements invalidate filtered pages."""
+        self.assertEqual(self.read_model.page(apellidos="lopez", with_total=True).total, 0)
+        csv = b"nombre,apellidos,dni,fecha_nacimiento\nAna,L\xc3\xb3pez,87654321X,1991-01-01\n"
+        FalleroImportManager(self.manager).import_file(io.BytesIO(csv), file_name="censo.csv")
+
+        self.assertEqual(self.read_model.page(apellidos="lopez", with_total=True).total, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
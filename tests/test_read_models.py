@@ -0,0 +1,76 @@
+"""
+Test suite for the list view read models.
+"""
+
+import unittest
+from datetime import date
+
+import pytest
+
+from dao.read_models import FalleroReadModel, UsuarioReadModel, filter_falleros_frame
+from dao.usuario_dao import UsuarioDAO
+from models import Usuario
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestReadModels(unittest.TestCase):
+    """Test cases for the column-projected list queries."""
+
+    def setUp(self):
+        self.manager.insert_fallero("Juan", "García", "12345678Z", date(1990, 1, 1))
+        with self.manager.get_db_session() as session:
+            session.add(Usuario(nombre="Admin", email="admin@falla.com", hashed_password="secret"))
+            session.commit()
+
+    def test_fallero_frame_has_schema(self):
+        """Test that the falleros frame has the listing columns and dtypes."""
+        page = FalleroReadModel(self.manager).page(with_total=True)
+        frame = FalleroReadModel.to_frame(page.items)
+
+        self.assertEqual(page.total, 1)
+        self.assertEqual(list(frame.columns)[:3], ["id", "nombre", "apellidos"])
+        self.assertEqual(frame.loc[0, "dni"], "12345678Z")
+        self.assertEqual(str(frame["activo"].dtype), "boolean")
+
+    def test_empty_frame_keeps_columns(self):
+        """Test that an empty result still yields the full schema."""
+        frame = FalleroReadModel.to_frame([])
+
+        self.assertTrue(frame.empty)
+        self.assertIn("fecha_alta", frame.columns)
+
+    def test_scope_filters_like_the_search_index(self):
+        """Test that client-side filtering matches the database search."""
+        self.manager.insert_fallero("María", "López Gil", "87654321X", date(1985, 5, 5))
+        self.manager.insert_fallero("Mario", "Gilabert", "11111111H", date(1980, 3, 3))
+        scope = FalleroReadModel(self.manager).scope(None, max_rows=10)
+
+        for nombre, apellidos in (("mar", None), (None, "gil"), ("MARIA", "lopez"), ("ia", None)):
+            expected = self.manager.get_falleros_page(nombre, apellidos).items
+            filtered = filter_falleros_frame(scope, nombre, apellidos)
+            self.assertEqual(list(filtered["id"]), [f.id for f in expected])
+
+    def test_scope_too_large_returns_none(self):
+        """Test that scopes above the limit fall back to database pagination."""
+        self.manager.insert_fallero("María", "López", "87654321X", date(1985, 5, 5))
+
+        self.assertIsNone(FalleroReadModel(self.manager).scope(None, max_rows=1))
+        self.assertEqual(len(FalleroReadModel(self.manager).scope("Activos", max_rows=2)), 2)
+
+    def test_scope_page_hides_search_columns(self):
+        """Test that displayed pages only have the listing columns."""
+        scope = FalleroReadModel(self.manager).scope(None, max_rows=10)
+        page = FalleroReadModel.scope_page(scope, 0, 25)
+
+        self.assertEqual(list(page.columns), list(FalleroReadModel.to_frame([]).columns))
+
+    def test_usuario_frame_excludes_password(self):
+        """Test that the users list never exposes the password hash."""
+        frame = UsuarioReadModel.to_frame(UsuarioDAO(self.manager).buscar_usuarios().items)
+
+        self.assertEqual(list(frame["email"]), ["admin@falla.com"])
+        self.assertNotIn("hashed_password", frame.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Test suite for the read/write splitting between primary and replica.
+
+Two SQLite files stand in for the primary and the replica. Nothing
+replicates between them, so each read shows which database served it.
+"""
+
+import unittest
+from datetime import date
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, func, select, update
+
+from dao.database import DatabaseManager
+from dao.query_cache import TableVersions
+from dao.usuario_dao import UsuarioDAO
+from models import Base, Fallero, Usuario
+
+
+@pytest.mark.usefixtures("db_config_factory")
+class TestRoutingSession(unittest.TestCase):
+    """Test cases for statement routing."""
+
+    def setUp(self):
+        # Forget the commits of earlier tests, which share the process-wide write times
+        patcher = mock.patch.dict(TableVersions._written_at, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        primary_url = f"sqlite:///{self.db_dir / 'primary.db'}"
+        replica_url = f"sqlite:///{self.db_dir / 'replica.db'}"
+        config = self.make_db_config(primary_url)
+        config.replica_urls = [replica_url]
+        config.replica_lag_tolerance = 0
+        self.manager = DatabaseManager(config)
+        Base.metadata.create_all(self.manager.engine)
+
+        # The replica holds different rows, as a stale copy would
+        replica = create_engine(replica_url)
+        Base.metadata.create_all(replica)
+        with replica.begin() as connection:
+            connection.execute(Fallero.__table__.insert(), [{
+                "nombre": "Réplica", "apellidos": "Soler", "dni": "00000000T",
+                "fecha_nacimiento": date(1990, 1, 1), "fecha_alta": date(2020, 1, 1),
+            }])
+            connection.execute(Usuario.__table__.insert(), [{
+                "nombre": "Réplica", "email": "replica@falla.com", "hashed_password": "x",
+            }])
+        replica.dispose()
+
+    def nombres(self, session):
+        """Return the names of the falleros as read by a session."""
+        return list(session.scalars(select(Fallero.nombre).order_by(Fallero.id)))
+
+    def test_reads_go_to_replica_and_writes_to_primary(self):
+        """Test that a committed alta is written to the primary only."""
+        fallero = self.manager.insert_fallero("Juan", "García", "12345678Z", date(1990, 1, 1))
+        self.assertEqual(fallero.nombre, "Juan")
+        self.assertEqual(fallero.dni, "12345678Z")
+
+        with self.manager.get_db_session() as session:
+            self.assertEqual(self.nombres(session), ["Réplica"])
+        with self.manager.engine.connect() as connection:
+            self.assertEqual(
+                list(connection.scalars(select(Fallero.nombre))), ["Juan"]
+            )
+
+    def test_transaction_reads_its_own_writes(self):
+        """Test that reads after a write in the same transaction use the primary."""
+        with self.manager.get_db_session() as session:
+            session.add(Fallero(nombre="Juan", apellidos="García", dni="12345678Z",
+                                fecha_nacimiento=date(1990, 1, 1), fecha_alta=date(2020, 1, 1)))
+            session.flush()
+            self.assertEqual(self.nombres(session), ["Juan"])
+            session.commit()
+            # The session keeps reading the primary after committing
+            self.assertEqual(self.nombres(session), ["Juan"])
+            self.assertEqual(session.get(Fallero, 1).nombre, "Juan")
+
+        # Other sessions still read from the replica
+        with self.manager.get_db_session() as session:
+            self.assertEqual(self.nombres(session), ["Réplica"])
+
+    def test_rolled_back_writes_return_to_replica(self):
+        """Test that a transaction that wrote nothing durable does not pin the session."""
+        with self.manager.get_db_session() as session:
+            session.execute(update(Fallero).values(activo=False))
+            session.rollback()
+            self.assertEqual(self.nombres(session), ["Réplica"])
+
+    def test_created_user_is_read_back_from_primary(self):
+        """Test that crear_usuario returns the user it stored on the primary."""
+        usuario = UsuarioDAO(self.manager).crear_usuario(
+            "Juan", "juan@falla.com", "Secreta123!"
+        )
+        self.assertEqual(usuario.email, "juan@falla.com")
+        self.assertEqual(usuario.nombre, "Juan")
+
+    def test_set_based_writes_go_to_primary(self):
+        """Test that UPDATE statements never reach the replica."""
+        self.manager.insert_fallero("Juan", "García", "12345678Z", date(1990, 1, 1))
+        with self.manager.get_db_session() as session:
+            session.execute(update(Fallero).values(activo=False))
+            self.assertEqual(session.scalar(select(func.count()).where(Fallero.activo == False)), 1)
+            session.commit()
+
+    def test_recent_commits_are_read_from_primary(self):
+        """Test that written tables are read from the primary within the lag tolerance."""
+        self.manager.SessionLocal.kw["lag_tolerance"] = 60
+        self.manager.insert_fallero("Juan", "García", "12345678Z", date(1990, 1, 1))
+
+        with self.manager.get_db_session() as session:
+            self.assertEqual(self.nombres(session), ["Juan"])
+            # Tables not written recently still come from the replica
+            self.assertEqual(session.scalar(select(func.count(Usuario.id))), 1)
+
+        with mock.patch("dao.query_cache.time.monotonic", return_value=float("inf")):
+            with self.manager.get_db_session() as session:
+                self.assertEqual(self.nombres(session), ["Réplica"])
+
+    def test_without_replicas_everything_uses_primary(self):
+        """Test that the single-database setup is unchanged."""
+        manager = DatabaseManager(self.make_db_config())
+        Base.metadata.create_all(manager.engine)
+        with manager.get_db_session() as session:
+            self.assertIsNone(session.replica)
+            self.assertIs(session.get_bind(clause=select(Fallero.id)), manager.engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Test suite for the schema migrations.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+
+from dao.schema import (
+    BASELINE_REVISION, bootstrap_schema, current_revision, head_revision, upgrade_schema
+)
+from models import metadata
+
+
+class TestSchemaMigrations(unittest.TestCase):
+    """Test cases for upgrading and checking the schema revision."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.engine = create_engine(f"sqlite:///{self.path}")
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def _create_pre_migration_schema(self):
+        """Create the tables create_all built before migrations existed, with one fallero."""
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE Fallero (id INTEGER PRIMARY KEY, nombre VARCHAR(100) NOT NULL, "
+                "apellidos VARCHAR(255) NOT NULL, dni VARCHAR(20) NOT NULL UNIQUE, "
+                "fecha_nacimiento DATE NOT NULL, fecha_alta DATE NOT NULL, activo BOOLEAN)"
+            )
+            connection.exec_driver_sql(
+                "CREATE TABLE Usuario (id INTEGER PRIMARY KEY, nombre VARCHAR(255) NOT NULL, "
+                "email VARCHAR(255) NOT NULL UNIQUE, hashed_password VARCHAR(255) NOT NULL, "
+                "activo BOOLEAN)"
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO Fallero (nombre, apellidos, dni, fecha_nacimiento, fecha_alta) "
+                "VALUES ('Ana', 'López', 'x-123456-7l', '1990-01-01', '2020-01-01')"
+            )
+
+    def test_upgrade_creates_schema_at_head(self):
+        """Test that an empty database is migrated to the latest revision."""
+        self.assertIsNone(current_revision(self.engine))
+
+        upgrade_schema(self.engine)
+
+        self.assertEqual(current_revision(self.engine), head_revision())
+        indexes = {i["name"] for i in inspect(self.engine).get_indexes("Fallero")}
+        self.assertIn("ix_fallero_activo_apellidos_nombre", indexes)
+
+    def test_migrations_match_models(self):
+        """Test that the migrated schema has every table and index of the models."""
+        upgrade_schema(self.engine)
+
+        with self.engine.connect() as connection:
+            diff = compare_metadata(MigrationContext.configure(connection), metadata)
+
+        self.assertEqual(diff, [])
+
+    def test_unversioned_schema_is_stamped_and_upgraded(self):
+        """Test that tables created before migrations only receive later revisions."""
+        self._create_pre_migration_schema()
+
+        upgrade_schema(self.engine)
+
+        self.assertNotEqual(head_revision(), BASELINE_REVISION)
+        self.assertEqual(current_revision(self.engine), head_revision())
+        indexes = {i["name"] for i in inspect(self.engine).get_indexes("Usuario")}
+        self.assertIn("ix_usuario_activo_nombre", indexes)
+        with self.engine.connect() as connection:
+            dni = connection.exec_driver_sql("SELECT dni FROM Fallero").scalar()
+        self.assertEqual(dni, "X1234567L")
+
+    def test_unversioned_schema_built_from_models_is_stamped_at_head(self):
+        """Test that a create_all schema with the current models is not migrated again."""
+        metadata.create_all(self.engine)
+
+        upgrade_schema(self.engine)
+
+        self.assertEqual(current_revision(self.engine), head_revision())
+
+    def test_list_indexes_skip_existing_ones(self):
+        """Test that the listing indexes migration tolerates indexes create_all already built."""
+        self._create_pre_migration_schema()
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE INDEX ix_fallero_apellidos_nombre ON Fallero (apellidos, nombre)"
+            )
+
+        upgrade_schema(self.engine)
+
+        self.assertEqual(current_revision(self.engine), head_revision())
+
+    def test_unversioned_schema_gets_search_index(self):
+        """Test that bootstrapping a pre-migration database builds its name search index."""
+        self._create_pre_migration_schema()
+
+        revision = bootstrap_schema(self.engine, init_db=True)
+
+        self.assertEqual(revision, head_revision())
+        with self.engine.connect() as connection:
+            tokens = connection.exec_driver_sql(
+                "SELECT token FROM FalleroSearchToken ORDER BY campo, token"
+            ).scalars().all()
+        self.assertEqual(tokens, ["lopez", "ana"])
+
+    def test_bootstrap_runs_once_per_engine(self):
+        """Test that later bootstraps reuse the first result without DDL."""
+        with mock.patch("dao.schema.upgrade_schema", wraps=upgrade_schema) as upgrade:
+            first = bootstrap_schema(self.engine, init_db=True)
+            second = bootstrap_schema(self.engine, init_db=True)
+
+        self.assertEqual(upgrade.call_count, 1)
+        self.assertEqual(first, head_revision())
+        self.assertEqual(second, first)
+
+    def test_bootstrap_without_init_db_only_reads_revision(self):
+        """Test that INIT_DB=false never migrates the schema."""
+        with mock.patch("dao.schema.upgrade_schema") as upgrade:
+            revision = bootstrap_schema(self.engine, init_db=False)
+
+        upgrade.assert_not_called()
+        self.assertIsNone(revision)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Test suite for the fallero name search.
+"""
+
+import unittest
+from datetime import date
+
+import pytest
+
+from dao.search import FalleroSearchIndex
+from models import Fallero
+from models.fallero_search import FalleroSearchToken
+from utils.text import normalize_text, tokenize
+
+
+class TestTextNormalization(unittest.TestCase):
+    """Test cases for search text normalization."""
+
+    def test_normalize_removes_accents_and_case(self):
+        """Test that accents, case and extra spaces are removed."""
+        self.assertEqual(normalize_text("  García   LÓPEZ "), "garcia lopez")
+        self.assertEqual(normalize_text("Güell"), "guell")
+
+    def test_normalize_keeps_enye(self):
+        """Test that ñ is kept as a distinct letter."""
+        self.assertEqual(normalize_text("MUÑOZ"), "muñoz")
+
+    def test_tokenize_splits_on_punctuation(self):
+        """Test that hyphens and apostrophes separate tokens."""
+        self.assertEqual(tokenize("Pérez-Llorente d'Ors"), ["perez", "llorente", "d", "ors"])
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestFalleroSearchIndex(unittest.TestCase):
+    """Test cases for the indexed name search on SQLite."""
+
+    def setUp(self):
+        for i, (nombre, apellidos) in enumerate([
+            ("José", "García López"),
+            ("Maria", "López Pérez"),
+            ("Vicent", "Garcés Muñoz"),
+        ]):
+            self.manager.insert_fallero(nombre, apellidos, f"{i:08d}A", date(1990, 1, 1))
+
+    def _search(self, **filters):
+        return sorted(f.nombre for f in self.manager.get_filtered_falleros(**filters))
+
+    def test_accent_insensitive_match(self):
+        """Test that unaccented input matches accented names."""
+        self.assertEqual(self._search(apellidos="Garcia"), ["José"])
+        self.assertEqual(self._search(nombre="jose"), ["José"])
+
+    def test_prefix_and_token_order(self):
+        """Test that every word must prefix some token, in any order."""
+        self.assertEqual(self._search(apellidos="gar"), ["José", "Vicent"])
+        self.assertEqual(self._search(apellidos="lop garc"), ["José"])
+
+    def test_search_is_scoped_to_field(self):
+        """Test that a surname filter does not match first names."""
+        self.assertEqual(self._search(apellidos="maria"), [])
+
+    def test_update_reindexes_tokens(self):
+        """Test that renaming a fallero updates its search tokens."""
+        with self.manager.get_db_session() as session:
+            fallero = session.query(Fallero).filter_by(nombre="Vicent").one()
+            fallero.apellidos = "Soler"
+            session.commit()
+
+        self.assertEqual(self._search(apellidos="soler"), ["Vicent"])
+        self.assertEqual(self._search(apellidos="garces"), [])
+
+    def test_rebuild_restores_index(self):
+        """Test that a rebuild repopulates an emptied index."""
+        with self.manager.get_db_session() as session:
+            session.query(FalleroSearchToken).delete()
+            self.assertEqual(FalleroSearchIndex.rebuild(session), 3)
+            session.commit()
+
+        self.assertEqual(self._search(apellidos="perez"), ["Maria"])
+
+
+if __name__ == '__main__':
+    unittest.main()
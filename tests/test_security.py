@@ -0,0 +1,139 @@
+"""
+Test suite for the password hashing pool, the login rate limiter and the credentials check.
+"""
+
+import unittest
+from unittest import mock
+
+import streamlit_authenticator as stauth
+
+from managers.auth_manager import _make_credentials_checker
+from utils.password_hasher import PasswordHasher
+from utils.rate_limiter import TokenBucketLimiter
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic rate limiter tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketLimiter(unittest.TestCase):
+    """Test cases for the keyed token-bucket limiter."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = TokenBucketLimiter(capacity=2, refill_rate=1.0, clock=self.clock)
+
+    def test_burst_then_refill(self):
+        """Test that a bucket allows a burst and then refills over time."""
+        self.assertTrue(self.limiter.allow("email:a"))
+        self.assertTrue(self.limiter.allow("email:a"))
+        self.assertFalse(self.limiter.allow("email:a"))
+        self.assertAlmostEqual(self.limiter.retry_after(["email:a"]), 1.0)
+
+        self.clock.now += 1.0
+        self.assertTrue(self.limiter.allow("email:a"))
+
+    def test_all_keys_must_have_tokens(self):
+        """Test that an empty IP bucket blocks attempts for any email."""
+        self.assertTrue(self.limiter.allow("email:a", "ip:1"))
+        self.assertTrue(self.limiter.allow("email:b", "ip:1"))
+        self.assertFalse(self.limiter.allow("email:c", "ip:1"))
+        self.assertTrue(self.limiter.allow("email:c", "ip:2"))
+
+    def test_key_count_is_bounded(self):
+        """Test that the least recently used buckets are evicted."""
+        limiter = TokenBucketLimiter(capacity=1, refill_rate=0.0, max_keys=2, clock=self.clock)
+        for key in ("a", "b", "c"):
+            limiter.allow(key)
+
+        self.assertEqual(list(limiter._buckets), ["b", "c"])
+
+
+class TestPasswordHasher(unittest.TestCase):
+    """Test cases for the bounded bcrypt pool."""
+
+    def setUp(self):
+        self.hasher = PasswordHasher(rounds=4, workers=2, max_pending=4, queue_timeout=1.0)
+
+    def tearDown(self):
+        self.hasher.shutdown()
+
+    def test_hash_and_verify(self):
+        """Test that a hash verifies its password with the configured cost."""
+        hashed = self.hasher.hash("secreto")
+
+        self.assertTrue(hashed.startswith("$2b$04$"))
+        self.assertTrue(self.hasher.verify("secreto", hashed))
+        self.assertFalse(self.hasher.verify("otro", hashed))
+
+    def test_metrics_track_operations(self):
+        """Test that latency metrics are recorded and the queue drains."""
+        self.hasher.verify("secreto", self.hasher.hash("secreto"))
+        metrics = self.hasher.metrics()
+
+        self.assertEqual(metrics["operations"], 2)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertGreater(metrics["max_ms"], 0)
+
+
+class TestCredentialsChecker(unittest.TestCase):
+    """Test cases for the replacement of the authenticator's credentials check."""
+
+    def setUp(self):
+        self.hasher = PasswordHasher(rounds=4, workers=1, max_pending=4, queue_timeout=1.0)
+        patcher = mock.patch("managers.auth_manager.get_password_hasher", return_value=self.hasher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = TokenBucketLimiter(capacity=2, refill_rate=1.0, clock=FakeClock())
+        for target, value in (
+            ("managers.auth_manager._login_limiter", self.limiter),
+            ("managers.auth_manager._login_limit_keys",
+             lambda username: (f"email:{username}", "ip:10.0.0.1")),
+        ):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        hashed = self.hasher.hash("secreto")
+        self.model = mock.Mock(credentials={"usernames": {
+            email: {"password": hashed}
+            for email in ("admin@falla.com", "ana@falla.com", "pep@falla.com")
+        }})
+        self.check = _make_credentials_checker(self.model)
+
+    def tearDown(self):
+        self.hasher.shutdown()
+
+    def test_failed_attempts_are_recorded(self):
+        """Test that wrong passwords feed the authenticator's max_login_attempts counter."""
+        self.assertFalse(self.check("admin@falla.com", "otro"))
+        self.model._record_failed_login_attempts.assert_called_once_with("admin@falla.com")
+
+        self.assertTrue(self.check("admin@falla.com", "secreto"))
+        self.assertEqual(self.model._record_failed_login_attempts.call_count, 1)
+
+    def test_shared_ip_only_counts_failed_attempts(self):
+        """Test that successful logins behind one address do not exhaust its bucket."""
+        for email in ("admin@falla.com", "ana@falla.com", "pep@falla.com"):
+            self.assertTrue(self.check(email, "secreto"))
+
+        self.assertFalse(self.check("ana@falla.com", "otro"))
+        self.assertFalse(self.check("pep@falla.com", "otro"))
+        with self.assertRaises(stauth.LoginError):
+            self.check("admin@falla.com", "secreto")
+
+    def test_malformed_hash_is_a_failed_login(self):
+        """Test that a stored hash bcrypt cannot parse fails the login instead of raising."""
+        self.model.credentials["usernames"]["legacy@falla.com"] = {"password": "secreto"}
+
+        self.assertFalse(self.check("legacy@falla.com", "secreto"))
+        self.model._record_failed_login_attempts.assert_called_once_with("legacy@falla.com")
+
+
+if __name__ == '__main__':
+    unittest.main()
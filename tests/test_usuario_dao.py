@@ -0,0 +1,105 @@
+"""
+Test suite for the UsuarioDAO and the credentials cache.
+"""
+
+import unittest
+
+import pytest
+
+from dao.usuario_dao import CredentialsCache, UsuarioDAO
+from models import Usuario
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestCredentialsCache(unittest.TestCase):
+    """Test cases for the cached credentials map."""
+
+    def setUp(self):
+        self.dao = UsuarioDAO(self.manager)
+        CredentialsCache.invalidate()
+
+    def tearDown(self):
+        CredentialsCache.invalidate()
+
+    def test_has_active_users(self):
+        """Test the EXISTS check for active users."""
+        self.assertFalse(self.manager.has_active_users())
+        self.dao.crear_usuario("Admin", "admin@falla.com", "secreto")
+        self.assertTrue(self.manager.has_active_users())
+
+        self.dao.desactivar_usuario("admin@falla.com")
+        self.assertFalse(self.manager.has_active_users())
+
+    def test_cache_is_reused_within_ttl(self):
+        """Test that the map is not reloaded while it is fresh."""
+        first_version, _ = CredentialsCache.get(self.dao, ttl=60)
+        second_version, _ = CredentialsCache.get(self.dao, ttl=60)
+
+        self.assertEqual(first_version, second_version)
+
+    def test_create_and_deactivate_invalidate_cache(self):
+        """Test that user changes are visible on the next access."""
+        version, credentials = CredentialsCache.get(self.dao, ttl=60)
+        self.assertEqual(credentials["usernames"], {})
+
+        self.dao.crear_usuario("Admin", "admin@falla.com", "secreto")
+        new_version, credentials = CredentialsCache.get(self.dao, ttl=60)
+        self.assertGreater(new_version, version)
+        self.assertIn("admin@falla.com", credentials["usernames"])
+
+        self.dao.desactivar_usuario("admin@falla.com")
+        _, credentials = CredentialsCache.get(self.dao, ttl=60)
+        self.assertEqual(credentials["usernames"], {})
+
+
+@pytest.mark.usefixtures("db_manager")
+class TestBuscarUsuarios(unittest.TestCase):
+    """Test cases for the SQL-side users listing."""
+
+    def setUp(self):
+        with self.manager.get_db_session() as session:
+            session.add_all([
+                Usuario(nombre="Josep", email="josep@falla.com", hashed_password="x"),
+                Usuario(nombre="Josefa", email="jose_m@casal.com", hashed_password="x"),
+                Usuario(nombre="Amparo", email="amparo@falla.com", hashed_password="x", activo=False),
+                Usuario(nombre="Jordi", email="jordi@falla.com", hashed_password="x"),
+            ])
+            session.commit()
+        self.dao = UsuarioDAO(self.manager)
+
+    def nombres(self, page):
+        return [row.nombre for row in page.items]
+
+    def test_filters_by_prefix_and_status(self):
+        """Test name and email prefixes and the status filter."""
+        self.assertEqual(self.nombres(self.dao.buscar_usuarios(nombre="jos")), ["Josefa", "Josep"])
+        self.assertEqual(self.nombres(self.dao.buscar_usuarios(email="JO", estado="Activos")),
+                         ["Jordi", "Josefa", "Josep"])
+        self.assertEqual(self.nombres(self.dao.buscar_usuarios(estado="Inactivos")), ["Amparo"])
+        # Prefixes only: "falla" is not the start of any email
+        self.assertEqual(self.dao.buscar_usuarios(email="falla").items, [])
+
+    def test_like_wildcards_are_literal(self):
+        """Test that % and _ typed by the user match themselves."""
+        self.assertEqual(self.nombres(self.dao.buscar_usuarios(email="jose_")), ["Josefa"])
+        self.assertEqual(self.dao.buscar_usuarios(email="%falla").items, [])
+
+    def test_pages_follow_sort_order(self):
+        """Test keyset paging in email order with the total count."""
+        first = self.dao.buscar_usuarios(orden="email", page_size=3, with_total=True)
+        second = self.dao.buscar_usuarios(orden="email", cursor=first.next_cursor, page_size=3)
+
+        self.assertEqual(first.total, 4)
+        self.assertEqual([row.email for row in first.items + second.items], [
+            "amparo@falla.com", "jordi@falla.com", "jose_m@casal.com", "josep@falla.com"
+        ])
+        self.assertIsNone(second.next_cursor)
+
+    def test_unknown_sort_is_rejected(self):
+        """Test that only the supported sort options are accepted."""
+        with self.assertRaises(ValueError):
+            self.dao.buscar_usuarios(orden="hashed_password")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Test suite for the single-record and batch validators.
+"""
+
+import unittest
+from datetime import date
+
+import pandas as pd
+
+from constants.messages import Messages
+from validators import Validators
+from validators.batch import BatchValidator
+
+TODAY = date(2024, 6, 15)
+
+RECORDS = pd.DataFrame({
+    "nombre": ["Juan", " ", "", "Ana"],
+    "apellidos": ["García", "López", "Pérez", ""],
+    "dni": ["12345678z", "12345678A", "1234", ""],
+    "email": ["juan@falla.com", "no-es-email", "ana@falla", " ana@falla.es "],
+    "fecha_nacimiento": [date(1990, 1, 1), date(2030, 1, 1), None, date(1900, 6, 16)],
+})
+
+
+class TestValidators(unittest.TestCase):
+    """Test cases for the single-record validators."""
+
+    def test_dni_control_letter(self):
+        """Test that a well-formed DNI with the wrong letter is rejected."""
+        self.assertTrue(Validators.validate_dni("12345678Z").is_valid)
+        self.assertEqual(Validators.validate_dni("12345678A").errors,
+                         [Messages.VALIDATION_DNI_CONTROL_LETTER])
+
+    def test_email_pattern(self):
+        """Test the email format check."""
+        self.assertTrue(Validators.validate_email(" juan@falla.com ").is_valid)
+        self.assertFalse(Validators.validate_email("juan@falla").is_valid)
+
+
+class TestBatchValidator(unittest.TestCase):
+    """Test cases for the vectorized batch validator."""
+
+    def setUp(self):
+        self.matrix = BatchValidator(today=TODAY).validate(RECORDS)
+
+    def test_matrix_has_one_column_per_field(self):
+        """Test the shape of the error matrix."""
+        self.assertEqual(list(self.matrix.columns), list(BatchValidator.FIELDS))
+        self.assertEqual(list(self.matrix.index), list(RECORDS.index))
+
+    def test_valid_rows(self):
+        """Test that only the fully valid record passes."""
+        self.assertEqual(BatchValidator.valid_rows(self.matrix).tolist(), [True, False, False, False])
+
+    def test_matches_single_record_rules(self):
+        """Test that each cell is the first error the single-record validator reports."""
+        single = {
+            "nombre": lambda v: Validators.validate_name(v, "nombre"),
+            "apellidos": lambda v: Validators.validate_name(v, "apellidos"),
+            "dni": Validators.validate_dni,
+            "email": Validators.validate_email,
+        }
+        for field, validate in single.items():
+            for row, value in RECORDS[field].items():
+                errors = validate(value).errors
+                with self.subTest(field=field, value=value):
+                    self.assertEqual(self.matrix.at[row, field], errors[0] if errors else None)
+
+    def test_birth_dates(self):
+        """Test the required, future and realistic birth date rules."""
+        self.assertEqual(self.matrix["fecha_nacimiento"].tolist(), [
+            None,
+            Messages.VALIDATION_BIRTH_DATE_FUTURE,
+            Messages.VALIDATION_BIRTH_DATE_REQUIRED,
+            Messages.VALIDATION_BIRTH_DATE_UNREALISTIC,
+        ])
+
+    def test_accepts_column_arrays(self):
+        """Test that a mapping of columns is validated like a DataFrame."""
+        matrix = BatchValidator().validate({"dni": ["12345678Z", "00000000T", "X"]})
+
+        self.assertEqual(BatchValidator.row_errors(matrix),
+                         [[], [], [Messages.VALIDATION_DNI_INVALID]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,19 +3,57 @@ Logging configuration for the Secretaria El Cano application.
 
 This module provides centralized logging configuration with appropriate
 formatters and handlers for development and production environments.
+
+Loggers never write to the console or to disk on the calling thread: every
+named logger gets the same QueueHandler, and a single QueueListener thread
+feeds one shared set of handlers (console and rotating log file).
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import (QueueHandler, QueueListener, RotatingFileHandler,
+                              TimedRotatingFileHandler)
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from config.settings import settings
 
 
+class JsonFormatter(logging.Formatter):
+    """Formatter writing each record as one JSON object per line."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as JSON.
+        
+        Args:
+            record: Log record to format.
+            
+        Returns:
+            JSON document with the timestamp, logger, level and message.
+        """
+        entry = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
 class Logger:
     """Centralized logger configuration."""
     
     _loggers = {}
+    _lock = threading.Lock()
+    _queue_handler: Optional[QueueHandler] = None
+    _listener: Optional[QueueListener] = None
     
     @classmethod
     def get_logger(cls, name: str = __name__) -> logging.Logger:
@@ -42,7 +80,7 @@ class Logger:
     @classmethod
     def _configure_logger(cls, logger: logging.Logger) -> None:
         """
-        Configure a logger with appropriate handlers and formatters.
+        Attach the shared queue handler to a logger.
         
         Args:
             logger: Logger instance to configure.
@@ -51,31 +89,90 @@ class Logger:
         level = logging.DEBUG if app_config.debug else logging.INFO
         
         logger.setLevel(level)
+        logger.addHandler(cls._get_queue_handler())
+        
+        # Prevent duplicate logs
+        logger.propagate = False
+    
+    @classmethod
+    def _get_queue_handler(cls) -> QueueHandler:
+        """
+        Get the process-wide queue handler, starting its listener on first use.
+        
+        Returns:
+            QueueHandler shared by every application logger.
+        """
+        with cls._lock:
+            if cls._queue_handler is None:
+                log_queue: queue.Queue = queue.Queue(-1)
+                cls._queue_handler = QueueHandler(log_queue)
+                cls._listener = QueueListener(
+                    log_queue, *cls._build_handlers(), respect_handler_level=True
+                )
+                cls._listener.start()
+                atexit.register(cls.shutdown)
+            return cls._queue_handler
+    
+    @classmethod
+    def _build_handlers(cls) -> List[logging.Handler]:
+        """
+        Build the console and file handlers run by the listener thread.
+        
+        Returns:
+            List of handlers shared by all loggers.
+        """
+        app_config = settings.get_app_config()
+        log_config = settings.get_log_config()
+        level = logging.DEBUG if app_config.debug else logging.INFO
+        
+        # Formatter
+        if log_config.json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
         console_handler.setFormatter(formatter)
+        handlers: List[logging.Handler] = [console_handler]
         
-        logger.addHandler(console_handler)
-        
-        # File handler for production
+        # Rotating file handler for production
         if not app_config.debug:
-            log_dir = Path("logs")
+            log_dir = Path(log_config.log_dir)
             log_dir.mkdir(exist_ok=True)
             
-            file_handler = logging.FileHandler(log_dir / "app.log")
+            if log_config.rotation == "time":
+                file_handler = TimedRotatingFileHandler(
+                    log_dir / "app.log",
+                    when=log_config.when,
+                    backupCount=log_config.backup_count,
+                    encoding="utf-8",
+                )
+            else:
+                file_handler = RotatingFileHandler(
+                    log_dir / "app.log",
+                    maxBytes=log_config.max_bytes,
+                    backupCount=log_config.backup_count,
+                    encoding="utf-8",
+                )
             file_handler.setLevel(logging.INFO)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         
-        # Prevent duplicate logs
-        logger.propagate = False
+        return handlers
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush the queued records and stop the listener thread."""
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                for handler in cls._listener.handlers:
+                    handler.close()
+                cls._listener = None
 
 
 # Convenience function for getting a logger
@@ -89,4 +186,4 @@ def get_logger(name: str = __name__) -> logging.Logger:
     Returns:
         Configured logger instance.
     """
-    return Logger.get_logger(name)
\ No newline at end of file
+    return Logger.get_logger(name)
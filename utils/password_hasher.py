@@ -0,0 +1,168 @@
+"""
+Password hashing utilities for the Secretaria El Cano application.
+
+This module runs bcrypt hashing and verification on a small, bounded
+thread pool. bcrypt releases the GIL, so the pool caps how many cores
+password checks can use at once while the Streamlit script threads of
+other sessions keep running.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
+import bcrypt
+
+from config.settings import settings
+from exceptions import AuthenticationException
+from constants.messages import Messages
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Bounded worker pool for bcrypt hashing and verification.
+    
+    At most `workers` operations run at the same time and at most
+    `max_pending` may be queued or running; callers beyond that wait up to
+    `queue_timeout` seconds and then get an AuthenticationException.
+    """
+    
+    def __init__(self, rounds: int, workers: int, max_pending: int, queue_timeout: float):
+        """
+        Initialize the password hasher.
+        
+        Args:
+            rounds: bcrypt cost factor for new hashes.
+            workers: Number of worker threads.
+            max_pending: Maximum number of operations queued or running.
+            queue_timeout: Seconds to wait for a free slot before giving up.
+        """
+        self.rounds = rounds
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._max_pending = max_pending
+        self._metrics_lock = threading.Lock()
+        self._pending = 0
+        self._operations = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def hash(self, plain_password: str) -> str:
+        """
+        Hash a password with the configured cost factor.
+        
+        Args:
+            plain_password: Plain text password.
+            
+        Returns:
+            bcrypt hash as a string.
+        """
+        return self._run(
+            lambda: bcrypt.hashpw(
+                plain_password.encode('utf-8'), bcrypt.gensalt(rounds=self.rounds)
+            ).decode('utf-8')
+        )
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain password against a bcrypt hash.
+        
+        Args:
+            plain_password: Plain text password to verify.
+            hashed_password: Stored hashed password to compare against.
+            
+        Returns:
+            True if passwords match, False otherwise.
+        """
+        return self._run(
+            lambda: bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+        )
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Return queue and latency metrics of the pool.
+        
+        Returns:
+            Dictionary with the queue depth, operation and rejection counts,
+            and the average and maximum operation latency in milliseconds.
+        """
+        with self._metrics_lock:
+            average = self._total_seconds / self._operations if self._operations else 0.0
+            return {
+                "queue_depth": self._pending,
+                "max_pending": self._max_pending,
+                "operations": self._operations,
+                "rejected": self._rejected,
+                "avg_ms": average * 1000,
+                "max_ms": self._max_seconds * 1000,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once the queued operations finish."""
+        self._executor.shutdown(wait=True)
+
+    def _run(self, operation: Callable[[], T]) -> T:
+        """
+        Run a bcrypt operation on the pool and wait for its result.
+        
+        Args:
+            operation: Function performing the bcrypt call.
+            
+        Returns:
+            The result of the operation.
+            
+        Raises:
+            AuthenticationException: If the pool stays full for queue_timeout seconds.
+        """
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._metrics_lock:
+                self._rejected += 1
+            logger.warning("Password hashing pool is saturated, rejecting request")
+            raise AuthenticationException(Messages.AUTH_BUSY, code="hash_pool_full")
+        
+        with self._metrics_lock:
+            self._pending += 1
+        started = time.perf_counter()
+        try:
+            return self._executor.submit(operation).result()
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._metrics_lock:
+                self._pending -= 1
+                self._operations += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+            self._slots.release()
+            logger.debug(f"bcrypt operation took {elapsed * 1000:.0f} ms")
+
+
+_password_hasher: Optional[PasswordHasher] = None
+_password_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """
+    Get the process-wide password hasher configured from AuthConfig.
+    
+    Returns:
+        Shared PasswordHasher instance.
+    """
+    global _password_hasher
+    with _password_hasher_lock:
+        if _password_hasher is None:
+            auth_config = settings.get_auth_config()
+            _password_hasher = PasswordHasher(
+                rounds=auth_config.bcrypt_rounds,
+                workers=auth_config.hash_workers,
+                max_pending=auth_config.hash_max_pending,
+                queue_timeout=auth_config.hash_queue_timeout,
+            )
+        return _password_hasher
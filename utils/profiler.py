@@ -0,0 +1,181 @@
+"""
+Request profiling for the Secretaria El Cano application.
+
+This module times the phases of each Streamlit rerun and counts the SQL
+statements executed during it. It is switched on by AppConfig.debug or the
+PROFILE environment variable; when it is off, every helper is a no-op.
+"""
+
+import contextvars
+import cProfile
+import functools
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config.settings import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_current_profiler: contextvars.ContextVar[Optional["RequestProfiler"]] = contextvars.ContextVar(
+    "current_profiler", default=None
+)
+
+
+class RequestProfiler:
+    """
+    Timing collected during one Streamlit rerun.
+
+    Attributes:
+        phases: List of (phase name, seconds) in the order they finished.
+        sql_count: Number of SQL statements executed.
+        sql_seconds: Total time spent executing SQL statements.
+        total_seconds: Duration of the whole rerun, set when it finishes.
+        dump_path: Path of the cProfile dump of the rerun, if one was written.
+    """
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self.phases: List[Tuple[str, float]] = []
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.total_seconds = 0.0
+        self.dump_path: Optional[str] = None
+
+    @classmethod
+    @contextmanager
+    def for_rerun(cls) -> Iterator[Optional["RequestProfiler"]]:
+        """
+        Profile the code run inside the block as one rerun.
+
+        Yields:
+            The active profiler, or None when profiling is disabled.
+        """
+        app_config = settings.get_app_config()
+        if not app_config.profiling_enabled:
+            yield None
+            return
+
+        profiler = cls()
+        token = _current_profiler.set(profiler)
+        cprofile = cProfile.Profile() if app_config.profile_dump_dir else None
+        started = time.perf_counter()
+        if cprofile is not None:
+            cprofile.enable()
+        try:
+            yield profiler
+        finally:
+            if cprofile is not None:
+                cprofile.disable()
+                profiler.dump_path = profiler._dump(cprofile, app_config.profile_dump_dir)
+            profiler.total_seconds = time.perf_counter() - started
+            _current_profiler.reset(token)
+            logger.info(profiler.summary())
+
+    @staticmethod
+    def current() -> Optional["RequestProfiler"]:
+        """Return the profiler of the running rerun, if any."""
+        return _current_profiler.get()
+
+    def summary(self) -> str:
+        """
+        Build a one-line summary of the rerun for the log.
+
+        Returns:
+            Text with the total time, SQL totals and the time of each phase.
+        """
+        phases = ", ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases)
+        return (
+            f"Rerun {self.total_seconds * 1000:.1f}ms, "
+            f"{self.sql_count} SQL statements in {self.sql_seconds * 1000:.1f}ms: {phases}"
+        )
+
+    @staticmethod
+    def _dump(cprofile: cProfile.Profile, dump_dir: str) -> str:
+        """Write the cProfile stats of the rerun and return the file path."""
+        directory = Path(dump_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"rerun-{datetime.now():%Y%m%d-%H%M%S-%f}.prof"
+        cprofile.dump_stats(str(path))
+        return str(path)
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """
+    Time a phase of the current rerun.
+
+    Args:
+        name: Name of the phase shown in the profile.
+    """
+    profiler = _current_profiler.get()
+    if profiler is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.phases.append((name, time.perf_counter() - started))
+
+
+def profiled(name: str) -> Callable:
+    """
+    Decorator timing every call of a function as a profile phase.
+
+    Args:
+        name: Name of the phase shown in the profile.
+
+    Returns:
+        Decorator for the function.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Count the SQL statements and their time for the rerun that runs them.
+
+    Args:
+        engine: Engine whose cursor executions are measured.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_profiler.get() is not None:
+            conn.info.setdefault("profiler_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _record_statement(conn)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # A failed statement never reaches after_cursor_execute; its start time
+        # must not be taken for the next statement's
+        if exception_context.connection is not None:
+            _record_statement(exception_context.connection)
+
+
+def _record_statement(conn) -> None:
+    """Add the statement that just finished on a connection to the rerun's SQL totals."""
+    started = conn.info.get("profiler_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    profiler = _current_profiler.get()
+    if profiler is not None:
+        profiler.sql_count += 1
+        profiler.sql_seconds += elapsed
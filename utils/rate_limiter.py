@@ -0,0 +1,86 @@
+"""
+Rate limiting utilities for the Secretaria El Cano application.
+
+This module provides a thread-safe, keyed token-bucket limiter used to
+throttle login attempts per email and per client IP.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Tuple
+
+
+class TokenBucketLimiter:
+    """
+    Keyed token-bucket rate limiter.
+    
+    Each key owns a bucket of `capacity` tokens refilled at `refill_rate`
+    tokens per second. An action is allowed when every key involved has at
+    least one token, and then one token is taken from each of them.
+    The number of tracked keys is bounded; the least recently used buckets
+    are dropped first.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float, max_keys: int = 10000,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the limiter.
+        
+        Args:
+            capacity: Maximum number of tokens (burst size) per key.
+            refill_rate: Tokens added per second to each bucket.
+            max_keys: Maximum number of buckets kept in memory.
+            clock: Monotonic clock in seconds, injectable for tests.
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, *keys: str) -> bool:
+        """
+        Take one token from the bucket of every key, if all of them have one.
+        
+        Args:
+            *keys: Keys charged for the action (for example "email:x", "ip:y").
+            
+        Returns:
+            True if the action is allowed, False if any bucket is empty.
+        """
+        with self._lock:
+            now = self._clock()
+            levels = {key: self._refill(key, now) for key in keys}
+            allowed = all(level >= 1.0 for level in levels.values())
+            for key, level in levels.items():
+                self._store(key, (level - 1.0) if allowed else level, now)
+            return allowed
+
+    def retry_after(self, keys: Iterable[str]) -> float:
+        """
+        Estimate the seconds until an action on the keys will be allowed.
+        
+        Args:
+            keys: Keys of the action.
+            
+        Returns:
+            Seconds to wait, 0 if the action is allowed now.
+        """
+        with self._lock:
+            now = self._clock()
+            missing = max((1.0 - self._refill(key, now) for key in keys), default=0.0)
+            return max(0.0, missing / self.refill_rate) if self.refill_rate else float("inf")
+
+    def _refill(self, key: str, now: float) -> float:
+        """Return the current token level of a bucket after refilling it."""
+        level, updated_at = self._buckets.get(key, (self.capacity, now))
+        return min(self.capacity, level + (now - updated_at) * self.refill_rate)
+
+    def _store(self, key: str, level: float, now: float) -> None:
+        """Save a bucket level and evict the least recently used buckets."""
+        self._buckets[key] = (level, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
@@ -0,0 +1,87 @@
+"""
+Text normalization utilities for the Secretaria El Cano application.
+
+This module provides accent- and case-insensitive normalization used to
+index and search person names.
+"""
+
+import re
+import unicodedata
+from typing import List, Optional
+
+_TOKEN_SPLIT = re.compile(r"[^0-9a-zñ]+")
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """
+    Normalize text for accent- and case-insensitive comparison.
+    
+    Accents and diaeresis are removed ("García" -> "garcia") but the letter ñ
+    is kept, since it is a distinct letter in Spanish names.
+    
+    Args:
+        value: Text to normalize.
+        
+    Returns:
+        Lowercase text without diacritics and with collapsed whitespace.
+    """
+    if not value:
+        return ""
+    
+    text = value.casefold().replace("ñ", "\0")
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(text.replace("\0", "ñ").split())
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """
+    Split text into normalized search tokens.
+    
+    Args:
+        value: Text to tokenize.
+        
+    Returns:
+        Normalized tokens in their original order, without empty tokens.
+    """
+    return [token for token in _TOKEN_SPLIT.split(normalize_text(value)) if token]
+
+
+_PHONETIC_RULES = [
+    (re.compile(r"ñ"), "ny"),
+    (re.compile(r"ch"), "x"),
+    (re.compile(r"ll"), "y"),
+    (re.compile(r"qu"), "k"),
+    # Hard "gu" before e/i is kept apart from the soft g, which sounds like j
+    (re.compile(r"gu(?=[ei])"), "G"),
+    (re.compile(r"c(?=[ei])"), "s"),
+    (re.compile(r"g(?=[ei])"), "j"),
+    (re.compile(r"G"), "g"),
+    (re.compile(r"[ckq]"), "k"),
+    (re.compile(r"z"), "s"),
+    (re.compile(r"[vw]"), "b"),
+    (re.compile(r"h"), ""),
+    (re.compile(r"(.)\1+"), r"\1"),
+]
+
+
+def phonetic_key(value: Optional[str]) -> str:
+    """
+    Build a phonetic code of a Spanish or Valencian word.
+    
+    Letters that sound alike are merged (b/v, c/k/q, s/z, g/j before e/i,
+    gu/g before e/i, ll/y, silent h) and vowels after the first letter are dropped, so
+    "Giménez" and "Jimenes" get the same code.
+    
+    Args:
+        value: Word to encode.
+        
+    Returns:
+        Phonetic code, or an empty string if the word has no letters.
+    """
+    text = "".join(tokenize(value))
+    for pattern, replacement in _PHONETIC_RULES:
+        text = pattern.sub(replacement, text)
+    if not text:
+        return ""
+    return text[0] + re.sub(r"[aeiouy]", "", text[1:])
@@ -9,6 +9,11 @@ import re
 from typing import List, Optional
 from datetime import datetime, date
 from constants.messages import Messages
+from validators.identity import control_letter, is_well_formed, normalize_identity
+
+# Rules shared by the single-record validators and validators.batch
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+MAX_AGE = 120
 
 
 class ValidationResult:
@@ -30,34 +35,28 @@ class Validators:
     @staticmethod
     def validate_dni(dni: str) -> ValidationResult:
         """
-        Validate Spanish DNI format.
+        Validate a Spanish DNI or NIE.
+        
+        The identifier is normalized first (see validators.identity), so
+        separators, lowercase letters and a missing leading zero are accepted.
         
         Args:
-            dni: DNI string to validate.
+            dni: DNI or NIE string to validate.
             
         Returns:
             ValidationResult with validation status and errors.
         """
         result = ValidationResult()
         
-        if not dni or not dni.strip():
-            result.add_error(Messages.VALIDATION_DNI_INVALID)
-            return result
-        
-        dni = dni.strip().upper()
+        identity = normalize_identity(dni)
         
-        # Check format: 8 digits + 1 letter
-        if len(dni) != 9 or not dni[:8].isdigit() or not dni[8].isalpha():
+        # Check format: 8 digits or X/Y/Z + 7 digits, then 1 letter
+        if not is_well_formed(identity):
             result.add_error(Messages.VALIDATION_DNI_INVALID)
             return result
         
-        # Validate check letter
-        letters = "TRWAGMYFPDXBNJZSQVHLCKE"
-        number = int(dni[:8])
-        expected_letter = letters[number % 23]
-        
-        if dni[8] != expected_letter:
-            result.add_error("El DNI no tiene la letra de control correcta.")
+        if identity[8] != control_letter(identity):
+            result.add_error(Messages.VALIDATION_DNI_CONTROL_LETTER)
         
         return result
     
@@ -78,8 +77,7 @@ class Validators:
             result.add_error(Messages.VALIDATION_EMAIL_INVALID)
             return result
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email.strip()):
+        if not EMAIL_PATTERN.fullmatch(email.strip()):
             result.add_error(Messages.VALIDATION_EMAIL_INVALID)
         
         return result
@@ -145,20 +143,20 @@ class Validators:
         result = ValidationResult()
         
         if not birth_date:
-            result.add_error("La fecha de nacimiento es obligatoria.")
+            result.add_error(Messages.VALIDATION_BIRTH_DATE_REQUIRED)
             return result
         
         today = date.today()
         if birth_date > today:
-            result.add_error("La fecha de nacimiento no puede ser futura.")
+            result.add_error(Messages.VALIDATION_BIRTH_DATE_FUTURE)
         
         # Check minimum age (e.g., 0 years)
         age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
         if age < 0:
-            result.add_error("La fecha de nacimiento no es válida.")
+            result.add_error(Messages.VALIDATION_BIRTH_DATE_INVALID)
         
-        # Check maximum age (e.g., 120 years)
-        if age > 120:
-            result.add_error("La fecha de nacimiento no es realista.")
+        # Check maximum age
+        if age > MAX_AGE:
+            result.add_error(Messages.VALIDATION_BIRTH_DATE_UNREALISTIC)
         
         return result
\ No newline at end of file
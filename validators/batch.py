@@ -0,0 +1,145 @@
+"""
+Batch validation for the Secretaria El Cano application.
+
+This module validates many fallero records at once with vectorized pandas
+string and date operations, for bulk imports and data-quality audits of the
+whole census. It applies the same rules and messages as the single-record
+validators in this package.
+"""
+
+from datetime import date
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from constants.messages import Messages
+from validators import EMAIL_PATTERN, MAX_AGE
+from validators.identity import check_identities, normalize_identities
+
+Records = Union[pd.DataFrame, Mapping[str, Sequence]]
+
+
+class BatchValidator:
+    """
+    Vectorized validator of fallero records.
+
+    The result of validate() is an error matrix: one row per record, one
+    column per validated field, holding the first error message of the field
+    (the one Validators would report first) or None when the value is valid.
+    """
+
+    # Validated fields, in the order their errors are reported
+    FIELDS = ("nombre", "apellidos", "dni", "email", "fecha_nacimiento")
+
+    def __init__(self, today: Optional[date] = None):
+        """
+        Initialize the validator.
+
+        Args:
+            today: Reference date for birth date checks, defaults to the current date.
+        """
+        self.today = today
+
+    def validate(self, records: Records) -> pd.DataFrame:
+        """
+        Validate every record.
+
+        Args:
+            records: DataFrame or mapping of column name to values. Only the
+                columns in FIELDS are checked; missing columns are skipped.
+
+        Returns:
+            Error matrix indexed like the records.
+        """
+        frame = records if isinstance(records, pd.DataFrame) else pd.DataFrame(records)
+        matrix = pd.DataFrame(index=frame.index)
+        for field in self.FIELDS:
+            if field not in frame.columns:
+                continue
+            if field in ("nombre", "apellidos"):
+                matrix[field] = self.check_names(frame[field], field)
+            elif field == "dni":
+                matrix[field] = self.check_dnis(frame[field])
+            elif field == "email":
+                matrix[field] = self.check_emails(frame[field])
+            else:
+                matrix[field] = self.check_birth_dates(frame[field], self.today)
+        return matrix
+
+    @staticmethod
+    def valid_rows(matrix: pd.DataFrame) -> pd.Series:
+        """Return a boolean mask of the records without errors."""
+        return matrix.isna().all(axis=1)
+
+    @staticmethod
+    def row_errors(matrix: pd.DataFrame) -> List[List[str]]:
+        """
+        Collect the error messages of each record.
+
+        Args:
+            matrix: Error matrix returned by validate().
+
+        Returns:
+            One list of messages per record, in field order.
+        """
+        return [[error for error in row if isinstance(error, str)]
+                for row in matrix.itertuples(index=False)]
+
+    @staticmethod
+    def check_names(values: pd.Series, field: str) -> pd.Series:
+        """Check that every name is present."""
+        message = (Messages.VALIDATION_NAME_REQUIRED if field == "nombre"
+                   else Messages.VALIDATION_SURNAME_REQUIRED if field == "apellidos"
+                   else f"El campo {field} es obligatorio.")
+        return _first_error(values.index, [(_clean(values) == "", message)])
+
+    @staticmethod
+    def check_dnis(values: pd.Series) -> pd.Series:
+        """Check the format and control letter of every DNI or NIE."""
+        well_formed, valid = check_identities(normalize_identities(values).tolist())
+        return _first_error(values.index, [
+            (~well_formed, Messages.VALIDATION_DNI_INVALID),
+            (well_formed & ~valid, Messages.VALIDATION_DNI_CONTROL_LETTER),
+        ])
+
+    @staticmethod
+    def check_emails(values: pd.Series) -> pd.Series:
+        """Check the format of every email."""
+        valid = _clean(values).str.fullmatch(EMAIL_PATTERN.pattern).fillna(False).astype(bool)
+        return _first_error(values.index, [(~valid, Messages.VALIDATION_EMAIL_INVALID)])
+
+    @staticmethod
+    def check_birth_dates(values: pd.Series, today: Optional[date] = None) -> pd.Series:
+        """Check that every birth date is present, not in the future and realistic."""
+        today = pd.Timestamp(today or date.today())
+        dates = pd.to_datetime(values, errors="coerce")
+        birthday_pending = (dates.dt.month * 100 + dates.dt.day) > (today.month * 100 + today.day)
+        age = today.year - dates.dt.year - birthday_pending.astype(int)
+        return _first_error(values.index, [
+            (dates.isna(), Messages.VALIDATION_BIRTH_DATE_REQUIRED),
+            (dates > today, Messages.VALIDATION_BIRTH_DATE_FUTURE),
+            (age > MAX_AGE, Messages.VALIDATION_BIRTH_DATE_UNREALISTIC),
+        ])
+
+
+def _clean(values: pd.Series) -> pd.Series:
+    """Return the values as stripped strings, with missing values as ''."""
+    return values.fillna("").astype(str).str.strip()
+
+
+def _first_error(index: pd.Index, checks: List[Tuple[Sequence[bool], str]]) -> pd.Series:
+    """
+    Build the error column of a field.
+
+    Args:
+        index: Index of the records.
+        checks: (failed mask, message) pairs, in the order they are reported.
+
+    Returns:
+        Series with the message of the first failed check of each record, or None.
+    """
+    errors = np.full(len(index), None, dtype=object)
+    for failed, message in reversed(checks):
+        errors[np.asarray(failed, dtype=bool)] = message
+    return pd.Series(errors, index=index, dtype=object)
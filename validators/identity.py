@@ -0,0 +1,141 @@
+"""
+Spanish identity document validation for the Secretaria El Cano application.
+
+This module validates and normalizes DNIs (8 digits and a control letter)
+and NIEs (X, Y or Z, 7 digits and a control letter). Identifiers are stored
+in their canonical form: uppercase, without separators, and with the
+leading zero that is often left out when writing them.
+
+Besides the single-value helpers, check_identities validates whole arrays
+with NumPy byte arithmetic for bulk audits of the census.
+"""
+
+import re
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DNI_LETTERS = "TRWAGMYFPDXBNJZSQVHLCKE"
+NIE_PREFIXES = "XYZ"
+# Canonical form of a DNI or NIE
+IDENTITY_PATTERN = re.compile(r"(?:[0-9]{8}|[XYZ][0-9]{7})[A-Z]")
+IDENTITY_LENGTH = 9
+
+_SEPARATORS = re.compile(r"[\s.\-]")
+# An NIE prefix stands for a leading digit of the number: X=0, Y=1, Z=2
+_NIE_TO_DIGIT = str.maketrans({prefix: str(digit) for digit, prefix in enumerate(NIE_PREFIXES)})
+_SHORT_DNI = re.compile(r"([0-9]{7})([A-Z])")
+_SHORT_NIE = re.compile(r"([XYZ])([0-9]{6})([A-Z])")
+
+# Lookup tables for the vectorized check, indexed by byte value / remainder
+_DIGIT_VALUE = np.full(256, -1, dtype=np.int64)
+_DIGIT_VALUE[ord("0"):ord("9") + 1] = np.arange(10)
+_PREFIX_VALUE = _DIGIT_VALUE.copy()
+for _digit, _prefix in enumerate(NIE_PREFIXES):
+    _PREFIX_VALUE[ord(_prefix)] = _digit
+_LETTER_CODES = np.frombuffer(DNI_LETTERS.encode("ascii"), dtype=np.uint8)
+_PLACE_VALUES = 10 ** np.arange(7, -1, -1, dtype=np.int64)
+
+
+def normalize_identity(value: str) -> str:
+    """
+    Convert a DNI or NIE to its canonical form.
+
+    Spaces, dots and hyphens are removed, letters are uppercased and a
+    missing leading zero is restored ("1234567-l" becomes "01234567L").
+    The result is not validated.
+
+    Args:
+        value: Identifier as written by the user.
+
+    Returns:
+        Canonical identifier.
+    """
+    text = _SEPARATORS.sub("", str(value or "")).upper()
+    if _SHORT_DNI.fullmatch(text):
+        return "0" + text
+    if _SHORT_NIE.fullmatch(text):
+        return text[0] + "0" + text[1:]
+    return text
+
+
+def normalize_identities(values: pd.Series) -> pd.Series:
+    """
+    Convert many identifiers to their canonical form with pandas string operations.
+
+    Args:
+        values: Identifiers as written by the users; missing values become ''.
+
+    Returns:
+        Canonical identifiers, as normalize_identity would return them.
+    """
+    text = values.fillna("").astype(str).str.replace(_SEPARATORS.pattern, "", regex=True).str.upper()
+    text = text.str.replace(f"^{_SHORT_DNI.pattern}$", r"0\1\2", regex=True)
+    return text.str.replace(f"^{_SHORT_NIE.pattern}$", r"\g<1>0\2\3", regex=True)
+
+
+def control_letter(identity: str) -> str:
+    """
+    Compute the control letter of a canonical DNI or NIE.
+
+    Args:
+        identity: Canonical identifier; only its first 8 characters are used.
+
+    Returns:
+        The expected control letter.
+    """
+    return DNI_LETTERS[int(identity[:8].translate(_NIE_TO_DIGIT)) % 23]
+
+
+def is_well_formed(identity: str) -> bool:
+    """Return whether a canonical identifier has the DNI or NIE format."""
+    return IDENTITY_PATTERN.fullmatch(identity) is not None
+
+
+def is_valid_identity(value: str) -> bool:
+    """
+    Check the format and control letter of a DNI or NIE.
+
+    Args:
+        value: Identifier, canonical or as written by the user.
+
+    Returns:
+        True if the identifier is valid.
+    """
+    identity = normalize_identity(value)
+    return is_well_formed(identity) and identity[8] == control_letter(identity)
+
+
+def check_identities(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate many canonical identifiers at once.
+
+    The identifiers are packed into a fixed-width byte matrix; digits and
+    NIE prefixes are mapped to their values with lookup tables and the
+    control letter is computed for every row in a single pass.
+
+    Args:
+        values: Canonical identifiers (see normalize_identity).
+
+    Returns:
+        Tuple of boolean arrays (well formed, correct control letter).
+    """
+    encoded = np.array(
+        [v.encode("ascii", "replace") if isinstance(v, str) else b"" for v in values],
+        dtype=f"S{IDENTITY_LENGTH + 1}",
+    )
+    matrix = encoded.view(np.uint8).reshape(len(encoded), IDENTITY_LENGTH + 1)
+
+    first = _PREFIX_VALUE[matrix[:, 0]]
+    rest = _DIGIT_VALUE[matrix[:, 1:8]]
+    letters = matrix[:, 8]
+    well_formed = (
+        (first >= 0) & (rest >= 0).all(axis=1)
+        & (letters >= ord("A")) & (letters <= ord("Z"))
+        & (matrix[:, IDENTITY_LENGTH] == 0)
+    )
+
+    digits = np.concatenate([first[:, None], rest], axis=1).clip(min=0)
+    expected = _LETTER_CODES[(digits @ _PLACE_VALUES) % 23]
+    return well_formed, well_formed & (letters == expected)